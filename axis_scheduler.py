@@ -0,0 +1,145 @@
+"""Table-driven command scheduling for camera axes.
+
+Every axis (pan/tilt, zoom, focus, and any added later such as iris) follows
+the same rules: send a command when the requested direction changes, resend
+while active when the speed changes, and after a release repeat the stop a
+bounded number of times per transport.  An axis may also refresh an active
+command every ``keepalive`` seconds.  What differs per axis lives in an
+:class:`AxisSpec` table rather than in code.
+"""
+
+from dataclasses import dataclass, field
+
+NEUTRAL_MOVE = (0, 0, 3, 3)
+
+
+@dataclass(frozen=True)
+class AxisSpec:
+    """How one kind of axis is scheduled.
+
+    ``initial`` is the direction assumed before anything is sent; None makes
+    the first request go out even when it is neutral.  ``stop_packets`` is
+    the total number of stops per transport (missing transports send one).
+    """
+
+    neutral: object = 0
+    initial: object = 0
+    stop_packets: dict = field(default_factory=lambda: {"udp": 3})
+    keepalive: float | None = None
+
+    def stops(self, transport: str) -> int:
+        return max(1, self.stop_packets.get(str(transport).lower(), 1))
+
+
+AXES = {
+    "move": AxisSpec(neutral=NEUTRAL_MOVE, initial=None),
+    "focus": AxisSpec(),
+    "zoom": AxisSpec(stop_packets={"udp": 3, "tcp": 3}),
+}
+
+
+class AxisScheduler:
+    """Start/stop/retry suppression state for one axis of one camera."""
+
+    __slots__ = ("spec", "direction", "speed", "stop_remaining", "sent_at")
+
+    def __init__(self, spec: AxisSpec = AxisSpec()):
+        self.spec = spec
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget command history, such as after switching cameras."""
+
+        self.direction = self.spec.initial
+        self.speed = -1
+        self.stop_remaining = 0
+        self.sent_at = None
+
+    def keepalive_due(self, now: float | None) -> bool:
+        """True when the active command should be refreshed at ``now``."""
+
+        spec = self.spec
+        return (spec.keepalive is not None and now is not None and self.sent_at is not None
+                and self.direction not in (None, spec.neutral) and now - self.sent_at >= spec.keepalive)
+
+    def next(self, direction, transport: str = "tcp", speed: int | None = None,
+             now: float | None = None, stop_packets: int | None = None):
+        """Return the command to send this iteration, or ``None``.
+
+        ``speed`` of None means "unchanged"; ``stop_packets`` overrides the
+        table for this call.
+        """
+
+        spec = self.spec
+        active = direction != spec.neutral
+        command = None
+        if direction != self.direction or (
+            active and speed is not None and speed != self.speed
+        ):
+            was_active = self.direction is not None and self.direction != spec.neutral
+            self.direction = direction
+            if not active and was_active:
+                stops = spec.stops(transport) if stop_packets is None else stop_packets
+                self.stop_remaining = max(0, stops - 1)
+            else:
+                self.stop_remaining = 0
+            command = direction
+        elif not active and self.stop_remaining > 0:
+            self.stop_remaining -= 1
+            command = direction
+        elif active and self.keepalive_due(now):
+            command = direction
+        if speed is not None:
+            self.speed = speed
+        if command is not None:
+            self.sent_at = now
+        return command
+
+
+class AxisBank:
+    """Schedulers for every (camera, axis) pair, stepped in one pass.
+
+    ``camera`` is the ``(host, protocol, port)`` tuple used elsewhere; its
+    protocol selects the stop budget.
+    """
+
+    def __init__(self, table: dict = AXES):
+        self.table = table
+        self._schedulers = {}
+
+    def scheduler(self, camera, axis: str) -> AxisScheduler:
+        key = (tuple(camera[:3]), axis)
+        scheduler = self._schedulers.get(key)
+        if scheduler is None:
+            scheduler = self._schedulers[key] = AxisScheduler(self.table[axis])
+        return scheduler
+
+    def step(self, requests, now: float | None = None) -> list:
+        """Apply ``(camera, axis, direction, speed)`` requests.
+
+        Returns ``(camera, axis, command)`` for each command to send, in
+        request order.
+        """
+
+        commands = []
+        for camera, axis, direction, speed in requests:
+            command = self.scheduler(camera, axis).next(direction, camera[1], speed, now)
+            if command is not None:
+                commands.append((camera, axis, command))
+        return commands
+
+    def pending(self, camera, now: float | None = None) -> bool:
+        """True while one of ``camera``'s axes has an unsent stop retry, or a keepalive due at ``now``."""
+
+        key = tuple(camera[:3])
+        for (owner, _), scheduler in self._schedulers.items():
+            if owner == key and (scheduler.stop_remaining > 0 or scheduler.keepalive_due(now)):
+                return True
+        return False
+
+    def reset(self, camera=None) -> None:
+        """Reset one camera's axes, or every axis when ``camera`` is None."""
+
+        for (key, _), scheduler in self._schedulers.items():
+            if camera is None or key == tuple(camera[:3]):
+                scheduler.reset()
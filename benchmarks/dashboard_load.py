@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Compare the threaded and asyncio dashboard servers under concurrent polling.
+
+Each client keeps one HTTP/1.1 connection open and polls ``/api/status`` and
+``/api/config`` the way the dashboard page does.  Run from the repository
+root::
+
+    python3 benchmarks/dashboard_load.py --clients 50 --seconds 10
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.client import HTTPConnection
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+PATHS = ("/api/status", "/api/config")
+
+
+def _client(address, token, deadline, latencies, errors, start):
+    connection = HTTPConnection(*address, timeout=10)
+    headers = {"Authorization": "Bearer " + token}
+    start.wait()
+    index = 0
+    while time.monotonic() < deadline:
+        began = time.perf_counter()
+        try:
+            connection.request("GET", PATHS[index % len(PATHS)], headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors.append(response.status)
+        except OSError as exc:
+            errors.append(type(exc).__name__)
+            connection.close()
+            connection = HTTPConnection(*address, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - began)
+        index += 1
+    connection.close()
+
+
+def run(name, address, token, clients, seconds):
+    latencies, errors = [], []
+    start = threading.Event()
+    deadline = time.monotonic() + seconds + 0.5
+    threads = [
+        threading.Thread(
+            target=_client, args=(address, token, deadline, latencies, errors, start), daemon=True
+        )
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    baseline = threading.active_count()
+    peak = 0
+    start.set()
+    began = time.monotonic()
+    while any(thread.is_alive() for thread in threads):
+        peak = max(peak, threading.active_count() - baseline)
+        time.sleep(0.05)
+    elapsed = time.monotonic() - began
+    ordered = sorted(latencies) or [0.0]
+    return {
+        "server": name,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "req_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+        "server_threads_peak": peak,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["PTZPAD_TOKEN_FILE"] = os.path.join(tmp.name, "token")
+    os.environ["PTZPAD_CONFIG"] = os.path.join(tmp.name, "config.json")
+    os.environ["PTZPAD_STATE"] = os.path.join(tmp.name, "state.json")
+    import ptz_dashboard
+    from ptz_async_server import AsyncDashboardServer
+
+    ptz_dashboard.save_config({"cameras": [{"host": "127.0.0.1", "protocol": "tcp", "port": 1}]})
+    results = []
+
+    threaded = ptz_dashboard.ThreadingHTTPServer(("127.0.0.1", 0), ptz_dashboard.Handler)
+    threaded.daemon_threads = True
+    worker = threading.Thread(target=threaded.serve_forever, daemon=True)
+    worker.start()
+    results.append(run("threading", threaded.server_address, ptz_dashboard.TOKEN, args.clients, args.seconds))
+    threaded.shutdown()
+    threaded.server_close()
+
+    async_server = AsyncDashboardServer(
+        ("127.0.0.1", 0), ptz_dashboard.Handler,
+        max_connections=max(64, args.clients), max_body=ptz_dashboard.MAX_BODY,
+    )
+    async_server.start_background()
+    results.append(run("asyncio", async_server.server_address, ptz_dashboard.TOKEN, args.clients, args.seconds))
+    async_server.shutdown()
+    tmp.cleanup()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'server':<10} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'threads':>8} {'errors':>7}")
+    for row in results:
+        print(
+            f"{row['server']:<10} {row['req_per_s']:>8} {row['p50_ms']:>8} {row['p95_ms']:>8} "
+            f"{row['server_threads_peak']:>8} {row['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
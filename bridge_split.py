@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""Optional split of the bridge into a real-time input process and a worker.
+
+With ``PTZPAD_SPLIT=1`` the ptzpad process keeps only the joystick-to-VISCA
+path.  The Stream Deck, OLED, telemetry and ``status.json`` publishing run
+in a worker process started from this module, so their threads and Pillow
+rendering no longer hold the control loop's GIL.
+
+The processes share one memory-mapped file in the runtime directory (tmpfs):
+a seqlock :class:`StateBlock` in each direction for the latest bridge and
+worker state, and a single-producer single-consumer :class:`SpscRing` in
+each direction for method calls and deck actions.  Neither side waits on
+the other; a full ring drops the message and counts it.  Python cannot
+issue memory fences, so every slot and block carries a CRC and a reader
+simply retries later when it sees a half-written one.
+
+:func:`apply_realtime` pins the calling thread to one CPU and raises it to
+``SCHED_FIFO``.  ptzpad uses it only in split mode, because threads started
+afterwards inherit both settings.
+"""
+
+import json
+import logging
+import mmap
+import os
+import pickle
+import queue
+import signal
+import struct
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+
+SHM_MAGIC = b"PTZSPLT1"
+SHM_HEADER = struct.Struct("<8sIII44x")     # magic, ring slots, slot size, state block size
+RING_HEADER_SIZE = 64                        # head, tail, dropped (u64 each), padding
+SLOT_HEADER = struct.Struct("<QII")          # sequence, length, crc32
+BLOCK_HEADER = struct.Struct("<QII")         # seqlock counter, length, crc32
+_U64 = struct.Struct("<Q")
+_HEAD, _TAIL, _DROPPED = 0, 8, 16
+STOP = "__stop__"
+
+
+class SpscRing:
+    """Lock-free ring of byte messages for one producer and one consumer.
+
+    Only the producer writes ``head`` and only the consumer writes ``tail``.
+    A slot is published by writing its sequence number (``head + 1``) and
+    then advancing ``head``; the consumer copies it out before advancing
+    ``tail``, so the producer never overwrites a slot still being read.
+    """
+
+    def __init__(self, buffer, slots: int, slot_size: int):
+        self._buf = buffer
+        self.slots = slots
+        self.slot_size = slot_size
+        self.capacity = slot_size - SLOT_HEADER.size
+
+    def _get(self, offset):
+        return _U64.unpack_from(self._buf, offset)[0]
+
+    @property
+    def dropped(self) -> int:
+        return self._get(_DROPPED)
+
+    def put(self, data: bytes) -> bool:
+        """Append ``data``; return False (and count a drop) when the ring is full."""
+        if len(data) > self.capacity:
+            raise ValueError(f"message of {len(data)} bytes exceeds the {self.capacity}-byte slot")
+        head, tail = self._get(_HEAD), self._get(_TAIL)
+        if head - tail >= self.slots:
+            _U64.pack_into(self._buf, _DROPPED, self.dropped + 1)
+            return False
+        start = RING_HEADER_SIZE + (head % self.slots) * self.slot_size
+        body = start + SLOT_HEADER.size
+        self._buf[body:body + len(data)] = data
+        SLOT_HEADER.pack_into(self._buf, start, head + 1, len(data), zlib.crc32(data))
+        _U64.pack_into(self._buf, _HEAD, head + 1)
+        return True
+
+    def get(self) -> bytes | None:
+        """Return the oldest complete message, or None."""
+        tail = self._get(_TAIL)
+        if tail == self._get(_HEAD):
+            return None
+        start = RING_HEADER_SIZE + (tail % self.slots) * self.slot_size
+        sequence, length, crc = SLOT_HEADER.unpack_from(self._buf, start)
+        if sequence != tail + 1 or length > self.capacity:
+            return None                 # published head seen before the slot
+        body = start + SLOT_HEADER.size
+        data = bytes(self._buf[body:body + length])
+        if zlib.crc32(data) != crc:
+            return None
+        _U64.pack_into(self._buf, _TAIL, tail + 1)
+        return data
+
+
+class StateBlock:
+    """Latest-value block for one writer: a seqlock plus a CRC.
+
+    The counter is odd while a write is in progress.  :meth:`read` returns
+    only data that is new since the previous read and was not torn.
+    """
+
+    def __init__(self, buffer):
+        self._buf = buffer
+        self.capacity = len(buffer) - BLOCK_HEADER.size
+        self._seen = 0
+
+    def write(self, data: bytes) -> None:
+        if len(data) > self.capacity:
+            raise ValueError(f"state of {len(data)} bytes exceeds the {self.capacity}-byte block")
+        sequence = _U64.unpack_from(self._buf, 0)[0] & ~1
+        _U64.pack_into(self._buf, 0, sequence + 1)
+        self._buf[BLOCK_HEADER.size:BLOCK_HEADER.size + len(data)] = data
+        BLOCK_HEADER.pack_into(self._buf, 0, sequence + 2, len(data), zlib.crc32(data))
+
+    def read(self) -> bytes | None:
+        sequence, length, crc = BLOCK_HEADER.unpack_from(self._buf, 0)
+        if sequence == self._seen or sequence & 1 or length > self.capacity:
+            return None
+        data = bytes(self._buf[BLOCK_HEADER.size:BLOCK_HEADER.size + length])
+        if _U64.unpack_from(self._buf, 0)[0] != sequence or zlib.crc32(data) != crc:
+            return None
+        self._seen = sequence
+        return data
+
+
+class SharedRegion:
+    """The memory-mapped file holding both rings and both state blocks."""
+
+    def __init__(self, path, create=False, slots=64, slot_size=4096, block_size=64 * 1024):
+        self.path = Path(path)
+        if create:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+            self._file = os.fdopen(fd, "w+b")
+            ring_bytes = RING_HEADER_SIZE + slots * slot_size
+            self._file.truncate(SHM_HEADER.size + 2 * ring_bytes + 2 * block_size)
+            self._file.write(SHM_HEADER.pack(SHM_MAGIC, slots, slot_size, block_size))
+            self._file.flush()
+        else:
+            self._file = open(self.path, "r+b")
+            magic, slots, slot_size, block_size = SHM_HEADER.unpack(self._file.read(SHM_HEADER.size))
+            if magic != SHM_MAGIC:
+                self._file.close()
+                raise ValueError(f"{self.path} is not a bridge region")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._views = []
+        offset = SHM_HEADER.size
+        ring_bytes = RING_HEADER_SIZE + slots * slot_size
+        self.to_worker = SpscRing(self._view(offset, ring_bytes), slots, slot_size)
+        self.to_bridge = SpscRing(self._view(offset + ring_bytes, ring_bytes), slots, slot_size)
+        offset += 2 * ring_bytes
+        self.bridge_state = StateBlock(self._view(offset, block_size))
+        self.worker_state = StateBlock(self._view(offset + block_size, block_size))
+
+    def _view(self, offset, size):
+        view = memoryview(self._map)[offset:offset + size]
+        self._views.append(view)
+        return view
+
+    def close(self, unlink=False) -> None:
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._map.close()
+        self._file.close()
+        if unlink:
+            self.path.unlink(missing_ok=True)
+
+
+class RingQueue:
+    """``queue.Queue``-style ``put``/``get_nowait`` for pickled objects on a ring.
+
+    Producers on several threads of one process are serialized by a local
+    lock, which keeps the ring single-producer.  With ``wake_fd`` each
+    message also writes a byte there, so a blocked consumer can wake.
+    """
+
+    def __init__(self, ring: SpscRing, wake_fd: int | None = None):
+        self.ring = ring
+        self.wake_fd = wake_fd
+        self._lock = threading.Lock()
+
+    def put(self, item, block=True, timeout=None) -> bool:
+        data = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        try:
+            with self._lock:
+                sent = self.ring.put(data)
+        except ValueError as exc:
+            logging.warning("bridge message dropped: %s", exc)
+            return False
+        if not sent:
+            logging.warning("bridge ring full; dropped %s", type(item).__name__)
+        elif self.wake_fd is not None:
+            try:
+                os.write(self.wake_fd, b"\0")
+            except OSError:
+                pass            # a full pipe already has a wake pending
+        return sent
+
+    def get_nowait(self):
+        data = self.ring.get()
+        if data is None:
+            raise queue.Empty
+        return pickle.loads(data)
+
+
+class RemoteObject:
+    """Stand-in for an object in the worker: method calls are queued, never awaited.
+
+    Keyword arguments override attributes locally, for the few calls that
+    must return a value or should not cross the process boundary.
+    """
+
+    def __init__(self, calls: RingQueue, target: str, **local):
+        self._calls = calls
+        self._target = target
+        self.__dict__.update(local)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            self._calls.put((self._target, name, args, kwargs))
+        return call
+
+
+class SplitBridge:
+    """Real-time side: owns the region and the worker process.
+
+    The worker writes a byte to a pipe for every deck action; a watcher
+    thread (started here, so it never inherits real-time scheduling) calls
+    ``on_action`` so an idle control loop can stop waiting at once.
+    """
+
+    def __init__(self, path, worker_cpus=None, start=True, on_action=None):
+        self.region = SharedRegion(path, create=True)
+        self.calls = RingQueue(self.region.to_worker)
+        self._actions = RingQueue(self.region.to_bridge)
+        self._decks = set()
+        self._worker_state = {}
+        self.on_action = on_action
+        self.process = None
+        if start:
+            wake_read, wake_write = os.pipe()
+            os.set_blocking(wake_write, False)
+            command = [sys.executable, str(Path(__file__).resolve()), "--worker", str(self.region.path),
+                       "--wake-fd", str(wake_write)]
+            if worker_cpus:
+                command += ["--cpus", ",".join(str(cpu) for cpu in sorted(worker_cpus))]
+            try:
+                self.process = subprocess.Popen(command, pass_fds=(wake_write,))
+            finally:
+                os.close(wake_write)
+            self.watch(wake_read)
+
+    def watch(self, wake_fd: int) -> threading.Thread:
+        """Call ``on_action`` for each wake byte until the writer closes ``wake_fd``."""
+        def run():
+            with open(wake_fd, "rb", buffering=0) as wake:
+                while wake.read(64):
+                    if self.on_action is not None:
+                        self.on_action()
+        thread = threading.Thread(target=run, name="bridge-wake", daemon=True)
+        thread.start()
+        return thread
+
+    def proxy(self, target: str, **local) -> RemoteObject:
+        return RemoteObject(self.calls, target, **local)
+
+    def publish(self, payload: dict, cameras: list) -> None:
+        """Hand a status snapshot to the worker, which adds its own parts and writes it."""
+        self.region.bridge_state.write(pickle.dumps({"payload": payload, "cameras": cameras},
+                                                    pickle.HIGHEST_PROTOCOL))
+
+    def worker_state(self) -> dict:
+        data = self.region.worker_state.read()
+        if data is not None:
+            self._worker_state = pickle.loads(data)
+        return self._worker_state
+
+    def get_nowait(self):
+        """Next deck action from the worker; raises ``queue.Empty`` like a queue."""
+        action = self._actions.get_nowait()
+        if getattr(action, "deck", None) is not None:
+            self._decks.add(action.deck)
+        return action
+
+    def deck_ids(self) -> list:
+        """Connected decks as last reported, plus any that sent an action since."""
+        return sorted(set(self.worker_state().get("deck_ids", ())) | self._decks)
+
+    @property
+    def dropped(self) -> int:
+        return self.region.to_worker.dropped
+
+    def close(self, timeout=2.0) -> None:
+        self.calls.put((STOP, None, (), {}))
+        if self.process is not None:
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.region.close(unlink=True)
+
+
+def write_state(path: Path, payload: dict) -> bool:
+    """Atomically replace ``path`` with ``payload`` as JSON; False if that failed."""
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        return False
+    return True
+
+
+class Worker:
+    """Worker side: runs queued calls and publishes status for the bridge."""
+
+    def __init__(self, region: SharedRegion, targets: dict, state_path, poll=(0.02, 0.2)):
+        self.region = region
+        self.targets = targets
+        self.state_path = Path(state_path)
+        self.poll = poll
+        self.busy = False
+        self._decks = None
+
+    def step(self) -> bool:
+        """Handle everything waiting; return False once the bridge asks to stop."""
+        busy = False
+        while (data := self.region.to_worker.get()) is not None:
+            busy = True
+            target, method, args, kwargs = pickle.loads(data)
+            if target == STOP:
+                return False
+            try:
+                getattr(self.targets[target], method)(*args, **kwargs)
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("bridge worker call %s.%s failed", target, method)
+        data = self.region.bridge_state.read()
+        if data is not None:
+            busy = True
+            self.publish(pickle.loads(data))
+        streamdeck = self.targets.get("streamdeck")
+        decks = streamdeck.deck_ids() if streamdeck else []
+        if decks != self._decks:
+            self._decks = decks
+            self.region.worker_state.write(pickle.dumps({"deck_ids": decks}, pickle.HIGHEST_PROTOCOL))
+        self.busy = busy
+        return True
+
+    def publish(self, update: dict) -> None:
+        streamdeck, telemetry = self.targets.get("streamdeck"), self.targets.get("telemetry")
+        payload = {**update["payload"],
+                   "streamdeck": streamdeck.snapshot() if streamdeck else {"enabled": False},
+                   "telemetry": telemetry.snapshot() if telemetry else {}}
+        oled = self.targets.get("oled")
+        if oled is not None:
+            oled.set_state({**payload, "cameras": update["cameras"]})
+        write_state(self.state_path, payload)
+
+    def run(self, should_stop=lambda: False, sleeper=time.sleep) -> None:
+        """Poll quickly while calls arrive and back off to ``poll[1]`` when quiet."""
+        fast, slow = self.poll
+        delay = fast
+        while not should_stop() and self.step():
+            delay = fast if self.busy else min(delay * 2, slow)
+            sleeper(delay)
+
+    def close(self) -> None:
+        for name in ("telemetry", "streamdeck", "oled"):
+            target = self.targets.get(name)
+            if target is not None:
+                try:
+                    target.close()
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception("closing %s failed", name)
+
+
+def _env_int(name: str, low: int, high: int) -> int | None:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        logging.warning("ignoring %s=%r: not an integer", name, raw)
+        return None
+    if not low <= value <= high:
+        logging.warning("ignoring %s=%s: expected %s-%s", name, value, low, high)
+        return None
+    return value
+
+
+def realtime_settings() -> tuple[int | None, int | None]:
+    """``(cpu, priority)`` from ``PTZPAD_RT_CPU`` and ``PTZPAD_RT_PRIORITY``."""
+    return _env_int("PTZPAD_RT_CPU", 0, 1023), _env_int("PTZPAD_RT_PRIORITY", 1, 99)
+
+
+def apply_realtime(cpu: int | None = None, priority: int | None = None) -> dict:
+    """Pin the calling thread to ``cpu`` and run it ``SCHED_FIFO`` at ``priority``.
+
+    Threads started afterwards inherit both.  Returns what was applied;
+    a failure (usually a missing ``CAP_SYS_NICE``) is logged and skipped.
+    """
+    applied = {}
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+            applied["cpu"] = cpu
+        except (AttributeError, OSError, ValueError) as exc:
+            logging.warning("could not pin the control loop to CPU %s: %s", cpu, exc)
+    if priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            applied["priority"] = priority
+        except (AttributeError, OSError, ValueError) as exc:
+            logging.warning("could not set SCHED_FIFO priority %s: %s", priority, exc)
+    return applied
+
+
+def worker_cpus(rt_cpu: int | None) -> set | None:
+    """Every CPU this process may use except the real-time one."""
+    if rt_cpu is None or not hasattr(os, "sched_getaffinity"):
+        return None
+    return (os.sched_getaffinity(0) - {rt_cpu}) or None
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ptzpad auxiliary worker (started by ptzpad)")
+    parser.add_argument("--worker", required=True, metavar="REGION")
+    parser.add_argument("--cpus", default="")
+    parser.add_argument("--wake-fd", type=int)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s worker: %(message)s")
+    if args.cpus:
+        try:
+            os.sched_setaffinity(0, {int(cpu) for cpu in args.cpus.split(",")})
+        except (AttributeError, OSError, ValueError) as exc:
+            logging.warning("could not set worker CPUs %s: %s", args.cpus, exc)
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    signal.signal(signal.SIGINT, lambda *_: stopping.set())
+
+    from oled_status import OledStatus
+    from streamdeck_control import StreamDeckController
+    from visca_telemetry import TelemetryService
+
+    region = SharedRegion(args.worker)
+    streamdeck = StreamDeckController(RingQueue(region.to_bridge, wake_fd=args.wake_fd))
+    telemetry = TelemetryService(on_change=streamdeck.telemetry_changed)
+    streamdeck.attach_telemetry(telemetry)
+    worker = Worker(region, {"oled": OledStatus(), "streamdeck": streamdeck, "telemetry": telemetry},
+                    os.environ.get("PTZPAD_STATE", "/run/ptzpad/status.json"))
+    parent = os.getppid()
+    try:
+        worker.run(lambda: stopping.is_set() or os.getppid() != parent)
+    finally:
+        worker.close()
+        region.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
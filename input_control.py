@@ -2,21 +2,19 @@
 
 from dataclasses import dataclass
 
+from axis_scheduler import AXES, AxisScheduler
+
 
-@dataclass
 class MotionState:
-    last_move: tuple[int, int, int, int] | None = None
-    focus_direction: int = 0
-    focus_moved: bool = False
-    move_stop_remaining: int = 0
-    focus_stop_remaining: int = 0
+    """Pan/tilt and focus schedulers behind the original input-loop API."""
+
+    def __init__(self):
+        self.move = AxisScheduler(AXES["move"])
+        self.focus = AxisScheduler(AXES["focus"])
 
     def reset(self) -> None:
-        self.last_move = None
-        self.focus_direction = 0
-        self.focus_moved = False
-        self.move_stop_remaining = 0
-        self.focus_stop_remaining = 0
+        self.move.reset()
+        self.focus.reset()
 
     def move_changed(
         self,
@@ -24,45 +22,15 @@ class MotionState:
         protocol: str = "tcp",
         udp_stop_packets: int = 3,
     ) -> bool:
-        neutral = command == (0, 0, 3, 3)
-        if command != self.last_move:
-            was_active = self.last_move is not None and self.last_move != (0, 0, 3, 3)
-            self.last_move = command
-            self.move_stop_remaining = (
-                max(0, udp_stop_packets - 1)
-                if neutral and was_active and protocol.lower() == "udp"
-                else 0
-            )
-            return True
-        if neutral and self.move_stop_remaining > 0:
-            self.move_stop_remaining -= 1
-            return True
-        return False
+        stops = udp_stop_packets if protocol.lower() == "udp" else 1
+        return self.move.next(command, protocol, stop_packets=stops) is not None
 
     def next_focus(
         self, direction: int, protocol: str = "tcp", udp_stop_packets: int = 3
     ) -> int | None:
         direction = 1 if direction > 0 else -1 if direction < 0 else 0
-        if direction == 0 and self.focus_direction == 0 and self.focus_stop_remaining > 0:
-            self.focus_stop_remaining -= 1
-            return 0
-        if direction == 0 and not self.focus_moved:
-            self.focus_direction = 0
-            return None
-        if direction == self.focus_direction:
-            if direction == 0 and self.focus_stop_remaining > 0:
-                self.focus_stop_remaining -= 1
-                return 0
-            return None
-        was_active = self.focus_direction != 0
-        self.focus_direction = direction
-        self.focus_moved = direction != 0
-        self.focus_stop_remaining = (
-            max(0, udp_stop_packets - 1)
-            if direction == 0 and was_active and protocol.lower() == "udp"
-            else 0
-        )
-        return direction
+        stops = udp_stop_packets if protocol.lower() == "udp" else 1
+        return self.focus.next(direction, protocol, stop_packets=stops)
 
 
 @dataclass
@@ -74,6 +42,11 @@ class ZoomTriggerState:
         self.direction = 0
         self.release_loops = 0
 
+    @property
+    def releasing(self) -> bool:
+        """True during the release grace, while identical input still changes state."""
+        return self.direction != 0 and self.release_loops > 0
+
 
 def resolve_zoom_direction(
     zoom_value: float,
@@ -132,6 +105,37 @@ def controller_layout(button_count: int, hat_count: int) -> ButtonLayout:
     return EVDEV_LAYOUT
 
 
+class InputSnapshot:
+    """Everything the control loop reads from the controller in one tick.
+
+    ``axes`` holds the six raw SDL axes, ``hat`` the resolved D-pad and
+    ``buttons`` the A, LB, RB, Y and LS states for ``layout``.  Snapshots
+    compare equal when the controller has not moved, which lets the loop
+    skip recomputing commands.
+    """
+
+    __slots__ = ("axes", "hat", "buttons", "counts", "layout")
+
+    def __init__(self, axes=(0.0,) * 6, hat=(0, 0), buttons=(False,) * 5,
+                 counts=(0, 0), layout=EVDEV_LAYOUT):
+        self.axes = tuple(axes)
+        self.hat = tuple(hat)
+        self.buttons = tuple(buttons)
+        self.counts = counts
+        self.layout = layout
+
+    def __eq__(self, other):
+        if not isinstance(other, InputSnapshot):
+            return NotImplemented
+        return (self.axes == other.axes and self.hat == other.hat
+                and self.buttons == other.buttons and self.layout == other.layout)
+
+    __hash__ = None
+
+    def pressed(self) -> dict[str, bool]:
+        return dict(zip(("A", "LB", "RB", "Y", "LS"), self.buttons))
+
+
 @dataclass
 class ButtonEdges:
     previous: set[str] | None = None
@@ -130,12 +130,20 @@ echo "[3/5] Installing ${TARGET_HOME}/ptzpad.py and dependencies …"
 install -m 755 "${SCRIPT_DIR}/ptzpad.py" "${TARGET_HOME}/ptzpad.py"
 install -m 644 "${SCRIPT_DIR}/zoom_control.py" "${TARGET_HOME}/zoom_control.py"
 install -m 644 "${SCRIPT_DIR}/input_control.py" "${TARGET_HOME}/input_control.py"
+install -m 644 "${SCRIPT_DIR}/axis_scheduler.py" "${TARGET_HOME}/axis_scheduler.py"
 install -m 644 "${SCRIPT_DIR}/oled_status.py" "${TARGET_HOME}/oled_status.py"
 install -m 644 "${SCRIPT_DIR}/streamdeck_control.py" "${TARGET_HOME}/streamdeck_control.py"
+install -m 644 "${SCRIPT_DIR}/visca_telemetry.py" "${TARGET_HOME}/visca_telemetry.py"
+install -m 644 "${SCRIPT_DIR}/visca_inquiry.py" "${TARGET_HOME}/visca_inquiry.py"
+install -m 644 "${SCRIPT_DIR}/visca_codec.py" "${TARGET_HOME}/visca_codec.py" "${TARGET_HOME}/power_save.py" "${TARGET_HOME}/bridge_split.py"
+install -m 644 "${SCRIPT_DIR}/power_save.py" "${TARGET_HOME}/power_save.py"
+install -m 644 "${SCRIPT_DIR}/bridge_split.py" "${TARGET_HOME}/bridge_split.py"
 install -m 755 "${SCRIPT_DIR}/snapshot_diagnostic.py" "${TARGET_HOME}/snapshot_diagnostic.py"
 install -m 755 "${SCRIPT_DIR}/ptz_dashboard.py" "${TARGET_HOME}/ptz_dashboard.py"
 install -m 644 "${SCRIPT_DIR}/ptz_config.py" "${TARGET_HOME}/ptz_config.py"
-chown "${TARGET_USER}:${TARGET_GROUP}" "${TARGET_HOME}/ptzpad.py" "${TARGET_HOME}/streamdeck_control.py" "${TARGET_HOME}/snapshot_diagnostic.py" "${TARGET_HOME}/zoom_control.py" "${TARGET_HOME}/input_control.py" "${TARGET_HOME}/oled_status.py" "${TARGET_HOME}/ptz_dashboard.py" "${TARGET_HOME}/ptz_config.py"
+install -m 644 "${SCRIPT_DIR}/ptz_discovery.py" "${TARGET_HOME}/ptz_discovery.py"
+install -m 644 "${SCRIPT_DIR}/ptz_async_server.py" "${TARGET_HOME}/ptz_async_server.py"
+chown "${TARGET_USER}:${TARGET_GROUP}" "${TARGET_HOME}/ptzpad.py" "${TARGET_HOME}/streamdeck_control.py" "${TARGET_HOME}/snapshot_diagnostic.py" "${TARGET_HOME}/zoom_control.py" "${TARGET_HOME}/input_control.py" "${TARGET_HOME}/axis_scheduler.py" "${TARGET_HOME}/oled_status.py" "${TARGET_HOME}/ptz_dashboard.py" "${TARGET_HOME}/ptz_config.py" "${TARGET_HOME}/ptz_discovery.py" "${TARGET_HOME}/ptz_async_server.py" "${TARGET_HOME}/visca_telemetry.py" "${TARGET_HOME}/visca_inquiry.py" "${TARGET_HOME}/visca_codec.py"
 
 if getent group input >/dev/null 2>&1; then
     printf 'SUBSYSTEM=="usb", ATTR{idVendor}=="0fd9", MODE="0660", GROUP="input"\n' > /etc/udev/rules.d/99-ptzpad-streamdeck.rules
@@ -206,6 +214,7 @@ ExecStart=/usr/bin/python3 ${TARGET_HOME}/ptz_dashboard.py
 WorkingDirectory=${TARGET_HOME}
 Environment=PTZPAD_BIND=0.0.0.0
 Environment=PTZPAD_PORT=8080
+Environment=PTZPAD_SERVER=threading
 Restart=always
 RestartSec=2
 [Install]
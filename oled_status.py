@@ -2,25 +2,138 @@
 
 The module uses luma.oled if available and falls back to a no-op
 implementation when the hardware or driver cannot be initialized.
+Frames are drawn on a background thread into a persistent 1-bit buffer
+and only the SSD1306 pages and columns that changed are sent over I2C.
+Between events the display rotates through status pages built from the
+bridge state, within an I2C byte budget.
 """
 from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
 from typing import Iterable, List
 
 try:
     from luma.core.interface.serial import i2c
-    from luma.core.render import canvas
     from luma.oled.device import ssd1306
-    from PIL import ImageFont
 except (ImportError, FileNotFoundError, OSError):  # hardware not present or drivers missing
-    canvas = None
     i2c = None
     ssd1306 = None
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+    ImageDraw = None
     ImageFont = None
 
+SET_COLUMN_ADDRESS = 0x21
+SET_PAGE_ADDRESS = 0x22
+# Six command bytes plus the control bytes framing one page write.
+SPAN_OVERHEAD = 8
+FULL_FRAME_COST = 8 * (128 + SPAN_OVERHEAD)
+LINES_PER_PAGE = 4
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class ByteBudget:
+    """Token bucket for I2C bytes: ``rate`` per second, bursting to ``burst``.
+
+    A rate of 0 disables the limit.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None, clock=time.monotonic) -> None:
+        self.rate = max(0.0, float(rate))
+        self.burst = float(burst if burst is not None else max(self.rate, FULL_FRAME_COST))
+        self.clock = clock
+        self._tokens = self.burst
+        self._at = clock()
+
+    def reserve(self, cost: int) -> float:
+        """Spend ``cost`` bytes and return how long to wait before sending them."""
+        if not self.rate:
+            return 0.0
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._at) * self.rate) - cost
+        self._at = now
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+def _send_health(camera: str, health: dict) -> str:
+    ok = (health.get("last_success") or 0) >= (health.get("last_error") or 0)
+    return f"{camera[:12]:<12}{'ok' if ok else 'ERR':>4}{health.get('errors', 0):>5}"
+
+
+def status_pages(state: dict) -> List[List[str]]:
+    """Build the rotating status pages from a bridge state snapshot."""
+    cameras = state.get("cameras") or []
+    index = state.get("active_camera", 0)
+    camera = cameras[index] if 0 <= index < len(cameras) else {}
+    controller = state.get("controller") or {}
+    pages = [[
+        f"Cam {index + 1}/{max(1, len(cameras))} {camera.get('name', '')}",
+        camera.get("host", "-"),
+        f"{camera.get('protocol', '-')}:{camera.get('port', '-')}",
+        controller.get("name") if controller.get("connected") else "No joystick",
+    ]]
+    pages.append([
+        "Speeds",
+        f"Pan/tilt {state.get('max_speed', '-')}/24",
+        f"Zoom {state.get('zoom_speed', '-')}/7",
+        f"Deadzone {state.get('deadzone', 0):.2f}",
+    ])
+    send = state.get("camera_send") or {}
+    rows = [_send_health(c.get("host", ""), send.get(c.get("host"), {})) for c in cameras]
+    per_page = LINES_PER_PAGE - 1
+    for start in range(0, len(rows), per_page):
+        pages.append(["Send health   st  err", *rows[start:start + per_page]])
+    loop = state.get("loop")
+    if loop:
+        pages.append([
+            "Control loop idle" if loop.get("idle") else "Control loop",
+            f"{loop.get('rate_hz', 0):.1f} Hz of {loop.get('target_hz', 0):.0f}",
+            f"Overruns {loop.get('overruns', 0)}",
+            f"Worst {loop.get('worst_ms', 0):.0f} ms",
+        ])
+    return pages
+
+
+def line_height(font) -> int:
+    """Return the pixel height of one text line for ``font``."""
+    if hasattr(font, "getbbox"):
+        bbox = font.getbbox("Ag")
+        return max(1, bbox[3] - bbox[1])
+    return max(1, font.getsize("Ag")[1])
+
+
+def frame_pages(image) -> List[bytes]:
+    """Pack a 1-bit image into SSD1306 pages: one byte per column, top row in bit 0.
+
+    Transposing and mirroring turns each column into a row whose bytes are
+    already bottom-to-top, so PIL does the bit packing.
+    """
+    transpose = getattr(Image, "Transpose", Image)
+    packed = image.transpose(transpose.TRANSPOSE).transpose(transpose.FLIP_LEFT_RIGHT).tobytes()
+    rows = image.height // 8
+    return [packed[rows - 1 - page::rows] for page in range(rows)]
+
+
+def changed_spans(previous, current):
+    """Yield ``(page, first, last)`` column ranges that differ between two frames."""
+    for page, (old, new) in enumerate(zip(previous, current)):
+        if old == new:
+            continue
+        columns = [column for column in range(len(new)) if old[column] != new[column]]
+        yield page, columns[0], columns[-1]
+
 
 class _NullDisplay:
     """Graceful fallback used when an OLED cannot be initialized."""
@@ -35,15 +148,35 @@ class _NullDisplay:
 class OledStatus:
     """Lightweight status renderer for a 128x64 SSD1306 display."""
 
-    def __init__(self, min_interval: float = 0.2) -> None:
+    def __init__(self, min_interval: float = 0.2, page_interval: float | None = None,
+                 event_hold: float | None = None, bytes_per_second: float | None = None) -> None:
         self._log = logging.getLogger(__name__)
         self._min_interval = min_interval
         self._keepalive_interval = 30.0
+        self._page_interval = page_interval or _env_float("OLED_PAGE_SECONDS", 4.0)
+        self._event_hold = event_hold if event_hold is not None else _env_float("OLED_EVENT_SECONDS", 5.0)
+        if bytes_per_second is None:
+            bytes_per_second = _env_float("OLED_I2C_BYTES_PER_SEC", 1024)
+        self._budget = ByteBudget(bytes_per_second)
+        self._state = None
+        self._event_lines: List[str] = []
+        self._event_at = 0.0
+        self._page_index = -1
+        self._page_due = 0.0
+        self._idle = False
         self._last_lines: List[str] = []
         self._last_update = 0.0
         self._failed_once = False
         self._available = False
-        if not all([canvas, i2c, ssd1306, ImageFont]):
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._pending = None
+        self._thread = None
+        self._frame = None
+        self._pushed_at = 0.0
+        self.bytes_written = 0
+        if not all([i2c, ssd1306, Image, ImageFont]):
             self._display = _NullDisplay()
             if not self._failed_once:
                 self._log.info("OLED display unavailable; running without screen")
@@ -63,6 +196,9 @@ class OledStatus:
             self._width = self._device.width
             self._height = self._device.height
             self._font = ImageFont.load_default()
+            self._line_height = line_height(self._font)
+            self._image = Image.new("1", (self._width, self._height))
+            self._draw = ImageDraw.Draw(self._image)
 
             self._device.contrast(255)
             self._device.clear()
@@ -76,6 +212,8 @@ class OledStatus:
         self._available = True
         self._display = self._device
         self._paint_boot_screen()
+        self._thread = threading.Thread(target=self._run, name="oled", daemon=True)
+        self._thread.start()
 
     @property
     def available(self) -> bool:
@@ -108,26 +246,83 @@ class OledStatus:
     def error(self, message: str) -> None:
         self._render(["Error", message], force=True)
 
-    def refresh(self) -> None:
-        """Force a keepalive render when the screen already has content."""
-
-        if not self.available or not self._last_lines:
+    def set_state(self, state: dict) -> None:
+        """Publish a bridge state snapshot for the rotating status pages."""
+        if not self.available:
             return
+        with self._lock:
+            self._state = state
+        self._wake.set()
+
+    def set_idle(self, idle: bool) -> None:
+        """Hold the current page and skip keepalive pushes while the bridge idles."""
+        self._idle = idle
+        if not idle:
+            self._wake.set()
 
-        self._render(self._last_lines)
+    def refresh(self) -> None:
+        """Kept for callers; the display worker rotates pages and sends keepalives itself.
+
+        Re-posting the current lines here would count as a new event and
+        hold the screen, so status pages would never rotate.
+        """
 
     def _render(self, lines: Iterable[str], force: bool = False) -> None:
+        """Post the latest lines for the display worker; never waits on I2C."""
         if not self.available:
             return
 
         normalized = [str(line)[:21] for line in lines]  # 21 chars fits default font
+        with self._lock:
+            if self._pending is not None:
+                force = force or self._pending[1]
+            self._pending = (normalized, force)
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(None if self._idle else min(self._keepalive_interval, self._page_interval))
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+            self._drain()
+
+    def _scheduled_lines(self, now: float) -> List[str]:
+        """Return the held event, or the status page due at ``now``."""
+        with self._lock:
+            state = self._state
+        if state is None or now - self._event_at < self._event_hold:
+            return self._event_lines
+        if now >= self._page_due and not (self._idle and self._page_index >= 0):
+            self._page_index += 1
+            self._page_due = now + self._page_interval
+        pages = status_pages(state)
+        return [str(line)[:21] for line in pages[self._page_index % len(pages)]]
+
+    def _drain(self) -> None:
+        """Show the latest event or status page, throttled to ``min_interval``."""
+        with self._lock:
+            pending, self._pending = self._pending, None
         now = time.time()
+        if pending is not None:
+            normalized, force = pending
+            self._event_lines, self._event_at = normalized, now
+        else:
+            normalized, force = self._scheduled_lines(now), False
+            if not normalized:
+                return
         if not force:
             if normalized == self._last_lines:
-                if now - self._last_update < self._keepalive_interval:
+                if self._idle or now - self._last_update < self._keepalive_interval:
                     return
             elif now - self._last_update < self._min_interval:
-                return
+                self._stop.wait(self._min_interval - (now - self._last_update))
+                with self._lock:
+                    if self._pending is not None:
+                        normalized, force = self._pending
+                        self._pending = None
+                        self._event_lines = normalized
+                now = time.time()
 
         try:
             self.show(normalized, force=force)
@@ -141,23 +336,45 @@ class OledStatus:
             self._available = False
 
     def show(self, lines: Iterable[str], force: bool = False) -> None:
+        """Draw ``lines`` and send the changed part of the frame.
+
+        Unchanged frames send nothing; a keepalive after
+        ``keepalive_interval`` resends the whole frame in case the panel
+        was reset underneath us.
+        """
         if not self.available:
             return
 
         padding = 2
-        with canvas(self._device) as draw:  # type: ignore[arg-type]
-            draw.rectangle(self._device.bounding_box, outline=0, fill=0)
-
-            y = padding
-            if hasattr(self._font, "getbbox"):
-                bbox = self._font.getbbox("Ag")
-                line_height = max(1, bbox[3] - bbox[1])
-            else:
-                line_height = max(1, self._font.getsize("Ag")[1])
-            for line in lines:
-                draw.text((0, y), line, font=self._font, fill=255)
-                y += line_height + 2
-
-        # Explicitly flush the buffer to the panel to mirror the working
-        # standalone test sequence and avoid stale images on some adapters.
-        self._device.show()
+        self._draw.rectangle((0, 0, self._width - 1, self._height - 1), outline=0, fill=0)
+        y = padding
+        for line in lines:
+            self._draw.text((0, y), line, font=self._font, fill=255)
+            y += self._line_height + 2
+        pages = frame_pages(self._image)
+        now = time.time()
+        if force or self._frame is None or (
+            not self._idle and now - self._pushed_at >= self._keepalive_interval
+        ):
+            spans = [(page, 0, len(data) - 1) for page, data in enumerate(pages)]
+            self._pushed_at = now
+        else:
+            spans = list(changed_spans(self._frame, pages))
+        delay = self._budget.reserve(sum(last - first + 1 + SPAN_OVERHEAD for _, first, last in spans))
+        if delay:
+            self._stop.wait(delay)
+        self._write(pages, spans)
+        self._frame = pages
+
+    def _write(self, pages, spans) -> None:
+        offset = getattr(self._device, "_colstart", 0)
+        for page, first, last in spans:
+            self._device.command(SET_COLUMN_ADDRESS, offset + first, offset + last, SET_PAGE_ADDRESS, page, page)
+            self._device.data(list(pages[page][first:last + 1]))
+            self.bytes_written += last - first + 1
+
+    def close(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
@@ -0,0 +1,128 @@
+"""Idle detection and process load sampling for the bridge's power-save mode.
+
+After ``idle_after`` seconds without controller or Stream Deck input and
+with no stop packets pending, the bridge slows its loop, pauses telemetry
+polling and OLED keepalives, and publishes status less often.  The first
+input switches straight back.  :class:`ProcessLoad` reports the CPU share
+and wakeups per second so the savings can be checked on the device.
+"""
+
+import os
+import time
+from pathlib import Path
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+IDLE_SECONDS = _env_float("PTZPAD_IDLE_SECONDS", 120.0)      # 0 disables power save
+IDLE_LOOP_MS = max(1.0, _env_float("PTZPAD_IDLE_LOOP_MS", 250.0))
+IDLE_PUBLISH_SECONDS = _env_float("PTZPAD_IDLE_PUBLISH_SECONDS", 5.0)
+
+
+class IdlePolicy:
+    """Track input activity and decide when the bridge may idle."""
+
+    __slots__ = ("idle_after", "idle", "last_active")
+
+    def __init__(self, idle_after: float = IDLE_SECONDS, now: float | None = None):
+        self.idle_after = idle_after
+        self.idle = False
+        self.last_active = time.monotonic() if now is None else now
+
+    def update(self, active: bool, now: float) -> str | None:
+        """Record one loop iteration; return "wake" or "sleep" on a transition."""
+        if active:
+            self.last_active = now
+            if self.idle:
+                self.idle = False
+                return "wake"
+            return None
+        if not self.idle and self.idle_after > 0 and now - self.last_active >= self.idle_after:
+            self.idle = True
+            return "sleep"
+        return None
+
+
+class IdleWaiter:
+    """Wait out one idle period, returning early only for input that matters.
+
+    ``next_event(timeout_ms)`` returns an event or None on timeout, and
+    ``is_input(event)`` decides whether it should wake the loop.  Other
+    events, such as stick noise inside the deadzone, are discarded without
+    shortening the period, so the loop never runs faster than
+    ``1 / period`` while idle.
+    """
+
+    def __init__(self, next_event, is_input, period: float = IDLE_LOOP_MS / 1000, clock=time.monotonic):
+        self.next_event = next_event
+        self.is_input = is_input
+        self.period = period
+        self.clock = clock
+
+    def wait(self) -> bool:
+        """Return True when woken by input, False once the period has passed."""
+        deadline = self.clock() + self.period
+        while True:
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                return False
+            event = self.next_event(max(1, int(remaining * 1000)))
+            if event is None:
+                return False
+            if self.is_input(event):
+                return True
+
+
+def _voluntary_switches(task_root: Path) -> int | None:
+    """Sum voluntary context switches (sleeps, hence wakeups) over all threads."""
+    total = 0
+    try:
+        tasks = list(task_root.iterdir())
+    except OSError:
+        return None
+    for task in tasks:
+        try:
+            with open(task / "status", encoding="ascii") as handle:
+                for line in handle:
+                    if line.startswith("voluntary_ctxt_switches:"):
+                        total += int(line.split()[1])
+                        break
+        except (OSError, ValueError):
+            continue  # the thread exited while we were reading
+    return total
+
+
+class ProcessLoad:
+    """CPU percentage and wakeups per second since the previous sample."""
+
+    def __init__(self, task_root: str = f"/proc/{os.getpid()}/task", clock=time.monotonic,
+                 cpu_clock=time.process_time):
+        self.task_root = Path(task_root)
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self._last = (clock(), cpu_clock(), _voluntary_switches(self.task_root))
+        self.latest = {"cpu_percent": None, "wakeups_per_s": None}
+
+    def sample(self, min_interval: float = 5.0) -> dict:
+        """Refresh the figures once ``min_interval`` has passed; return the latest."""
+        now = self.clock()
+        then, cpu_then, switches_then = self._last
+        elapsed = now - then
+        if elapsed < min_interval:
+            return self.latest
+        cpu = self.cpu_clock()
+        switches = _voluntary_switches(self.task_root)
+        self.latest = {
+            "cpu_percent": round(100 * (cpu - cpu_then) / elapsed, 1),
+            "wakeups_per_s": (
+                round((switches - switches_then) / elapsed, 1)
+                if switches is not None and switches_then is not None else None
+            ),
+        }
+        self._last = (now, cpu, switches)
+        return self.latest
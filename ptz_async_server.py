@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Bounded asyncio server core for the dashboard's :class:`Handler` routes.
+
+Connections are accepted and parsed on one event loop; route handlers run on
+a small fixed thread pool.  Select it with ``PTZPAD_SERVER=asyncio``.
+"""
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+MAX_HEADER = 64 * 1024
+MAX_BODY = 128 * 1024
+# Per-route concurrency; requests beyond a limit wait briefly, then get 503.
+ROUTE_LIMITS = {
+    "/api/cameras/discover": 1,
+    "/api/cameras/test": 4,
+    "/api/logs": 2,
+}
+# Long-lived responses (MJPEG previews) are exempt from the request timeout.  Each
+# holds a worker while it runs, so at most ``workers - 1`` may stream at once.
+STREAMING_SUFFIXES = ("/stream",)
+
+
+def _env_int(name, default):
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+class _LoopWriter:
+    """File-like writer that hands handler output to the event loop.
+
+    Each write waits for the transport to drain, so slow clients apply
+    back-pressure to the worker thread instead of buffering without bound.
+    """
+
+    def __init__(self, loop, writer):
+        self.loop = loop
+        self.writer = writer
+        self.written = 0
+        self.closed = False
+
+    async def _write(self, data):
+        self.writer.write(data)
+        await self.writer.drain()
+
+    def write(self, data):
+        if self.closed:
+            raise BrokenPipeError("client connection closed")
+        data = bytes(data)
+        future = asyncio.run_coroutine_threadsafe(self._write(data), self.loop)
+        try:
+            future.result()
+        except (ConnectionError, RuntimeError) as exc:
+            self.closed = True
+            raise BrokenPipeError(str(exc)) from exc
+        self.written += len(data)
+        return len(data)
+
+    def flush(self):
+        return
+
+
+def _handler_class(base):
+    class BufferedHandler(base):
+        """Run one parsed request through the threaded handler's routes."""
+
+        def __init__(self, request, wfile, client_address, server):
+            self.rfile = BytesIO(request)
+            self.wfile = wfile
+            self.client_address = client_address
+            self.server = server
+            self.close_connection = True
+            self.handle_one_request()
+
+    return BufferedHandler
+
+
+class AsyncDashboardServer:
+    """Serve ``handler`` routes with connection, route, and time limits."""
+
+    def __init__(
+        self,
+        address,
+        handler,
+        *,
+        max_connections=None,
+        workers=None,
+        request_timeout=15.0,
+        idle_timeout=30.0,
+        queue_timeout=2.0,
+        route_limits=None,
+        max_body=MAX_BODY,
+    ):
+        self.address = address
+        self.handler = _handler_class(handler)
+        self.max_connections = max_connections or _env_int("PTZPAD_MAX_CONNECTIONS", 64)
+        self.workers = workers or _env_int("PTZPAD_WORKERS", 8)
+        self.request_timeout = request_timeout
+        self.idle_timeout = idle_timeout
+        self.queue_timeout = queue_timeout
+        self.route_limits = dict(ROUTE_LIMITS if route_limits is None else route_limits)
+        self.max_body = max_body
+        self.server_address = address
+        self.connections = 0
+        self.streams = 0
+        self._pool = None
+        self._loop = None
+        self._server = None
+        self._routes = {}
+        self._ready = threading.Event()
+
+    async def _start(self):
+        self._loop = asyncio.get_running_loop()
+        self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="dashboard")
+        self._routes = {
+            path: asyncio.Semaphore(limit) for path, limit in self.route_limits.items()
+        }
+        self._server = await asyncio.start_server(
+            self._connection, *self.address, limit=MAX_HEADER
+        )
+        self.server_address = self._server.sockets[0].getsockname()[:2]
+        self._ready.set()
+
+    async def serve(self):
+        await self._start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            self._pool.shutdown(wait=False)
+
+    def serve_forever(self):
+        try:
+            asyncio.run(self.serve())
+        except asyncio.CancelledError:
+            pass
+
+    def start_background(self):
+        """Run on a daemon thread; returns once the socket is listening."""
+        thread = threading.Thread(target=self.serve_forever, name="dashboard-loop", daemon=True)
+        thread.start()
+        self._ready.wait(5)
+        return thread
+
+    def shutdown(self):
+        if self._loop and self._server:
+            self._loop.call_soon_threadsafe(self._server.close)
+            for task in asyncio.all_tasks(self._loop):
+                self._loop.call_soon_threadsafe(task.cancel)
+
+    @staticmethod
+    def _simple(writer, code, reason):
+        body = f'{{"error": "{reason.lower()}"}}'.encode()
+        writer.write(
+            f"HTTP/1.1 {code} {reason}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+        )
+
+    async def _connection(self, reader, writer):
+        if self.connections >= self.max_connections:
+            self._simple(writer, 503, "Service Unavailable")
+            writer.close()
+            return
+        self.connections += 1
+        try:
+            while await self._request(reader, writer):
+                pass
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                ConnectionError, ValueError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _request(self, reader, writer):
+        """Handle one request; return True to keep the connection open."""
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+        lines = head.decode("latin-1").split("\r\n")
+        length = 0
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-length":
+                try:
+                    length = int(value.strip())
+                except ValueError:
+                    length = 0
+        path = lines[0].split(" ")[1].partition("?")[0] if lines[0].count(" ") >= 2 else ""
+        body = b""  # oversized bodies are left unread; the handler answers 413 and closes
+        if 0 < length <= self.max_body:
+            body = await asyncio.wait_for(reader.readexactly(length), self.request_timeout)
+        streaming = path.endswith(STREAMING_SUFFIXES)
+        if streaming and self.streams >= max(1, self.workers - 1):
+            self._simple(writer, 503, "Service Unavailable")
+            return False
+        limiter = self._routes.get(path)
+        if limiter is not None:
+            try:
+                await asyncio.wait_for(limiter.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._simple(writer, 503, "Service Unavailable")
+                return False
+        output = _LoopWriter(self._loop, writer)
+        peer = writer.get_extra_info("peername") or ("", 0)
+        future = self._loop.run_in_executor(
+            self._pool, self._dispatch, head + body, output, peer[:2]
+        )
+        if limiter is not None:
+            future.add_done_callback(lambda _: limiter.release())
+        if streaming:
+            self.streams += 1
+            future.add_done_callback(self._stream_done)
+        timeout = None if streaming else self.request_timeout
+        try:
+            keep_alive = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            output.closed = True
+            if not output.written:
+                self._simple(writer, 504, "Gateway Timeout")
+            return False
+        await writer.drain()
+        return keep_alive and not output.closed
+
+    def _stream_done(self, _future):
+        self.streams -= 1
+
+    def _dispatch(self, request, output, client_address):
+        try:
+            handler = self.handler(request, output, client_address, self)
+        except BrokenPipeError:
+            return False
+        except Exception:  # mirror socketserver: log, answer if possible, close
+            logging.exception("dashboard request failed")
+            if not output.written:
+                try:
+                    output.write(
+                        b"HTTP/1.1 500 Internal Server Error\r\nContent-Length: 0\r\n"
+                        b"Connection: close\r\n\r\n"
+                    )
+                except BrokenPipeError:
+                    pass
+            return False
+        return not handler.close_connection
@@ -10,6 +10,32 @@ def config_path() -> Path:
     return Path(os.environ.get("PTZPAD_CONFIG", "~/.config/ptzpad/config.json")).expanduser()
 
 
+def _preset_count(value, what):
+    if not isinstance(value, int) or isinstance(value, bool) or not 1 <= value <= 99:
+        raise ValueError(f"invalid {what} presets")
+    return value
+
+
+def _deck_bindings(value, camera_count):
+    """Validate ``{serial: {"cameras": [1-based camera numbers]}}`` deck bindings."""
+    if not isinstance(value, dict) or len(value) > 16:
+        raise ValueError("streamdeck decks must be an object")
+    out = {}
+    for serial, binding in value.items():
+        cameras = binding.get("cameras") if isinstance(binding, dict) else None
+        if not isinstance(serial, str) or not 0 < len(serial.strip()) <= 64:
+            raise ValueError("invalid streamdeck deck serial")
+        if (
+            not isinstance(cameras, list)
+            or not cameras
+            or len(set(cameras)) != len(cameras)
+            or not all(isinstance(n, int) and not isinstance(n, bool) and 1 <= n <= camera_count for n in cameras)
+        ):
+            raise ValueError(f"invalid cameras for streamdeck deck {serial!r}")
+        out[serial.strip()] = {"cameras": cameras}
+    return out
+
+
 def _camera(value):
     if not isinstance(value, dict):
         raise ValueError("camera must be an object")
@@ -20,8 +46,11 @@ def _camera(value):
         raise ValueError("invalid camera host or protocol")
     if not isinstance(port, int) or not 1 <= port <= 65535:
         raise ValueError("invalid camera port")
-    return {"host": host, "protocol": proto, "port": port,
-            "name": str(value.get("name", host))[:80], "model": str(value.get("model", ""))[:80]}
+    out = {"host": host, "protocol": proto, "port": port,
+           "name": str(value.get("name", host))[:80], "model": str(value.get("model", ""))[:80]}
+    if value.get("presets") is not None:
+        out["presets"] = _preset_count(value["presets"], "camera")
+    return out
 
 
 def validate_camera(value):
@@ -46,6 +75,14 @@ def validate_config(value):
     if not isinstance(brightness, int) or isinstance(brightness, bool) or not 0 <= brightness <= 100:
         raise ValueError("invalid streamdeck brightness")
     out["streamdeck"] = {"enabled": enabled, "brightness": brightness}
+    if deck.get("presets") is not None:
+        out["streamdeck"]["presets"] = _preset_count(deck["presets"], "streamdeck")
+    if "camera_page" in deck:
+        if not isinstance(deck["camera_page"], bool):
+            raise ValueError("invalid streamdeck camera_page")
+        out["streamdeck"]["camera_page"] = deck["camera_page"]
+    if "decks" in deck:
+        out["streamdeck"]["decks"] = _deck_bindings(deck["decks"], len(out["cameras"]))
     controls = value.get("controls", {})
     if not isinstance(controls, dict):
         raise ValueError("controls must be an object")
@@ -1,27 +1,54 @@
 #!/usr/bin/env python3
 """Small, dependency-free LAN dashboard for ptzpad."""
+import gzip
+import hashlib
 import hmac
+import io
 import ipaddress
 import json
 import os
 import secrets
 import socket
-import struct
 import subprocess
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
+from email.utils import formatdate, parsedate_to_datetime
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlsplit
 
-import fcntl
-
-from ptz_config import load_config, save_config, validate_camera
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+from ptz_config import config_path, load_config, save_config, validate_camera
+from ptz_discovery import (
+    INTERFACES,
+    VISCA_VERSION,
+    DiscoveryInventory,
+    parse_visca_version,
+    read_arp_table,
+    scan_hosts,
+)
+from streamdeck_control import SnapshotClient
 
 TOKEN_FILE = Path(os.environ.get("PTZPAD_TOKEN_FILE", "~/.config/ptzpad/token")).expanduser()
 STATE_FILE = Path(os.environ.get("PTZPAD_STATE", "/run/ptzpad/status.json")).expanduser()
 MAX_BODY = 128 * 1024
+COMPRESS_MIN = 1024
+THUMBNAIL_SIZE = (320, 180)
+
+def _env_number(name, default, low, high):
+    try: return min(high, max(low, float(os.environ.get(name, default))))
+    except ValueError: return default
+
+SNAPSHOT_INTERVAL = _env_number("PTZPAD_SNAPSHOT_SECONDS", 2.0, 0.2, 60.0)
+PREVIEW_SIZE = (640, 360)
+PREVIEW_FPS = _env_number("PTZPAD_PREVIEW_FPS", 2.0, 0.2, 10.0)
+PREVIEW_VIEWERS = int(_env_number("PTZPAD_PREVIEW_VIEWERS", 4, 1, 32))
+PREVIEW_KEEPALIVE = 5.0
+MJPEG_BOUNDARY = "ptzpadframe"
 
 def token():
     try: return TOKEN_FILE.read_text().strip()
@@ -51,44 +78,55 @@ def probe(cam):
     except OSError: return "unreachable"
 
 
-VISCA_VERSION = b"\x81\x09\x00\x02\xff"
-RFC1918_NETWORKS = tuple(
-    ipaddress.ip_network(value)
-    for value in ("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16")
-)
+# Rewritten by every heartbeat; excluded from the status validator.
+VOLATILE_STATE_KEYS = ("heartbeat", "loop")
+
+
+def state_version(runtime):
+    """The parts of the bridge state a dashboard poll can observe changing.
+
+    Telemetry contributes only its decoded values, not poll times or RTTs.
+    """
+    stable = {key: value for key, value in runtime.items() if key not in VOLATILE_STATE_KEYS}
+    telemetry = stable.get("telemetry")
+    if isinstance(telemetry, dict):
+        stable["telemetry"] = {key: entry.get("values") if isinstance(entry, dict) else entry
+                               for key, entry in telemetry.items()}
+    return sorted((key, repr(value)) for key, value in stable.items())
+
+
+class ProbeCache:
+    """Camera reachability, probed again at most every ``ttl`` seconds."""
+
+    def __init__(self, ttl=5.0, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._key = None
+        self._at = 0.0
+        self._results = []
+
+    @staticmethod
+    def _camera_key(cameras):
+        return tuple((c["host"], c["protocol"], c["port"]) for c in cameras)
 
+    def cached(self, cameras):
+        """Fresh results for ``cameras``, or None when they must be probed."""
+        with self._lock:
+            if self._key == self._camera_key(cameras) and self.clock() - self._at < self.ttl:
+                return list(self._results)
+        return None
 
-def parse_visca_version(response):
-    """Extract standard VISCA version fields from a camera reply."""
-    for offset in range(max(0, len(response) - 9)):
-        frame = response[offset:]
-        if len(frame) >= 11 and frame[0] & 0xF0 == 0x90 and frame[1] == 0x50:
-            return {
-                "vendor_id": frame[2:4].hex(),
-                "model_id": frame[4:6].hex(),
-                "rom_version": frame[6:8].hex(),
-                "socket_number": frame[8:10].hex(),
-            }
-    return {}
+    def refresh(self, cameras):
+        results = [probe(camera) for camera in cameras]
+        with self._lock:
+            self._key, self._at, self._results = self._camera_key(cameras), self.clock(), results
+        return list(results)
 
 
 def local_interface_details():
     """Return RFC 1918 IPv4 addresses and networks attached to this host."""
-    details = set()
-    for _, interface_name in socket.if_nameindex():
-        request = struct.pack("256s", interface_name.encode()[:15])
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as ioctl_socket:
-                address_data = fcntl.ioctl(ioctl_socket, 0x8915, request)
-                netmask_data = fcntl.ioctl(ioctl_socket, 0x891B, request)
-            address = socket.inet_ntoa(address_data[20:24])
-            netmask = socket.inet_ntoa(netmask_data[20:24])
-            network = ipaddress.ip_interface(f"{address}/{netmask}").network
-        except (OSError, ValueError):
-            continue
-        if any(network.subnet_of(private) for private in RFC1918_NETWORKS):
-            details.add((ipaddress.ip_address(address), network))
-    return sorted(details, key=lambda item: int(item[0]))
+    return list(INTERFACES.private_details())
 
 
 def local_interface_networks():
@@ -138,8 +176,183 @@ def test_camera(cam, enforce_local=True):
     return result
 
 
+def thumbnail(data, size=THUMBNAIL_SIZE):
+    """Downscale a validated snapshot to a JPEG thumbnail; unchanged without Pillow."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return data
+    image = Image.open(io.BytesIO(data))
+    image.draft("RGB", size)
+    image = image.convert("RGB")
+    image.thumbnail(size)
+    output = io.BytesIO()
+    image.save(output, "JPEG", quality=80)
+    return output.getvalue()
+
+
+class SnapshotProxy:
+    """Fan dashboard thumbnail requests out from one fetcher per camera.
+
+    Each camera's web server is asked for a frame at most once per
+    ``interval`` however many browsers are polling; failures are cached for
+    the same interval so a dead camera is not hammered either.  A frame is
+    downscaled once, and only when its bytes change.
+    """
+
+    def __init__(self, interval=SNAPSHOT_INTERVAL, client_factory=SnapshotClient,
+                 shrink=thumbnail, clock=time.monotonic):
+        self.interval = interval
+        self.client_factory = client_factory
+        self.shrink = shrink
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._cameras = {}
+
+    def _entry(self, host):
+        with self._lock:
+            entry = self._cameras.get(host)
+            if entry is None:
+                entry = self._cameras[host] = {
+                    "lock": threading.Lock(), "client": self.client_factory(host),
+                    "checked": None, "frame": None, "error": None,
+                }
+            return entry
+
+    def get(self, host):
+        """Return ``(jpeg, etag, modified)`` for the camera's latest frame.
+
+        Raises ValueError or OSError when the last fetch within the interval
+        failed.
+        """
+        entry = self._entry(host)
+        with entry["lock"]:  # concurrent callers wait for one fetch
+            now = self.clock()
+            if entry["checked"] is None or now - entry["checked"] >= self.interval:
+                entry["checked"] = now
+                try:
+                    data = entry["client"].fetch()
+                except (ValueError, OSError) as exc:
+                    entry["error"] = exc
+                else:
+                    entry["error"] = None
+                    etag = '"' + hashlib.sha256(data).hexdigest()[:24] + '"'
+                    if entry["frame"] is None or entry["frame"][1] != etag:
+                        entry["frame"] = (self.shrink(data), etag, time.time())
+            if entry["error"] is not None:
+                raise entry["error"]
+            return entry["frame"]
+
+    def client(self, host):
+        """Return the camera's shared keep-alive client."""
+        return self._entry(host)["client"]
+
+    def close(self):
+        with self._lock:
+            entries, self._cameras = list(self._cameras.values()), {}
+        for entry in entries:
+            entry["client"].close()
+
+
+SNAPSHOTS = SnapshotProxy()
+PROBES = ProbeCache(_env_number("PTZPAD_PROBE_SECONDS", 5.0, 0.0, 60.0))
+
+
+class PreviewFeed:
+    """Latest MJPEG part for one camera, polled only while someone watches.
+
+    The poller downscales and frames each new snapshot once; every viewer
+    writes that same bytes object, so extra viewers cost no encoding.
+    """
+
+    def __init__(self, client, fps=PREVIEW_FPS, shrink=None):
+        self.client = client
+        self.period = 1 / fps
+        self.shrink = shrink or (lambda data: thumbnail(data, PREVIEW_SIZE))
+        self.viewers = 0
+        self.sequence = 0
+        self.part = None
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def subscribe(self):
+        with self._condition:
+            self.viewers += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll, name="preview", daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self):
+        with self._condition:
+            self.viewers -= 1
+
+    def wait(self, sequence, timeout=PREVIEW_KEEPALIVE):
+        """Return ``(sequence, part)`` once a part newer than ``sequence`` exists.
+
+        After ``timeout`` the current part is returned again, which lets the
+        caller notice a viewer that has gone away while the picture is still.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.sequence != sequence, timeout)
+            return self.sequence, self.part
+
+    def _poll(self):
+        previous = None
+        while True:
+            with self._condition:
+                if not self.viewers:
+                    self._thread = None  # paused until the next subscriber
+                    return
+            started = time.monotonic()
+            try:
+                data = self.client.fetch()
+            except (ValueError, OSError):
+                time.sleep(max(self.period, 1.0))
+                continue
+            if data != previous:
+                previous = data
+                frame = self.shrink(data)
+                part = (f"--{MJPEG_BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                        f"Content-Length: {len(frame)}\r\n\r\n").encode() + frame + b"\r\n"
+                with self._condition:
+                    self.part = part
+                    self.sequence += 1
+                    self._condition.notify_all()
+            time.sleep(max(0.0, self.period - (time.monotonic() - started)))
+
+
+class PreviewHub:
+    """One :class:`PreviewFeed` per camera host, with a global viewer cap."""
+
+    def __init__(self, max_viewers=PREVIEW_VIEWERS, client_for=SNAPSHOTS.client, **feed_options):
+        self.max_viewers = max_viewers
+        self.client_for = client_for
+        self.feed_options = feed_options
+        self._lock = threading.Lock()
+        self._feeds = {}
+
+    def subscribe(self, host):
+        """Return the host's feed with a viewer added, or None when full."""
+        with self._lock:
+            if sum(feed.viewers for feed in self._feeds.values()) >= self.max_viewers:
+                return None
+            feed = self._feeds.get(host)
+            if feed is None:
+                feed = self._feeds[host] = PreviewFeed(self.client_for(host), **self.feed_options)
+            feed.subscribe()
+            return feed
+
+    def unsubscribe(self, feed):
+        with self._lock:
+            feed.unsubscribe()
+
+
+PREVIEWS = PreviewHub()
+
+
 _scan_lock = threading.Lock()
 _last_scan = 0.0
+SCAN_COOLDOWN = 2.0
 
 
 def validate_discovery_subnet(subnet, networks=None):
@@ -154,39 +367,45 @@ def validate_discovery_subnet(subnet, networks=None):
     return network
 
 
-def discover_network(subnet, protocol, port):
+def discover_network(subnet, protocol, port, on_result=None, full=False):
+    """Scan one attached subnet, or every attached one for ``"all"``.
+
+    Fresh inventory entries are replayed without probing unless ``full``.
+    """
     global _last_scan
-    network = validate_discovery_subnet(subnet)
+    if str(subnet).strip().lower() == "all":
+        networks = [validate_discovery_subnet(value) for value in local_networks()]
+        if not networks:
+            raise ValueError("no directly attached private IPv4 network")
+    else:
+        networks = [validate_discovery_subnet(subnet)]
     if protocol not in ("tcp", "udp") or not 1 <= port <= 65535:
         raise ValueError("invalid protocol or port")
-    if time.monotonic() - _last_scan < 5 or not _scan_lock.acquire(blocking=False):
+    if time.monotonic() - _last_scan < SCAN_COOLDOWN or not _scan_lock.acquire(blocking=False):
         raise RuntimeError("scan already in progress")
     try:
         _last_scan = time.monotonic()
-        found = []
-        hosts = list(network.hosts())[:256]
-        def scan(host):
-            camera = {"host": str(host), "protocol": protocol, "port": port}
-            try:
-                result = test_camera(camera, enforce_local=False)
-                return dict(
-                    camera,
-                    reachability="reachable",
-                    response_hex=result.get("response_hex", ""),
-                    vendor_id=result.get("vendor_id", ""),
-                    model_id=result.get("model_id", ""),
-                    rom_version=result.get("rom_version", ""),
-                )
-            except (OSError, TimeoutError, ValueError):
-                return None
-
-        with ThreadPoolExecutor(max_workers=32) as pool:
-            for future in as_completed([pool.submit(scan, host) for host in hosts]):
-                result = future.result()
-                if result:
-                    found.append(result)
+        hosts = sorted(
+            {host for network in networks for host in list(network.hosts())[:256]},
+            key=int,
+        )
+        inventory = DiscoveryInventory()
+        arp = read_arp_table()
+        to_probe, found = (hosts, []) if full else inventory.plan(hosts, protocol, port, arp)
+        for camera in found:
+            if on_result: on_result(camera)
+        def annotate(camera):
+            result = inventory.record([camera["host"]], [camera], protocol, port, read_arp_table())[0]
+            found.append(result)
+            if on_result: on_result(result)
+        scan_hosts(to_probe, protocol, port, on_result=annotate, banner=True)
+        answered = {camera["host"] for camera in found}
+        inventory.record([host for host in to_probe if str(host) not in answered], [], protocol, port, arp)
+        try: inventory.save()
+        except OSError: pass
         return sorted(found, key=lambda camera: ipaddress.ip_address(camera["host"]))
     finally:
+        _last_scan = time.monotonic()
         _scan_lock.release()
 
 def joysticks():
@@ -213,7 +432,7 @@ HTML = r"""<!doctype html>
 body{max-width:1100px;margin:auto;padding:24px}h1{margin-bottom:4px}h2{font-size:17px}
 .grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(250px,1fr));gap:14px}
 .card{background:#172033;border:1px solid #29354d;border-radius:14px;padding:18px;margin:14px 0}
-.camera{display:grid;grid-template-columns:repeat(5,minmax(100px,1fr));gap:8px;padding:12px 0;border-bottom:1px solid #334155}.camera .actions,.camera .health,.camera .result{grid-column:1/-1}.ok{color:#63d6a0}.bad{color:#fb7185}
+.camera{display:grid;grid-template-columns:repeat(5,minmax(100px,1fr));gap:8px;padding:12px 0;border-bottom:1px solid #334155}.camera .actions,.camera .health,.camera .result,.camera .thumb{grid-column:1/-1}.camera .thumb{max-width:320px;border-radius:6px}.ok{color:#63d6a0}.bad{color:#fb7185}
 .muted{color:#9ca3af}.controls{display:flex;gap:8px;flex-wrap:wrap;align-items:end}
 button,input,select,textarea{box-sizing:border-box;padding:9px;border-radius:7px;border:1px solid #45536d;background:#0f172a;color:white}
 button{cursor:pointer;background:#2563eb}.danger{background:#9f1239}.secondary{background:#334155}label{color:#cbd5e1}label input,label select{display:block;width:100%;margin-top:4px}
@@ -225,8 +444,8 @@ pre{white-space:pre-wrap;max-height:380px;overflow:auto;background:#0b1020;paddi
 <section class="card"><h2>Stream Deck</h2><div id="streamdeck">—</div></section>
 <section class="card"><h2>Cameras</h2><p class="muted">Add, reorder, test, and edit cameras. Tests send only the read-only VISCA version inquiry.</p><div id="cameras"></div>
 <div class="controls"><button id="addCamera">Add camera</button><button id="save">Save changes</button><button class="secondary" id="reload">Discard edits</button></div></section>
-<section class="card"><h2>Tuning</h2><p class="muted">Saved tuning values are editable below. Bridge live values are shown in the Bridge card and may differ briefly while settings reload.</p><div class="controls"><label>Saved maximum speed<input id="maxSpeed" type="number" min="1" max="24"></label><label>Saved deadzone<input id="deadzone" type="number" min="0" max="0.5" step="0.01"></label><label>Saved zoom speed<input id="zoomSpeed" type="number" min="0" max="7"></label><label>Use Y for zoom-speed increase (instead of RB)<input id="yButtonZoomSpeedUp" type="checkbox"></label><label>Stream Deck brightness<input id="deckBrightness" type="number" min="0" max="100"></label><label>Stream Deck enabled<input id="deckEnabled" type="checkbox"></label></div></section>
-<section class="card"><h2>Discover cameras</h2><p class="muted">Scans at most one private /24 using bounded VISCA inquiries. No motion commands are sent.</p><div class="controls"><label>Subnet<input id="discoverSubnet" placeholder="192.168.1.0/24"></label><label>Protocol<select id="discoverProtocol"><option>tcp</option><option>udp</option></select></label><label>Port<input id="discoverPort" type="number" value="5678"></label><button id="discover">Discover</button></div><div id="discoverResults"></div></section>
+<section class="card"><h2>Tuning</h2><p class="muted">Saved tuning values are editable below. Bridge live values are shown in the Bridge card and may differ briefly while settings reload.</p><div class="controls"><label>Saved maximum speed<input id="maxSpeed" type="number" min="1" max="24"></label><label>Saved deadzone<input id="deadzone" type="number" min="0" max="0.5" step="0.01"></label><label>Saved zoom speed<input id="zoomSpeed" type="number" min="0" max="7"></label><label>Use Y for zoom-speed increase (instead of RB)<input id="yButtonZoomSpeedUp" type="checkbox"></label><label>Stream Deck brightness<input id="deckBrightness" type="number" min="0" max="100"></label><label>Stream Deck enabled<input id="deckEnabled" type="checkbox"></label><label>Stream Deck presets per camera<input id="deckPresets" type="number" min="1" max="99" placeholder="one page"></label><label>Stream Deck camera-select page<input id="deckCameraPage" type="checkbox"></label></div></section>
+<section class="card"><h2>Discover cameras</h2><p class="muted">Scans one private /24, or every attached one with <code>all</code>, using bounded VISCA inquiries. Results appear as cameras answer. No motion commands are sent.</p><div class="controls"><label>Subnet<input id="discoverSubnet" placeholder="192.168.1.0/24 or all"></label><label>Protocol<select id="discoverProtocol"><option>tcp</option><option>udp</option></select></label><label>Port<input id="discoverPort" type="number" value="5678"></label><label><input id="discoverFull" type="checkbox"> Full rescan</label><button id="discover">Discover</button></div><div id="discoverResults"></div></section>
 <section class="card"><h2>Logs</h2><div class="controls"><label>Lines<br><input id="lines" type="number" min="1" max="500" value="100"></label>
 <label>Level<br><select id="level"><option value="">All</option><option>ERROR</option><option>WARNING</option><option>INFO</option></select></label>
 <label>Search<br><input id="search"></label><button id="logs">Refresh</button></div><pre id="log"></pre></section>
@@ -234,64 +453,150 @@ pre{white-space:pre-wrap;max-height:380px;overflow:auto;background:#0b1020;paddi
 const $=id=>document.getElementById(id);
 let token=sessionStorage.ptzToken||prompt('Dashboard token');
 if(token)sessionStorage.ptzToken=token;
-let dirty=false,editGeneration=0;
+let dirty=false,editGeneration=0,deckBindings;
 function markDirty(){dirty=true;editGeneration++}
-async function api(url,options={}){const response=await fetch(url,{...options,headers:{Authorization:'Bearer '+token,'Content-Type':'application/json'}});if(!response.ok)throw new Error(await response.text());return response.json()}
+async function api(url,options={}){const response=await fetch(url,{cache:'no-cache',...options,headers:{Authorization:'Bearer '+token,'Content-Type':'application/json'}});if(!response.ok)throw new Error(await response.text());return response.json()}
 function text(tag,value,cls=''){const node=document.createElement(tag);node.textContent=value;if(cls)node.className=cls;return node}
 function field(label,key,value,type='text'){const wrap=document.createElement('label');wrap.textContent=label;const input=document.createElement('input');input.type=type;input.dataset.key=key;input.value=value??'';input.oninput=markDirty;wrap.append(input);return wrap}
-function cameraFromRow(row){const get=key=>row.querySelector('[data-key="'+key+'"]').value;return{name:get('name'),model:get('model'),host:get('host'),protocol:get('protocol'),port:Number(get('port'))}}
+function cameraFromRow(row){const get=key=>row.querySelector('[data-key="'+key+'"]').value;const camera={name:get('name'),model:get('model'),host:get('host'),protocol:get('protocol'),port:Number(get('port'))};if(get('presets'))camera.presets=Number(get('presets'));return camera}
 function cameraRow(camera){const row=document.createElement('div');row.className='camera';row.append(field('Name','name',camera.name),field('Model','model',camera.model),field('IP / host','host',camera.host));
-const protocol=document.createElement('select');protocol.dataset.key='protocol';for(const value of ['tcp','udp']){const option=document.createElement('option');option.value=value;option.textContent=value.toUpperCase();protocol.append(option)}protocol.value=camera.protocol||'tcp';protocol.onchange=markDirty;const protocolLabel=document.createElement('label');protocolLabel.textContent='Protocol';protocolLabel.append(protocol);row.append(protocolLabel,field('Port','port',camera.port||5678,'number'));
+const protocol=document.createElement('select');protocol.dataset.key='protocol';for(const value of ['tcp','udp']){const option=document.createElement('option');option.value=value;option.textContent=value.toUpperCase();protocol.append(option)}protocol.value=camera.protocol||'tcp';protocol.onchange=markDirty;const protocolLabel=document.createElement('label');protocolLabel.textContent='Protocol';protocolLabel.append(protocol);row.append(protocolLabel,field('Port','port',camera.port||5678,'number'),field('Deck presets','presets',camera.presets??'','number'));
 const actions=document.createElement('div');actions.className='actions controls';const health=text('span','Status unknown','health muted');const result=text('span','Not tested','result muted');
 function button(label,action,cls='secondary'){const node=document.createElement('button');node.textContent=label;node.className=cls;node.onclick=action;return node}
 actions.append(button('Test',async()=>{result.textContent='Testing…';try{const value=await api('/api/cameras/test',{method:'POST',body:JSON.stringify(cameraFromRow(row))});result.textContent='Reachable in '+value.latency_ms+' ms'+(value.model_id?' • model ID '+value.model_id:' • version inquiry unsupported');result.className='result ok'}catch(error){result.textContent='Test failed: '+error.message;result.className='result bad'}}));
 actions.append(button('Up',()=>{const previous=row.previousElementSibling;if(previous){row.parentNode.insertBefore(row,previous);markDirty()}}));
 actions.append(button('Down',()=>{const next=row.nextElementSibling;if(next){row.parentNode.insertBefore(next,row);markDirty()}}));
-actions.append(button('Remove',()=>{row.remove();markDirty()},'danger'));row.append(actions,health,result);return row}
+actions.append(button('Live preview',event=>livePreview(row,event.target)));actions.append(button('Remove',()=>{previews.get(row)?.abort();row.remove();markDirty()},'danger'));const thumb=document.createElement('img');thumb.className='thumb';thumb.alt='Latest camera snapshot';thumb.hidden=true;row.append(thumb,actions,health,result);return row}
+async function livePreview(row,button){const running=previews.get(row);if(running){running.abort();return}const index=[...$('cameras').children].indexOf(row);const controller=new AbortController();previews.set(row,controller);button.textContent='Stop preview';const image=row.querySelector('.thumb');try{const response=await fetch('/api/cameras/'+index+'/stream',{headers:{Authorization:'Bearer '+token},signal:controller.signal});if(!response.ok)throw new Error(await response.text());const reader=response.body.getReader();let buffer=new Uint8Array(0);for(;;){const chunk=await reader.read();if(chunk.done)break;const joined=new Uint8Array(buffer.length+chunk.value.length);joined.set(buffer);joined.set(chunk.value,buffer.length);buffer=joined;for(;;){const head=new TextDecoder().decode(buffer.subarray(0,Math.min(buffer.length,256)));const end=head.indexOf('\r\n\r\n');const length=end<0?null:/Content-Length: (\d+)/i.exec(head.slice(0,end));if(!length||buffer.length<end+4+Number(length[1]))break;const start=end+4,stop=start+Number(length[1]);const url=URL.createObjectURL(new Blob([buffer.slice(start,stop)],{type:'image/jpeg'}));if(image.src.startsWith('blob:'))URL.revokeObjectURL(image.src);image.src=url;image.dataset.etag='';image.hidden=false;buffer=buffer.slice(stop+2)}}}catch(error){if(error.name!=='AbortError')row.querySelector('.result').textContent='Preview failed: '+error.message}finally{previews.delete(row);button.textContent='Live preview'}}
+const previews=new Map();
+async function snapshot(row,index){if(previews.has(row))return;const image=row.querySelector('.thumb');try{const response=await fetch('/api/cameras/'+index+'/snapshot',{headers:{Authorization:'Bearer '+token},cache:'no-cache'});if(!response.ok)throw new Error(response.status);const etag=response.headers.get('ETag');if(etag&&etag===image.dataset.etag)return;const url=URL.createObjectURL(await response.blob());if(image.src.startsWith('blob:'))URL.revokeObjectURL(image.src);image.src=url;image.dataset.etag=etag||'';image.hidden=false}catch(error){image.hidden=true}}
 function addCamera(camera={name:'New camera',model:'',host:'',protocol:'tcp',port:5678}){$('cameras').append(cameraRow(camera));markDirty()}
-function renderConfig(config){$('cameras').replaceChildren(...config.cameras.map(cameraRow));$('maxSpeed').value=config.max_speed;$('deadzone').value=config.deadzone;$('zoomSpeed').value=config.zoom_speed;$('yButtonZoomSpeedUp').checked=config.controls?.y_button_zoom_speed_up??false;$('deckBrightness').value=config.streamdeck?.brightness??35;$('deckEnabled').checked=config.streamdeck?.enabled??true;dirty=false}
-function buildConfig(){return{cameras:[...$('cameras').children].map(cameraFromRow),max_speed:Number($('maxSpeed').value),deadzone:Number($('deadzone').value),zoom_speed:Number($('zoomSpeed').value),controls:{y_button_zoom_speed_up:$('yButtonZoomSpeedUp').checked},streamdeck:{enabled:$('deckEnabled').checked,brightness:Number($('deckBrightness').value)}}}
-function renderControllers(data){const items=[];if(data.state.controller?.connected)items.push('Active: '+data.state.controller.name+(data.state.controller.wireless?' (wireless)':''));for(const pad of data.controllers)items.push(pad.name);$('controller').replaceChildren(...(items.length?items:['No controller connected']).map(value=>text('div',value)));const d=data.state.streamdeck||{};const deckClass=!d.enabled?'muted':d.connected?'ok':'bad';const library=d.library_available==null?'unknown':d.library_available?'available':'unavailable';$('streamdeck').replaceChildren(text('div',(d.enabled?'Enabled':'Disabled')+' • '+(d.connected?'Connected':'Disconnected'),deckClass),text('div','Library '+library+' • Device '+(d.device||'—')+' • keys '+(d.key_count||0)+' • brightness '+(d.brightness??'—')),text('div','Last render '+(d.last_render_at?new Date(d.last_render_at*1000).toLocaleString():'—')+' • last event '+(d.last_event_at?new Date(d.last_event_at*1000).toLocaleString():'—')),text('div','Camera '+(d.camera_name||'—')+' • save armed '+(d.save_armed?'yes':'no')),text('div','Last error '+(d.last_error||'none'),d.last_error?'bad':'ok'))}
+function renderConfig(config){$('cameras').replaceChildren(...config.cameras.map(cameraRow));$('maxSpeed').value=config.max_speed;$('deadzone').value=config.deadzone;$('zoomSpeed').value=config.zoom_speed;$('yButtonZoomSpeedUp').checked=config.controls?.y_button_zoom_speed_up??false;$('deckBrightness').value=config.streamdeck?.brightness??35;$('deckEnabled').checked=config.streamdeck?.enabled??true;$('deckPresets').value=config.streamdeck?.presets??'';$('deckCameraPage').checked=config.streamdeck?.camera_page??false;deckBindings=config.streamdeck?.decks;dirty=false}
+function buildConfig(){return{cameras:[...$('cameras').children].map(cameraFromRow),max_speed:Number($('maxSpeed').value),deadzone:Number($('deadzone').value),zoom_speed:Number($('zoomSpeed').value),controls:{y_button_zoom_speed_up:$('yButtonZoomSpeedUp').checked},streamdeck:deckConfig()}}
+function deckConfig(){const deck={enabled:$('deckEnabled').checked,brightness:Number($('deckBrightness').value),camera_page:$('deckCameraPage').checked};if($('deckPresets').value)deck.presets=Number($('deckPresets').value);if(deckBindings)deck.decks=deckBindings;return deck}
+function renderControllers(data){const items=[];if(data.state.controller?.connected)items.push('Active: '+data.state.controller.name+(data.state.controller.wireless?' (wireless)':''));for(const pad of data.controllers)items.push(pad.name);$('controller').replaceChildren(...(items.length?items:['No controller connected']).map(value=>text('div',value)));const d=data.state.streamdeck||{};const deckClass=!d.enabled?'muted':d.connected?'ok':'bad';const library=d.library_available==null?'unknown':d.library_available?'available':'unavailable';$('streamdeck').replaceChildren(text('div',(d.enabled?'Enabled':'Disabled')+' • '+(d.connected?'Connected':'Disconnected'),deckClass),text('div','Library '+library+' • Device '+(d.device||'—')+' • keys '+(d.key_count||0)+' • brightness '+(d.brightness??'—')),text('div','Last render '+(d.last_render_at?new Date(d.last_render_at*1000).toLocaleString():'—')+' • last event '+(d.last_event_at?new Date(d.last_event_at*1000).toLocaleString():'—')),text('div','Render '+(d.render_ms??'—')+' ms • frames '+(d.frames_rendered||0)+' • coalesced '+(d.frames_skipped||0)),text('div','Thumbnail cache '+((d.thumbnail_cache?.bytes||0)/1048576).toFixed(1)+' MB in '+(d.thumbnail_cache?.entries||0)+' files • hit rate '+(d.thumbnail_cache?.hit_rate==null?'—':Math.round(d.thumbnail_cache.hit_rate*100)+'%')),text('div','Camera '+(d.camera_name||'—')+' • save armed '+(d.save_armed?'yes':'no')),...(d.decks?.length>1?d.decks:[]).map(k=>text('div','Deck '+k.id+(k.bound?' (bound)':'')+' • camera '+(k.camera_name||'—')+' • save armed '+(k.save_armed?'yes':'no')+' • render '+(k.render_ms??'—')+' ms')),text('div','Last error '+(d.last_error||'none'),d.last_error?'bad':'ok'))}
 async function loadConfig(force=false){const generation=editGeneration;if(dirty&&!force)return;const config=await api('/api/config');if(generation===editGeneration&&(force||!dirty))renderConfig(config)}
-async function refresh(){try{const data=await api('/api/status');const state=data.state;const input=state.input||{};const direction=input.zoom_direction??0;const protocol=input.protocol||'unknown';const triggerLine=input.lt==null?'Triggers unavailable':'Triggers LT '+input.lt+' RT '+input.rt+' • zoom direction '+direction+' (0 = commanded stop) • '+protocol.toUpperCase();const uptime=data.uptime==null?'unknown':Math.floor(data.uptime/3600)+'h';$('status').replaceChildren(text('div',data.hostname+' • '+(state.stale?'offline/stale':'online'),state.stale?'bad':'ok'),text('div','Host uptime '+uptime+' • load '+data.load.map(v=>v.toFixed(2)).join(' / ')),text('div','Live speed '+state.max_speed+' • live deadzone '+state.deadzone+' • live zoom '+state.zoom_speed),text('div',triggerLine,'muted'));renderControllers(data);if(!$('discoverSubnet').value&&data.local_networks.length)$('discoverSubnet').value=data.local_networks[0];await loadConfig();if(!dirty){[...$('cameras').children].forEach((row,index)=>{const value=data.cameras[index]?.reachability||'unknown';const health=row.querySelector('.health');health.textContent='Automatic status: '+value;health.className='health '+(value==='reachable'?'ok':value==='unreachable'?'bad':'muted')})}$('msg').textContent=dirty?'Connected • unsaved changes':'Connected'}catch(error){$('msg').textContent='Authentication or service error: '+error.message}}
+async function refresh(){try{const data=await api('/api/status');const state=data.state;const input=state.input||{};const direction=input.zoom_direction??0;const protocol=input.protocol||'unknown';const triggerLine=input.lt==null?'Triggers unavailable':'Triggers LT '+input.lt+' RT '+input.rt+' • zoom direction '+direction+' (0 = commanded stop) • '+protocol.toUpperCase();const uptime=data.uptime==null?'unknown':Math.floor(data.uptime/3600)+'h';$('status').replaceChildren(text('div',data.hostname+' • '+(state.stale?'offline/stale':'online'),state.stale?'bad':'ok'),text('div','Host uptime '+uptime+' • load '+data.load.map(v=>v.toFixed(2)).join(' / ')),text('div','Live speed '+state.max_speed+' • live deadzone '+state.deadzone+' • live zoom '+state.zoom_speed),text('div',triggerLine,'muted'));renderControllers(data);if(!$('discoverSubnet').value&&data.local_networks.length)$('discoverSubnet').value=data.local_networks[0];await loadConfig();if(!dirty){[...$('cameras').children].forEach((row,index)=>{const value=data.cameras[index]?.reachability||'unknown';const telemetry=Object.entries(data.cameras[index]?.telemetry||{}).map(([name,reading])=>name.replace('_mode','').replace('_',' ').toUpperCase()+' '+(typeof reading==='object'?Object.entries(reading).map(([axis,value])=>axis+' '+value).join(' '):reading)).join(' • ');const health=row.querySelector('.health');health.textContent='Automatic status: '+value+(telemetry?' • '+telemetry:'');health.className='health '+(value==='reachable'?'ok':value==='unreachable'?'bad':'muted');snapshot(row,index)})}$('msg').textContent=dirty?'Connected • unsaved changes':'Connected'}catch(error){$('msg').textContent='Authentication or service error: '+error.message}}
 async function save(){const generation=editGeneration;try{const saved=await api('/api/config',{method:'PUT',body:JSON.stringify(buildConfig())});if(generation===editGeneration){renderConfig(saved);$('msg').textContent='Configuration saved'}else{$('msg').textContent='Saved previous values • newer unsaved changes'}}catch(error){$('msg').textContent='Configuration rejected: '+error.message}}
 async function logs(){try{const query=new URLSearchParams({lines:$('lines').value,level:$('level').value,search:$('search').value});$('log').textContent=(await api('/api/logs?'+query)).text}catch(error){$('log').textContent='Log unavailable: '+error.message}}
-function renderDiscovery(results){const nodes=results.map(camera=>{const row=document.createElement('div');row.className='camera';row.append(text('div',camera.host+':'+camera.port+' • '+camera.protocol.toUpperCase()+(camera.model_id?' • model ID '+camera.model_id:'')));const add=document.createElement('button');add.textContent='Add camera';add.onclick=()=>addCamera({name:'Camera '+camera.host,model:camera.model_id||'',host:camera.host,protocol:camera.protocol,port:camera.port});row.append(add);return row});$('discoverResults').replaceChildren(text('p','Found '+results.length+' camera(s)'),...nodes)}
-async function discover(){const button=$('discover');button.disabled=true;$('discoverResults').textContent='Scanning…';try{const result=await api('/api/cameras/discover',{method:'POST',body:JSON.stringify({subnet:$('discoverSubnet').value,protocol:$('discoverProtocol').value,port:Number($('discoverPort').value)})});renderDiscovery(result.results)}catch(error){$('discoverResults').textContent='Discovery failed: '+error.message}finally{button.disabled=false}}
-for(const id of ['maxSpeed','deadzone','zoomSpeed','yButtonZoomSpeedUp','deckBrightness','deckEnabled'])$(id).oninput=markDirty;$('save').onclick=save;$('reload').onclick=()=>loadConfig(true);$('logs').onclick=logs;$('addCamera').onclick=()=>addCamera();$('discover').onclick=discover;refresh();logs();setInterval(refresh,5000);
+function discoveryRow(camera){const row=document.createElement('div');row.className='camera';row.append(text('div',camera.host+':'+camera.port+' • '+camera.protocol.toUpperCase()+' • '+camera.latency_ms+' ms'+(camera.model_name?' • '+camera.model_name:camera.model_id?' • model ID '+camera.model_id:'')+(camera.mac?' • '+camera.mac:'')+(camera.cached?' • remembered':'')));const add=document.createElement('button');add.textContent='Add camera';add.onclick=()=>addCamera({name:'Camera '+camera.host,model:camera.model_name||camera.model_id||'',host:camera.host,protocol:camera.protocol,port:camera.port});row.append(add);return row}
+function renderDiscovery(results,scanning=false){$('discoverResults').replaceChildren(text('p',(scanning?'Scanning… found ':'Found ')+results.length+' camera(s)'),...results.map(discoveryRow))}
+async function discover(){const button=$('discover');button.disabled=true;const found=[];$('discoverResults').textContent='Scanning…';try{const response=await fetch('/api/cameras/discover',{method:'POST',headers:{Authorization:'Bearer '+token,'Content-Type':'application/json'},body:JSON.stringify({subnet:$('discoverSubnet').value,protocol:$('discoverProtocol').value,port:Number($('discoverPort').value),full:$('discoverFull').checked,stream:true})});if(!response.ok)throw new Error(await response.text());const reader=response.body.getReader(),decoder=new TextDecoder();let buffer='';for(;;){const chunk=await reader.read();buffer+=decoder.decode(chunk.value||new Uint8Array(),{stream:!chunk.done});const lines=buffer.split('\n');buffer=lines.pop();for(const line of lines){if(!line)continue;const message=JSON.parse(line);if(message.error)throw new Error(message.error);if(message.result){found.push(message.result);renderDiscovery(found,true)}}if(chunk.done)break}renderDiscovery(found)}catch(error){$('discoverResults').textContent='Discovery failed: '+error.message}finally{button.disabled=false}}
+for(const id of ['maxSpeed','deadzone','zoomSpeed','yButtonZoomSpeedUp','deckBrightness','deckEnabled','deckPresets','deckCameraPage'])$(id).oninput=markDirty;$('save').onclick=save;$('reload').onclick=()=>loadConfig(true);$('logs').onclick=logs;$('addCamera').onclick=()=>addCamera();$('discover').onclick=discover;refresh();logs();setInterval(refresh,5000);
 </script></body></html>"""
 
+def precompress(raw):
+    """Return every encoding of a static body, computed once at startup."""
+    variants = {"identity": raw, "gzip": gzip.compress(raw, 9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(raw, quality=11)
+    return variants
+
+
+PAGE = precompress(HTML.encode())
+PAGE_ETAG = '"' + hashlib.sha256(PAGE["identity"]).hexdigest()[:32] + '"'
+
+
+def choose_encoding(header, available):
+    """Pick br, then gzip, then identity according to Accept-Encoding."""
+    accepted = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try: quality = float(params.strip()[2:])
+            except ValueError: quality = 0.0
+        if name: accepted[name.lower()] = quality
+    for encoding in ("br", "gzip"):
+        if encoding in available and accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+
+def version_etag(*parts):
+    """Build a strong validator from the versions of a response's inputs."""
+    return '"' + hashlib.sha256(repr(parts).encode()).hexdigest()[:24] + '"'
+
+
+def file_version(path):
+    try:
+        info = Path(path).stat()
+        return info.st_ino, info.st_mtime_ns, info.st_size
+    except OSError:
+        return None
+
+
 class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = 30  # idle keep-alive connections release their thread
     def _auth(self):
         supplied = self.headers.get("Authorization", "").removeprefix("Bearer ").strip()
         return hmac.compare_digest(supplied, TOKEN)
-    def _json(self, obj, code=200):
-        raw=json.dumps(obj).encode(); self.send_response(code); self.send_header("Content-Type","application/json"); self.send_header("Content-Length",str(len(raw))); self.send_header("Cache-Control","no-store"); self.send_header("X-Content-Type-Options","nosniff"); self.end_headers(); self.wfile.write(raw)
+    def _not_modified(self, etag):
+        """Answer 304 when If-None-Match names any encoding of ``etag``."""
+        if not etag: return False
+        base = etag.strip('"')
+        for tag in self.headers.get("If-None-Match", "").split(","):
+            tag = tag.strip().removeprefix("W/").strip('"')
+            if tag == "*" or tag.split("-", 1)[0] == base:
+                self.send_response(304); self.send_header("ETag", etag); self.send_header("Cache-Control", "private, no-cache"); self.end_headers()
+                return True
+        return False
+    def _send(self, variants, content_type, code=200, etag=None, headers=()):
+        encoding = choose_encoding(self.headers.get("Accept-Encoding", ""), variants)
+        raw = variants[encoding]
+        self.send_response(code); self.send_header("Content-Type", content_type); self.send_header("Content-Length", str(len(raw)))
+        if len(variants) > 1: self.send_header("Vary", "Accept-Encoding")
+        if encoding != "identity": self.send_header("Content-Encoding", encoding)
+        if etag: self.send_header("ETag", etag if encoding == "identity" else etag[:-1] + "-" + encoding + '"'); self.send_header("Cache-Control", "private, no-cache")
+        else: self.send_header("Cache-Control", "no-store")
+        if code >= 400: self.send_header("Connection", "close"); self.close_connection = True
+        for name, value in headers: self.send_header(name, value)
+        self.end_headers(); self.wfile.write(raw)
+    def _json(self, obj, code=200, etag=None):
+        raw = json.dumps(obj).encode()
+        variants = {"identity": raw}
+        if len(raw) >= COMPRESS_MIN: variants["gzip"] = gzip.compress(raw, 5, mtime=0)
+        self._send(variants, "application/json", code, etag, [("X-Content-Type-Options", "nosniff")])
     def _safe_origin(self):
         origin = self.headers.get("Origin")
         return not origin or urlsplit(origin).netloc == self.headers.get("Host", "")
     def do_GET(self):
         if self.path == "/" or self.path.startswith("/?"):
-            self.send_response(200); self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header(
-                "Content-Security-Policy",
-                "default-src 'self'; script-src 'unsafe-inline'; "
-                "style-src 'unsafe-inline'; object-src 'none'",
-            )
-            self.send_header("X-Frame-Options", "DENY"); self.send_header("Referrer-Policy", "no-referrer"); self.end_headers(); self.wfile.write(HTML.encode()); return
+            if self._not_modified(PAGE_ETAG): return
+            self._send(PAGE, "text/html; charset=utf-8", etag=PAGE_ETAG, headers=[
+                (
+                    "Content-Security-Policy",
+                    "default-src 'self'; script-src 'unsafe-inline'; img-src 'self' blob:; "
+                    "style-src 'unsafe-inline'; object-src 'none'",
+                ),
+                ("X-Frame-Options", "DENY"), ("Referrer-Policy", "no-referrer"),
+            ]); return
         if not self._auth() or not self._safe_origin(): self._json({"error":"unauthorized"},401); return
         path, _, query = self.path.partition("?")
         if path == "/api/health": self._json({"ok": True, "stale": state().get("stale", True)}); return
         if path == "/api/status":
             cfg = load_config()
             runtime = state()
+            controllers = joysticks()
+            networks = local_networks()
+            # The heartbeat, loop statistics, host load and uptime are left
+            # out, so polls of an unchanged bridge revalidate to 304; while
+            # reachability is cached that happens before any camera probe.
+            versions = (state_version(runtime), file_version(config_path()), controllers, networks)
+            reachability = PROBES.cached(cfg["cameras"]) or PROBES.refresh(cfg["cameras"])
+            etag = version_etag(*versions, reachability)
+            if self._not_modified(etag): return
             cameras = []
-            for camera in cfg["cameras"]:
+            for camera, reachable in zip(cfg["cameras"], reachability):
                 cameras.append(
                     dict(
                         camera,
-                        reachability=probe(camera),
+                        reachability=reachable,
                         send=runtime.get("camera_send", {}).get(camera["host"], {}),
+                        telemetry=runtime.get("telemetry", {}).get(
+                            f'{camera["host"]}:{camera["protocol"]}:{camera["port"]}', {}
+                        ).get("values", {}),
                     )
                 )
             self._json(
@@ -299,7 +604,7 @@ class Handler(BaseHTTPRequestHandler):
                     "state": runtime,
                     "cameras": cameras,
                     "controller": runtime.get("controller", {}),
-                    "controllers": joysticks(),
+                    "controllers": controllers,
                     "hostname": socket.gethostname(),
                     "load": os.getloadavg(),
                     "uptime": (
@@ -307,11 +612,19 @@ class Handler(BaseHTTPRequestHandler):
                         if os.path.exists("/proc/1")
                         else None
                     ),
-                    "local_networks": local_networks(),
-                }
+                    "local_networks": networks,
+                },
+                etag=etag,
             )
             return
-        if path == "/api/config": self._json(load_config()); return
+        if path.startswith("/api/cameras/") and path.endswith("/snapshot"):
+            self._snapshot(path.split("/")[3]); return
+        if path.startswith("/api/cameras/") and path.endswith("/stream"):
+            self._stream(path.split("/")[3]); return
+        if path == "/api/config":
+            etag = version_etag(file_version(config_path()))
+            if self._not_modified(etag): return
+            self._json(load_config(), etag=etag); return
         if path == "/api/logs":
             params={k: v[0] for k, v in parse_qs(query).items()}
             try: requested = int(params.get("lines", "100"))
@@ -326,6 +639,36 @@ class Handler(BaseHTTPRequestHandler):
             if search: out="\n".join(x for x in out.splitlines() if search.lower() in x.lower())
             self._json({"text":out[:100000]}); return
         self._json({"error":"not found"},404)
+    def _snapshot(self, index):
+        cameras = load_config()["cameras"]
+        if not index.isdigit() or int(index) >= len(cameras): self._json({"error":"not found"},404); return
+        try: data, etag, modified = SNAPSHOTS.get(cameras[int(index)]["host"])
+        except (ValueError, OSError) as exc: self._json({"error":f"snapshot unavailable: {exc}"},502); return
+        last_modified = formatdate(modified, usegmt=True)
+        if self._not_modified(etag): return
+        since = self.headers.get("If-Modified-Since")
+        if since and "If-None-Match" not in self.headers:
+            try: unchanged = int(modified) <= parsedate_to_datetime(since).timestamp()
+            except (TypeError, ValueError): unchanged = False
+            if unchanged:
+                self.send_response(304); self.send_header("Last-Modified", last_modified); self.send_header("Cache-Control", "private, no-cache"); self.end_headers(); return
+        self._send({"identity": data}, "image/jpeg", etag=etag, headers=[("Last-Modified", last_modified), ("X-Content-Type-Options", "nosniff")])
+    def _stream(self, index):
+        """Send ``multipart/x-mixed-replace`` JPEG parts until the viewer leaves."""
+        cameras = load_config()["cameras"]
+        if not index.isdigit() or int(index) >= len(cameras): self._json({"error":"not found"},404); return
+        feed = PREVIEWS.subscribe(cameras[int(index)]["host"])
+        if feed is None: self._json({"error":"too many preview viewers"},503); return
+        try:
+            self.send_response(200); self.send_header("Content-Type", f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}")
+            self.send_header("Cache-Control", "no-store"); self.send_header("X-Content-Type-Options", "nosniff")
+            self.send_header("Connection", "close"); self.close_connection = True; self.end_headers()
+            sequence = 0
+            while True:
+                sequence, part = feed.wait(sequence)
+                if part is not None: self.wfile.write(part); self.wfile.flush()
+        except (ConnectionError, TimeoutError): pass
+        finally: PREVIEWS.unsubscribe(feed)
     def do_PUT(self):
         if not self._auth() or not self._safe_origin(): self._json({"error":"unauthorized"},401); return
         if self.path != "/api/config": self._json({"error":"not found"},404); return
@@ -354,12 +697,35 @@ class Handler(BaseHTTPRequestHandler):
                 subnet = body.get("subnet", "")
                 protocol = body.get("protocol", "tcp")
                 port = int(body.get("port", 5678 if protocol == "tcp" else 1259))
-                self._json({"results": discover_network(subnet, protocol, port)}); return
+                full = bool(body.get("full"))
+                if body.get("stream"):
+                    self._discover_stream(subnet, protocol, port, full); return
+                self._json({"results": discover_network(subnet, protocol, port, full=full)}); return
         except (ValueError, OSError, TimeoutError, RuntimeError) as exc:
             self._json({"error": str(exc)}, 400); return
         self._json({"error": "not found"}, 404)
+    def _discover_stream(self, subnet, protocol, port, full=False):
+        """Write newline-delimited JSON results while the scan is running."""
+        started = []
+        def line(obj):
+            if not started:
+                self.send_response(200); self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Cache-Control", "no-store"); self.send_header("X-Content-Type-Options", "nosniff")
+                self.send_header("Connection", "close"); self.close_connection = True; self.end_headers()
+                started.append(True)
+            self.wfile.write(json.dumps(obj).encode() + b"\n"); self.wfile.flush()
+        try:
+            results = discover_network(subnet, protocol, port, on_result=lambda camera: line({"result": camera}), full=full)
+        except (ValueError, OSError, TimeoutError, RuntimeError) as exc:
+            if not started: raise
+            line({"error": str(exc)}); return
+        line({"done": True, "count": len(results)})
     def log_message(self,*args): pass
 
 def main():
-    host=os.environ.get("PTZPAD_BIND","0.0.0.0"); port=int(os.environ.get("PTZPAD_PORT","8080")); ThreadingHTTPServer((host,port),Handler).serve_forever()
+    host=os.environ.get("PTZPAD_BIND","0.0.0.0"); port=int(os.environ.get("PTZPAD_PORT","8080"))
+    if os.environ.get("PTZPAD_SERVER", "threading").lower() == "asyncio":
+        from ptz_async_server import AsyncDashboardServer
+        AsyncDashboardServer((host, port), Handler, max_body=MAX_BODY).serve_forever(); return
+    ThreadingHTTPServer((host,port),Handler).serve_forever()
 if __name__ == "__main__": main()
@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""Read-only VISCA camera discovery using non-blocking asyncio probes.
+
+Probes only send the VISCA version inquiry; they never move a camera.
+Callers own subnet validation and rate limiting.
+"""
+import asyncio
+import ipaddress
+import json
+import os
+import re
+import socket
+import struct
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import fcntl
+
+VISCA_VERSION = b"\x81\x09\x00\x02\xff"
+SCAN_CONCURRENCY = 256
+REPLY_TIMEOUT = 0.4
+FOUND_TTL = 600.0
+ABSENT_TTL = 60.0
+# VISCA vendor IDs from version inquiry replies.  Model names are keyed by
+# (vendor_id, model_id) and optionally rom_version; extend with models.json.
+VENDOR_NAMES = {"0001": "Sony"}
+MODEL_NAMES = {}
+HTTP_FIELDS = ("http_server", "http_title")
+RFC1918_NETWORKS = tuple(
+    ipaddress.ip_network(value)
+    for value in ("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16")
+)
+SIOCGIFADDR = 0x8915
+SIOCGIFNETMASK = 0x891B
+SIOCGIFHWADDR = 0x8927
+RTMGRP_LINK = 0x01
+RTMGRP_IPV4_IFADDR = 0x10
+# RTM_NEWLINK, RTM_DELLINK, RTM_NEWADDR, RTM_DELADDR
+NETLINK_CHANGES = {16, 17, 20, 21}
+
+
+def parse_visca_version(response):
+    """Extract standard VISCA version fields from a camera reply."""
+    for offset in range(max(0, len(response) - 9)):
+        frame = response[offset:]
+        if len(frame) >= 11 and frame[0] & 0xF0 == 0x90 and frame[1] == 0x50:
+            return {
+                "vendor_id": frame[2:4].hex(),
+                "model_id": frame[4:6].hex(),
+                "rom_version": frame[6:8].hex(),
+                "socket_number": frame[8:10].hex(),
+            }
+    return {}
+
+
+@dataclass(frozen=True)
+class Interface:
+    name: str
+    address: ipaddress.IPv4Address
+    network: ipaddress.IPv4Network
+    mac: str = ""
+
+    @property
+    def private(self):
+        return any(self.network.subnet_of(private) for private in RFC1918_NETWORKS)
+
+
+def read_interfaces():
+    """Query IPv4 address, netmask, and MAC for every interface."""
+    interfaces = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as ioctl_socket:
+        for _, interface_name in socket.if_nameindex():
+            request = struct.pack("256s", interface_name.encode()[:15])
+            try:
+                address_data = fcntl.ioctl(ioctl_socket, SIOCGIFADDR, request)
+                netmask_data = fcntl.ioctl(ioctl_socket, SIOCGIFNETMASK, request)
+                address = socket.inet_ntoa(address_data[20:24])
+                netmask = socket.inet_ntoa(netmask_data[20:24])
+                network = ipaddress.ip_interface(f"{address}/{netmask}").network
+            except (OSError, ValueError):
+                continue
+            try:
+                hardware = fcntl.ioctl(ioctl_socket, SIOCGIFHWADDR, request)[18:24]
+                mac = ":".join(f"{value:02x}" for value in hardware)
+            except OSError:
+                mac = ""
+            interfaces.append(
+                Interface(interface_name, ipaddress.ip_address(address), network, mac)
+            )
+    return interfaces
+
+
+class InterfaceTable:
+    """In-memory interface table refreshed on netlink address changes.
+
+    Reads are a timestamp check and a cached tuple.  A netlink listener
+    invalidates the table on RTM_NEWADDR/RTM_DELADDR and link changes; the
+    TTL bounds staleness where netlink is unavailable.
+    """
+
+    def __init__(self, ttl=30.0, reader=read_interfaces, clock=time.monotonic, watch=True):
+        self.ttl = ttl
+        self.reader = reader
+        self.clock = clock
+        self.watch = watch
+        self._lock = threading.Lock()
+        self._entries = None
+        self._private = ()
+        self._expires = 0.0
+        self._watcher = None
+
+    def entries(self):
+        entries = self._entries
+        if entries is not None and self.clock() < self._expires:
+            return entries
+        with self._lock:
+            if self._entries is None or self.clock() >= self._expires:
+                entries = tuple(self.reader())
+                self._private = tuple(
+                    sorted(
+                        {(entry.address, entry.network) for entry in entries if entry.private},
+                        key=lambda item: int(item[0]),
+                    )
+                )
+                self._entries = entries
+                self._expires = self.clock() + self.ttl
+            if self.watch and self._watcher is None:
+                self._watcher = threading.Thread(
+                    target=self._watch, name="netlink", daemon=True
+                )
+                self._watcher.start()
+            return self._entries
+
+    def private_details(self):
+        """Return sorted ``(address, network)`` pairs for RFC 1918 interfaces."""
+        self.entries()
+        return self._private
+
+    def invalidate(self):
+        self._expires = 0.0
+
+    def _watch(self):
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            sock.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR))
+        except (AttributeError, OSError):
+            return  # TTL refresh only
+        with sock:
+            while True:
+                try:
+                    data = sock.recv(65536)
+                except OSError:
+                    self.invalidate()
+                    return
+                offset = 0
+                while offset + 16 <= len(data):
+                    length, message_type = struct.unpack_from("=LH", data, offset)
+                    if message_type in NETLINK_CHANGES:
+                        self.invalidate()
+                        break
+                    if length < 16:
+                        break
+                    offset += (length + 3) & ~3
+
+
+INTERFACES = InterfaceTable()
+
+
+class RttEstimator:
+    """Smoothed LAN round-trip estimate used to shorten probe timeouts.
+
+    Follows the RFC 6298 SRTT/RTTVAR update; refused connections count as
+    samples because an RST arrives after exactly one LAN round trip.
+    """
+
+    def __init__(self, initial=0.5, minimum=0.15, maximum=1.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.initial = initial
+        self.srtt = None
+        self.rttvar = None
+        self.samples = 0
+
+    def observe(self, sample):
+        sample = max(0.0, float(sample))
+        if self.srtt is None:
+            self.srtt, self.rttvar = sample, sample / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - sample)
+            self.srtt = 0.875 * self.srtt + 0.125 * sample
+        self.samples += 1
+
+    @property
+    def timeout(self):
+        if self.srtt is None:
+            return self.initial
+        return max(self.minimum, min(self.maximum, self.srtt + 4 * self.rttvar))
+
+
+def _result(host, protocol, port, response, latency):
+    result = {
+        "host": str(host),
+        "protocol": protocol,
+        "port": port,
+        "reachability": "reachable",
+        "latency_ms": round(latency * 1000, 1),
+        "response_hex": response.hex(),
+        "vendor_id": "",
+        "model_id": "",
+        "rom_version": "",
+    }
+    version = parse_visca_version(response)
+    version.pop("socket_number", None)
+    result.update(version)
+    return result
+
+
+async def _within(awaitable, started, rtt):
+    """Await with a deadline that follows the live RTT estimate."""
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            remaining = started + rtt.timeout - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError
+            done, _ = await asyncio.wait({task}, timeout=min(remaining, 0.05))
+            if done:
+                return task.result()
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+async def _probe_tcp(host, port, rtt, semaphore):
+    async with semaphore:
+        started = time.monotonic()
+        try:
+            reader, writer = await _within(
+                asyncio.open_connection(str(host), port), started, rtt
+            )
+        except ConnectionRefusedError:
+            rtt.observe(time.monotonic() - started)
+            return None
+        except (OSError, asyncio.TimeoutError):
+            return None
+        latency = time.monotonic() - started
+        rtt.observe(latency)
+        response = b""
+        try:
+            writer.write(VISCA_VERSION)
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(1024), REPLY_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+        return _result(host, "tcp", port, response, latency)
+
+
+class _UdpCollector(asyncio.DatagramProtocol):
+    def __init__(self, sent, rtt, results):
+        self.sent = sent
+        self.rtt = rtt
+        self.results = results
+
+    def datagram_received(self, data, addr):
+        started = self.sent.pop(addr[0], None)
+        if started is None:
+            return
+        latency = time.monotonic() - started
+        self.rtt.observe(latency)
+        self.results.put_nowait(_result(addr[0], "udp", addr[1], data, latency))
+
+    def error_received(self, exc):
+        return
+
+
+async def _scan_udp(hosts, port, rtt, results):
+    """Send every inquiry from one socket, then collect replies by source."""
+    loop = asyncio.get_running_loop()
+    sent = {}
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _UdpCollector(sent, rtt, results), family=socket.AF_INET
+    )
+    try:
+        for host in hosts:
+            sent[str(host)] = time.monotonic()
+            transport.sendto(VISCA_VERSION, (str(host), port))
+        last_send = time.monotonic()
+        while sent and time.monotonic() - last_send < rtt.timeout:
+            await asyncio.sleep(0.02)
+    finally:
+        transport.close()
+
+
+class _BannerQueue(asyncio.Queue):
+    """Result queue that adds HTTP banner fields before publishing."""
+
+    def __init__(self):
+        super().__init__()
+        self.pending = set()
+
+    def put_nowait(self, result):
+        task = asyncio.ensure_future(self._enrich(result))
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    async def _enrich(self, result):
+        result.update(await http_banner(result["host"]))
+        super().put_nowait(result)
+
+
+async def scan(
+    hosts, protocol, port, *, concurrency=SCAN_CONCURRENCY, rtt=None, banner=False
+):
+    """Yield discovered cameras as replies arrive.
+
+    With ``banner`` set, each answering camera also gets one ``GET /`` so its
+    web server banner can help identify the model.
+    """
+    if protocol not in ("tcp", "udp") or not 1 <= port <= 65535:
+        raise ValueError("invalid protocol or port")
+    rtt = rtt or RttEstimator()
+    results = _BannerQueue() if banner else asyncio.Queue()
+    if protocol == "udp":
+        producer = asyncio.ensure_future(_scan_udp(hosts, port, rtt, results))
+    else:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def probe(host):
+            result = await _probe_tcp(host, port, rtt, semaphore)
+            if result:
+                results.put_nowait(result)
+
+        producer = asyncio.ensure_future(
+            asyncio.gather(*(probe(host) for host in hosts))
+        )
+    if banner:
+        scanning = producer
+
+        async def drain_banners():
+            await scanning
+            while results.pending:
+                await asyncio.wait(set(results.pending))
+
+        producer = asyncio.ensure_future(drain_banners())
+    try:
+        while not producer.done() or not results.empty():
+            getter = asyncio.ensure_future(results.get())
+            await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+        producer.result()
+    finally:
+        if not producer.done():
+            producer.cancel()
+
+
+def scan_hosts(hosts, protocol, port, on_result=None, **options):
+    """Run :func:`scan` to completion, reporting each camera as it is found."""
+
+    async def collect():
+        found = []
+        async for result in scan(hosts, protocol, port, **options):
+            found.append(result)
+            if on_result:
+                on_result(result)
+        return found
+
+    found = asyncio.run(collect())
+    return sorted(found, key=lambda camera: ipaddress.ip_address(camera["host"]))
+
+
+def inventory_path():
+    return Path(
+        os.environ.get("PTZPAD_DISCOVERY", "~/.cache/ptzpad/discovery.json")
+    ).expanduser()
+
+
+def read_arp_table(path="/proc/net/arp"):
+    """Return complete IPv4 neighbour entries as ``{address: mac}``."""
+    table = {}
+    try:
+        lines = Path(path).read_text().splitlines()[1:]
+    except OSError:
+        return table
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 4 or fields[2] == "0x0" or fields[3] == "00:00:00:00:00:00":
+            continue
+        table[fields[0]] = fields[3].lower()
+    return table
+
+
+def model_names(path=None):
+    """Return the built-in model table merged with an optional JSON file."""
+    names = dict(MODEL_NAMES)
+    path = Path(path or os.environ.get("PTZPAD_MODELS", "~/.config/ptzpad/models.json")).expanduser()
+    try:
+        extra = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return names
+    if isinstance(extra, dict):
+        for key, value in extra.items():
+            names[tuple(str(key).lower().split(":"))] = str(value)[:80]
+    return names
+
+
+def describe_model(fingerprint, names=None):
+    """Map VISCA IDs, then an HTTP banner, then the vendor to a model name."""
+    names = MODEL_NAMES if names is None else names
+    vendor = fingerprint.get("vendor_id", "")
+    model = fingerprint.get("model_id", "")
+    rom = fingerprint.get("rom_version", "")
+    for key in ((vendor, model, rom), (vendor, model)):
+        if key in names:
+            return names[key]
+    banner = fingerprint.get("http_title") or fingerprint.get("http_server")
+    if banner:
+        return banner[:80]
+    if vendor in VENDOR_NAMES:
+        return f"{VENDOR_NAMES[vendor]} model {model}".strip()
+    return ""
+
+
+async def http_banner(host, port=80, timeout=0.5):
+    """Fetch ``/`` once and return the Server header and page title."""
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return {}
+    try:
+        writer.write(f"GET / HTTP/1.0\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        raw = await asyncio.wait_for(reader.read(16384), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return {}
+    finally:
+        writer.close()
+    text = raw.decode("latin-1")
+    banner = {}
+    server = re.search(r"^server:\s*(.+?)\s*$", text, re.IGNORECASE | re.MULTILINE)
+    title = re.search(r"<title[^>]*>\s*(.*?)\s*</title>", text, re.IGNORECASE | re.DOTALL)
+    if server:
+        banner["http_server"] = server.group(1)[:80]
+    if title and title.group(1):
+        banner["http_title"] = " ".join(title.group(1).split())[:80]
+    return banner
+
+
+class DiscoveryInventory:
+    """Persistent record of probed hosts, keyed by endpoint and neighbour MAC.
+
+    Fresh answers are replayed without probing; hosts that did not answer are
+    skipped for a shorter period.  A changed MAC always forces a re-probe.
+    """
+
+    def __init__(self, path=None, clock=time.time):
+        self.path = Path(path or inventory_path())
+        self.clock = clock
+        try:
+            data = json.loads(self.path.read_text())
+            self.records = data.get("hosts", {}) if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            self.records = {}
+
+    @staticmethod
+    def key(host, protocol, port):
+        return f"{protocol}:{host}:{port}"
+
+    def plan(self, hosts, protocol, port, arp=None):
+        """Split hosts into ``(to_probe, cached_results)``."""
+        arp = {} if arp is None else arp
+        now = self.clock()
+        probe, cached = [], []
+        for host in hosts:
+            record = self.records.get(self.key(host, protocol, port))
+            ttl = FOUND_TTL if record and record.get("present") else ABSENT_TTL
+            mac = arp.get(str(host))
+            changed = bool(record and mac and record.get("mac") and mac != record["mac"])
+            if record is None or changed or now - record.get("last_probe", 0) >= ttl:
+                probe.append(host)
+            elif record.get("present"):
+                cached.append(dict(record["result"], cached=True))
+        return probe, cached
+
+    def record(self, probed, results, protocol, port, arp=None):
+        """Store probe outcomes; returns results annotated with inventory data."""
+        arp = {} if arp is None else arp
+        names = model_names()
+        now = self.clock()
+        by_host = {camera["host"]: camera for camera in results}
+        annotated = []
+        for host in map(str, probed):
+            key = self.key(host, protocol, port)
+            previous = self.records.get(key, {})
+            mac = arp.get(host) or previous.get("mac", "")
+            camera = by_host.get(host)
+            if camera is None:
+                self.records[key] = dict(previous, host=host, mac=mac, present=False, last_probe=now)
+                continue
+            moved = self._pop_moved(mac, key) if mac else {}
+            fingerprint = {
+                name: camera.get(name, "")
+                for name in ("vendor_id", "model_id", "rom_version")
+            }
+            banner = {name: camera[name] for name in HTTP_FIELDS if camera.get(name)}
+            if not banner:
+                banner = {
+                    name: value
+                    for name, value in previous.get("fingerprint", {}).items()
+                    if name in HTTP_FIELDS
+                }
+            fingerprint.update(banner)
+            result = dict(
+                camera,
+                mac=mac,
+                model_name=describe_model(fingerprint, names),
+                first_seen=moved.get("first_seen") or previous.get("first_seen") or now,
+                last_seen=now,
+                cached=False,
+            )
+            self.records[key] = {
+                "host": host,
+                "mac": mac,
+                "present": True,
+                "first_seen": result["first_seen"],
+                "last_seen": now,
+                "last_probe": now,
+                "fingerprint": fingerprint,
+                "result": result,
+            }
+            annotated.append(result)
+        return annotated
+
+    def _pop_moved(self, mac, key):
+        for other, record in list(self.records.items()):
+            if other != key and record.get("mac") == mac and record.get("present"):
+                return self.records.pop(other)
+        return {}
+
+    def save(self):
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".discovery.", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"hosts": self.records}, handle)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        finally:
+            try: os.unlink(tmp)
+            except FileNotFoundError: pass
@@ -51,14 +51,16 @@ import pygame
 import signal
 import socket
 import time
-import json
 import queue
 from pathlib import Path
 from ptz_config import load_config
-from zoom_control import ZoomCommandState, next_zoom_command
+from axis_scheduler import NEUTRAL_MOVE, AxisBank, AxisSpec
+from visca_codec import ViscaCodec
+from power_save import IDLE_LOOP_MS, IDLE_PUBLISH_SECONDS, IdlePolicy, IdleWaiter, ProcessLoad
+from bridge_split import SplitBridge, apply_realtime, realtime_settings, worker_cpus, write_state
 from input_control import (
     ButtonEdges,
-    MotionState,
+    InputSnapshot,
     ZoomTriggerState,
     controller_layout,
     resolve_zoom_direction,
@@ -77,6 +79,7 @@ from streamdeck_control import (
     StreamDeckController,
     resolve_deck_action,
 )
+from visca_telemetry import TelemetryService
 
 # ---- CONFIG ---------------------------------------------------------------
 def parse_cams(status: OledStatus | None = None) -> list[tuple[str, str, int]]:
@@ -147,12 +150,22 @@ def parse_cams(status: OledStatus | None = None) -> list[tuple[str, str, int]]:
             status.error("PTZ_CAMS invalid")
     return cams
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
-status_display = OledStatus()
+SPLIT = os.environ.get("PTZPAD_SPLIT", "").lower() in ("1", "true", "yes")
+RT_CPU, RT_PRIORITY = realtime_settings()
+_bridge = None
+if SPLIT:
+    # Deck, OLED, telemetry and status.json live in the worker; see bridge_split.
+    _bridge = SplitBridge(Path(os.environ["XDG_RUNTIME_DIR"]) / "ptzpad-bridge.shm", worker_cpus(RT_CPU))
+    status_display = _bridge.proxy("oled")
+else:
+    status_display = OledStatus()
 status_display.boot("Parsing cameras...")
 
 _cfg = load_config()
 CAMS = [(c["host"], c["protocol"], c["port"]) for c in _cfg["cameras"]]
 CAMERA_NAMES = [c.get("name") or c["host"] for c in _cfg["cameras"]]
+CAMERA_PRESETS = [c.get("presets") for c in _cfg["cameras"]]
+DECK_GROUPS = {serial: [n - 1 for n in deck["cameras"]] for serial, deck in _cfg["streamdeck"].get("decks", {}).items()}
 MAX_SPEED = 0x18                 # 0x01 (slow) ... 0x18 (fast)
 DEADZONE = 0.15                 # stick slack
 FOCUS_DEADZONE = 0.20           # left stick focus deadzone
@@ -165,6 +178,11 @@ LOOP_MS = 50                    # command period (ms)
 DEBUG_INPUT_RAW = os.environ.get("PTZPAD_DEBUG_INPUT", "")
 DEBUG_INPUT = DEBUG_INPUT_RAW.lower() in ("1", "true", "yes")
 DEBUG_INPUT_INTERVAL = 0.25     # seconds between debug samples
+AXIS_TABLE = {
+    "move": AxisSpec(neutral=NEUTRAL_MOVE, initial=None, stop_packets={"udp": UDP_STOP_PACKETS}),
+    "focus": AxisSpec(stop_packets={"udp": UDP_STOP_PACKETS}),
+    "zoom": AxisSpec(stop_packets={"udp": ZOOM_STOP_PACKETS, "tcp": ZOOM_STOP_PACKETS}),
+}
 # ---------------------------------------------------------------------------
 
 running = True
@@ -180,33 +198,125 @@ _state_path = Path(os.environ.get("PTZPAD_STATE", "/run/ptzpad/status.json"))
 _last_state_write = 0.0
 _camera_send = {}
 _input_telemetry = {"lt": None, "rt": None, "zoom_value": None, "zoom_direction": 0, "protocol": None}
-_deck_actions = queue.Queue()
+
+
+_idle = IdlePolicy()
+
+
+def wake_idle_loop() -> None:
+    """End an idle loop's wait for input; safe to call from any thread."""
+    if _idle.idle:
+        try:
+            pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        except pygame.error:
+            pass                # the loop still sees it within IDLE_LOOP_MS
+
+
+class _WakingQueue(queue.Queue):
+    """Deck action queue that also ends an idle loop's wait for input."""
+
+    def _put(self, item):
+        super()._put(item)
+        wake_idle_loop()
+
+
+if _bridge:
+    _bridge.on_action = wake_idle_loop
+_deck_actions = _bridge or _WakingQueue()
+_load = ProcessLoad()
+_loop_stats = {"rate_hz": 0.0, "target_hz": 1000 / LOOP_MS, "overruns": 0, "worst_ms": 0.0,
+               "idle": False, "cpu_percent": None, "wakeups_per_s": None}
+_loop_tick_at = None
 _streamdeck = None
-_preset_save_armed = False
+_telemetry = None
+_deck_armed = {}                # deck serial -> Save armed on that deck
+_deck_selection = {}            # bound deck serial -> selected camera index
 
 
 def publish_state(force=False):
     global _last_state_write
     now = time.time()
-    if not force and now - _last_state_write < 1:
+    if not force and now - _last_state_write < (IDLE_PUBLISH_SECONDS if _idle.idle else 1):
         return
+    _loop_stats.update(_load.sample())
     payload = {"service": "running", "started": _started, "heartbeat": now,
                "active_camera": cur, "controller": {"name": js.get_name() if js else "",
                "connected": controller_connected, "wireless": bluetooth_linked},
                "max_speed": max_speed, "deadzone": deadzone, "zoom_speed": zoom_speed,
-               "camera_send": _camera_send, "input": _input_telemetry,
-               "streamdeck": _streamdeck.snapshot() if _streamdeck else {"enabled": False}}
-    try:
-        _state_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
-        tmp = _state_path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(payload), encoding="utf-8")
-        os.replace(tmp, _state_path)
+               "camera_send": _camera_send, "input": _input_telemetry, "loop": dict(_loop_stats)}
+    cameras = [
+        {"name": _camera_label(index), "host": host, "protocol": proto, "port": port}
+        for index, (host, proto, port) in enumerate(CAMS)
+    ]
+    if _bridge:
+        # The worker adds the deck and telemetry snapshots and writes the file.
+        _bridge.publish({**payload, "split": {"dropped": _bridge.dropped}}, cameras)
+        _last_state_write = now
+        return
+    payload["streamdeck"] = _streamdeck.snapshot() if _streamdeck else {"enabled": False}
+    payload["telemetry"] = _telemetry.snapshot() if _telemetry else {}
+    status_display.set_state({**payload, "cameras": cameras})
+    if write_state(_state_path, payload):
         _last_state_write = now
-    except OSError:
-        pass
 bluetooth_linked = False
 
 
+def set_power_save(idle: bool) -> None:
+    """Enter or leave idle: slow the loop and pause telemetry and OLED keepalives."""
+    _loop_stats["idle"] = idle
+    _loop_stats["target_hz"] = 1000 / (IDLE_LOOP_MS if idle else LOOP_MS)
+    if _telemetry:
+        if idle:
+            _telemetry.pause()
+        else:
+            _telemetry.resume()
+    status_display.set_idle(idle)
+    print(">>> Idle: power save on" if idle else ">>> Input: power save off")
+    publish_state(force=True)
+
+
+def _next_event(timeout_ms: int):
+    """Next pygame event within ``timeout_ms``, or None."""
+    try:
+        event = pygame.event.wait(timeout_ms)
+    except (TypeError, pygame.error):    # pygame < 2.0.1 has no wait timeout
+        time.sleep(timeout_ms / 1000)
+        return None
+    return None if event.type == pygame.NOEVENT else event
+
+
+def idle_input(event) -> bool:
+    """True for events that would change the loop's commands; stick noise is not."""
+    if event.type == pygame.JOYAXISMOTION:
+        if event.axis in (4, 5):                 # triggers rest at -1
+            return (event.value + 1) / 2 > ZOOM_START_DEADZONE
+        return abs(event.value) > (FOCUS_DEADZONE if event.axis == 1 else deadzone)
+    return event.type in (pygame.USEREVENT, pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION,
+                          pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+
+
+_idle_waiter = IdleWaiter(_next_event, idle_input)
+
+
+def idle_wait() -> None:
+    """Sleep up to IDLE_LOOP_MS, returning early only on real controller or deck input."""
+    pygame.event.clear()
+    _idle_waiter.wait()
+
+
+def loop_tick() -> None:
+    """Track control-loop rate; a period over twice the target counts as an overrun."""
+    global _loop_tick_at
+    now = time.monotonic()
+    if _loop_tick_at is not None:
+        period = now - _loop_tick_at
+        _loop_stats["rate_hz"] = round(0.9 * _loop_stats["rate_hz"] + 0.1 / max(period, 1e-3), 1)
+        _loop_stats["worst_ms"] = round(max(_loop_stats["worst_ms"], period * 1000), 1)
+        if period > 2 / _loop_stats["target_hz"]:
+            _loop_stats["overruns"] += 1
+    _loop_tick_at = now
+
+
 def handle_signal(signum, frame):
     """Flip running flag to exit main loop."""
     global running
@@ -301,18 +411,29 @@ def wait_for_joystick() -> pygame.joystick.Joystick:
     return js
 
 
-_streamdeck = StreamDeckController(_deck_actions)
+if _bridge:
+    _streamdeck = _bridge.proxy("streamdeck", deck_ids=_bridge.deck_ids)
+    _telemetry = _bridge.proxy("telemetry")
+else:
+    _streamdeck = StreamDeckController(_deck_actions)
+    _telemetry = TelemetryService(on_change=_streamdeck.telemetry_changed)
+    _streamdeck.attach_telemetry(_telemetry)
 _streamdeck.configure(**_cfg.get("streamdeck", {}))
 _streamdeck.start()
+_streamdeck.prune_thumbnails(CAMS)
+_telemetry.start(CAMS)
 js = None
 max_speed = _cfg["max_speed"]
 deadzone = DEADZONE
 zoom_speed = _cfg["zoom_speed"]
-zoom_state = ZoomCommandState()
+axes = AxisBank(AXIS_TABLE)
+VISCA = ViscaCodec()  # main-thread packet templates; see visca_codec
 zoom_trigger_state = ZoomTriggerState()
-motion_state = MotionState()
 button_edges = ButtonEdges()
 last_input_log = 0.0
+controls = None          # this tick's InputSnapshot
+computed_for = None      # (snapshot, camera, tuning) the axis commands were last computed for
+engaged = False          # a stick or trigger is past its deadzone
 status_display.camera_active(cur, CAMS[cur][0])
 status_display.boot("PTZ bridge ready")
 
@@ -321,7 +442,7 @@ _cfg_mtime = 0.0
 
 
 def reload_config_if_changed():
-    global CAMS, CAMERA_NAMES, cur, max_speed, deadzone, zoom_speed, y_button_zoom_speed_up, _cfg_mtime
+    global CAMS, CAMERA_NAMES, CAMERA_PRESETS, DECK_GROUPS, cur, max_speed, deadzone, zoom_speed, y_button_zoom_speed_up, _cfg_mtime
     path = Path(os.environ.get("PTZPAD_CONFIG", "~/.config/ptzpad/config.json")).expanduser()
     try: mtime = path.stat().st_mtime
     except OSError: return
@@ -332,12 +453,15 @@ def reload_config_if_changed():
     new = [(c["host"], c["protocol"], c["port"]) for c in cfg["cameras"]]
     if new != CAMS:
         stop_all_motion(CAMS[cur]); CAMS = new; cur = min(cur, len(CAMS) - 1); reset_input_state(); status_display.camera_active(cur, CAMS[cur][0])
+        if _streamdeck: _streamdeck.prune_thumbnails(CAMS)
+        if _telemetry: _telemetry.set_cameras(CAMS)
     CAMERA_NAMES = [c.get("name") or c["host"] for c in cfg["cameras"]]
+    CAMERA_PRESETS = [c.get("presets") for c in cfg["cameras"]]
+    DECK_GROUPS = {serial: [n - 1 for n in deck["cameras"]] for serial, deck in cfg["streamdeck"].get("decks", {}).items()}
     max_speed, deadzone, zoom_speed = cfg["max_speed"], cfg["deadzone"], cfg["zoom_speed"]
     y_button_zoom_speed_up = cfg.get("controls", {}).get("y_button_zoom_speed_up", False)
     if _streamdeck:
         _update_streamdeck()
-    if _streamdeck:
         _streamdeck.configure(**cfg.get("streamdeck", {}))
 
 
@@ -346,9 +470,12 @@ def send(pkt, cam, label: str | None = None):
 
     global last_send_log
     ip, proto, port = cam
-    camera_state = _camera_send.setdefault(ip, {})
-    camera_state.update({"last_command": label or "command", "protocol": proto,
-                         "last_command_at": time.time()})
+    camera_state = _camera_send.get(ip)
+    if camera_state is None:
+        camera_state = _camera_send[ip] = {}
+    camera_state["last_command"] = label or "command"
+    camera_state["protocol"] = proto
+    camera_state["last_command_at"] = time.time()
     if DEBUG_INPUT:
         now = time.time()
         if now - last_send_log >= DEBUG_INPUT_INTERVAL:
@@ -372,16 +499,18 @@ def send(pkt, cam, label: str | None = None):
                 s.connect((ip, port))
                 s.sendall(pkt)
         camera_state["last_success"] = time.time()
+        camera_state["sent"] = camera_state.get("sent", 0) + 1
         return True
     except OSError as exc:
         camera_state["last_error"] = time.time()
+        camera_state["errors"] = camera_state.get("errors", 0) + 1
         print(f">> Socket error to {ip}:{port}: {exc}")
         status_display.error("Socket send failed")
         publish_state(force=True)
         return False
 
-def visca_move(x, y, cam):
-    """Drive pan/tilt according to joystick input."""
+def move_command(x, y):
+    """Return the pan/tilt speeds and directions for joystick input."""
     def speed(v: float) -> int:
         # Scale speed with stick deflection using a cubic curve for a very smooth ramp
         norm = (abs(v) - deadzone) / (1 - deadzone)
@@ -408,34 +537,23 @@ def visca_move(x, y, cam):
         tilt_dir = 0x02
         tilt_speed = speed(y)
 
-    command = (pan_speed, tilt_speed, pan_dir, tilt_dir)
-    if motion_state.move_changed(command, cam[1], UDP_STOP_PACKETS):
-        send(bytes([0x81, 0x01, 0x06, 0x01, *command, 0xFF]), cam, "move")
+    return (pan_speed, tilt_speed, pan_dir, tilt_dir)
+
+def visca_move(command, cam):
+    send(VISCA.move(*command), cam, "move")
 
 def visca_stop(cam):
-    send(b"\x81\x01\x06\x01\x00\x00\x03\x03\xFF", cam, "stop")
+    send(VISCA.stop(), cam, "stop")
 
 def zoom(direction, cam, speed=None):          # direction: 1 tele, -1 wide, 0 stop
     speed = zoom_speed if speed is None else max(0, min(int(speed), MAX_ZOOM_SPEED))
-    if direction > 0:
-        cmd = bytes([0x20 + speed])
-    elif direction < 0:
-        cmd = bytes([0x30 + speed])
-    else:
-        cmd = b"\x00"
-    send(b"\x81\x01\x04\x07" + cmd + b"\xFF", cam, "zoom")
+    send(VISCA.zoom(direction, speed), cam, "zoom")
 
 def focus(direction, cam):         # direction: 1 far, -1 near, 0 stop
-    if direction > 0:
-        cmd = b"\x02"
-    elif direction < 0:
-        cmd = b"\x03"
-    else:
-        cmd = b"\x00"
-    send(b"\x81\x01\x04\x08" + cmd + b"\xFF", cam, "focus")
+    send(VISCA.focus(direction), cam, "focus")
 
 def autofocus(cam):
-    send(b"\x81\x01\x04\x18\x01\xFF", cam, "autofocus")
+    send(VISCA.autofocus(), cam, "autofocus")
 
 
 def stop_all_motion(cam):
@@ -452,9 +570,10 @@ def stop_all_motion(cam):
 def reset_input_state() -> None:
     """Clear command suppression and trigger state after lifecycle changes."""
 
-    zoom_state.reset()
+    global computed_for
+    axes.reset()
     zoom_trigger_state.reset()
-    motion_state.reset()
+    computed_for = None
     button_edges.reset()
     _input_telemetry.update({
         "lt": None,
@@ -477,84 +596,138 @@ def switch_camera(new_index: int) -> int:
     return new_index
 
 
-def read_dpad(joystick) -> tuple[int, int]:
-    """Read D-pad as an SDL hat, falling back to standard Xbox buttons."""
+def read_input(joystick, previous: InputSnapshot | None = None) -> InputSnapshot:
+    """Read every control the loop uses once per tick.
+
+    SDL exposes the Xbox D-pad as a hat on some drivers and as buttons
+    11..14 on others (notably HIDAPI), so either is accepted.  Buttons are
+    read only when the controller advertises them, and the layout is reused
+    while the button/hat counts are unchanged.
+    """
     try:
-        if joystick.get_numhats() > 0:
-            hat_x, hat_y = joystick.get_hat(0)
-            if hat_x or hat_y:
-                return hat_x, hat_y
+        counts = (joystick.get_numbuttons(), joystick.get_numhats())
     except (AttributeError, pygame.error):
-        pass
-    # HIDAPI exposes Xbox D-pad directions as buttons 11..14.  Guard the
-    # lookup because some controllers advertise fewer buttons.
+        counts = (0, 0)
+    if previous is not None and previous.counts == counts:
+        layout = previous.layout
+    else:
+        layout = controller_layout(*counts)
+    button_count, hat_count = counts
     try:
-        button_count = joystick.get_numbuttons()
+        sticks = tuple(joystick.get_axis(index) for index in range(6))
+        hat = joystick.get_hat(0) if hat_count > 0 else (0, 0)
+        if hat == (0, 0) and button_count >= 15:
+            hat = (
+                int(joystick.get_button(14)) - int(joystick.get_button(13)),
+                int(joystick.get_button(11)) - int(joystick.get_button(12)),
+            )
+        buttons = tuple(
+            index < button_count and bool(joystick.get_button(index))
+            for index in (0, layout.lb, layout.rb, layout.y, layout.ls)
+        )
     except (AttributeError, pygame.error):
-        button_count = 0
-    if button_count < 15:
-        return 0, 0
-    return (
-        int(joystick.get_button(14)) - int(joystick.get_button(13)),
-        int(joystick.get_button(11)) - int(joystick.get_button(12)),
-    )
+        return InputSnapshot(counts=counts, layout=layout)
+    return InputSnapshot(sticks, hat, buttons, counts, layout)
 
 
-def read_button(joystick, index: int) -> bool:
-    """Read a button only when the controller advertises that index."""
+def _deck_group(deck_id):
+    """Camera indexes a bound deck selects from; None for decks that follow ``cur``."""
+    group = [index for index in DECK_GROUPS.get(deck_id, ()) if index < len(CAMS)]
+    return group or None
 
-    try:
-        return bool(index < joystick.get_numbuttons() and joystick.get_button(index))
-    except (AttributeError, pygame.error):
-        return False
+
+def _deck_camera(deck_id) -> int:
+    group = _deck_group(deck_id)
+    if group is None:
+        return cur
+    selected = _deck_selection.get(deck_id)
+    return selected if selected in group else group[0]
 
 
-def process_streamdeck_actions() -> None:
-    """Drain HID actions; all camera and VISCA state changes happen here."""
-    global cur, _preset_save_armed
+def process_streamdeck_actions() -> int:
+    """Drain HID actions and return how many were handled.
+
+    All camera and VISCA state changes happen here.
+    Decks bound to a camera group in config keep their own selected camera
+    and never move the joystick's; other decks select ``cur`` as before.
+    Every deck has its own Save arming.
+    """
+    global cur
+    handled = 0
     while True:
         try:
             action = _deck_actions.get_nowait()
         except queue.Empty:
             break
-        if action.kind == ActionKind.PREVIOUS_CAMERA and CAMS:
-            cur = switch_camera((cur - 1) % len(CAMS))
-            status_display.camera_active(cur, CAMS[cur][0])
-        elif action.kind == ActionKind.NEXT_CAMERA and CAMS:
-            cur = switch_camera((cur + 1) % len(CAMS))
-            status_display.camera_active(cur, CAMS[cur][0])
-        else:
-            _preset_save_armed, packet, label = resolve_deck_action(action, _preset_save_armed)
-            if packet is not None and label is not None and CAMS:
-                sent = send(packet, CAMS[cur], label)
+        handled += 1
+        if not CAMS:
+            continue
+        deck = action.deck
+        group = _deck_group(deck) or list(range(len(CAMS)))
+        camera = _deck_camera(deck)
+        position = group.index(camera) if camera in group else 0
+        target = None
+        if action.kind == ActionKind.PREVIOUS_CAMERA:
+            target = group[(position - 1) % len(group)]
+        elif action.kind == ActionKind.NEXT_CAMERA:
+            target = group[(position + 1) % len(group)]
+        elif action.kind == ActionKind.SELECT_CAMERA:
+            if action.camera is not None and 0 <= action.camera < len(group) and group[action.camera] != camera:
+                target = group[action.camera]
+        elif action.kind != ActionKind.DECK_CONNECTED:
+            armed, packet, label = resolve_deck_action(action, _deck_armed.get(deck, False))
+            _deck_armed[deck] = armed
+            if packet is not None and label is not None:
+                sent = send(packet, CAMS[camera], label)
                 if sent and label == "preset-set" and _streamdeck:
-                    _streamdeck.capture_thumbnail(CAMS[cur], action.preset)
+                    _streamdeck.capture_thumbnail(CAMS[camera], action.preset)
+        if target is not None:
+            if _deck_group(deck) is None:
+                cur = switch_camera(target)
+                status_display.camera_active(cur, CAMS[cur][0])
+            else:
+                _deck_selection[deck] = target
         if _streamdeck:
             _update_streamdeck()
+    return handled
 
 
 def _update_streamdeck():
     if _streamdeck and CAMS:
-        _streamdeck.update(
-            cur,
-            _camera_label(cur),
-            len(CAMS),
-            _preset_save_armed,
-            CAMS[cur],
-            max_speed,
-            zoom_speed,
-        )
+        _streamdeck.set_telemetry_camera(CAMS[cur])
+        for deck in _streamdeck.deck_ids() or [None]:
+            group = _deck_group(deck) or list(range(len(CAMS)))
+            camera = _deck_camera(deck)
+            _streamdeck.update(
+                group.index(camera),
+                _camera_label(camera),
+                len(group),
+                _deck_armed.get(deck, False),
+                CAMS[camera],
+                max_speed,
+                zoom_speed,
+                camera_names=[_camera_label(index) for index in group],
+                presets=CAMERA_PRESETS[camera] if camera < len(CAMERA_PRESETS) else None,
+                deck=deck,
+            )
 
 
 _update_streamdeck()
 js = wait_for_joystick()
 print(">>> PTZ bridge running.  Cameras:", ", ".join(ip for ip, _, _ in CAMS))
+if RT_CPU is not None or RT_PRIORITY is not None:
+    # Threads started later inherit the policy and CPU, so only the split
+    # process, which starts no auxiliary threads, may run real-time.
+    if _bridge:
+        print(">>> Real-time control loop:", apply_realtime(RT_CPU, RT_PRIORITY) or "not permitted")
+    else:
+        logging.warning("PTZPAD_RT_CPU/PTZPAD_RT_PRIORITY need PTZPAD_SPLIT=1; running at normal priority")
 while running:
+    loop_tick()
     reload_config_if_changed()
-    process_streamdeck_actions()
+    deck_input = process_streamdeck_actions()
     publish_state()
     pygame.event.pump()
-    status_display.refresh()
     if pygame.joystick.get_count() == 0:
         print(">>> Joystick disconnected")
         controller_connected = False
@@ -564,12 +737,16 @@ while running:
             bluetooth_linked = False
         stop_all_motion(CAMS[cur])
         reset_input_state()
+        if _idle.update(True, time.monotonic()) == "wake":
+            set_power_save(False)
         publish_state(force=True)
         js = wait_for_joystick()
+        _loop_tick_at = None    # the reconnect wait is not an overrun
         status_display.camera_active(cur, CAMS[cur][0])
         continue
+    controls = read_input(js, controls)
     # camera cycling – A button (#0)
-    if js.get_button(0):
+    if controls.buttons[0]:
         cur = switch_camera((cur + 1) % len(CAMS))
         time.sleep(0.25)          # debounce
         print(">> Control switched to CAM", cur + 1, CAMS[cur][0])
@@ -577,22 +754,10 @@ while running:
         if _streamdeck:
             _update_streamdeck()
 
-    # Adjust max speed / deadzone with D-pad.  SDL exposes the Xbox D-pad as
-    # a hat on some drivers and as buttons on others (notably HIDAPI), so
-    # accept either representation.
-    hat_x, hat_y = read_dpad(js)
-    try:
-        button_count = js.get_numbuttons()
-        hat_count = js.get_numhats()
-    except (AttributeError, pygame.error):
-        button_count, hat_count = 0, 0
-    layout = controller_layout(button_count, hat_count)
-    edges = button_edges.rising({
-        "LB": read_button(js, layout.lb),
-        "RB": read_button(js, layout.rb),
-        "Y": read_button(js, layout.y),
-        "LS": read_button(js, layout.ls),
-    })
+    # Adjust max speed / deadzone with the D-pad.
+    hat_x, hat_y = controls.hat
+    _, lb, rb, y_button, ls = controls.buttons
+    edges = button_edges.rising({"LB": lb, "RB": rb, "Y": y_button, "LS": ls})
     if hat_y == 1:
         max_speed = min(max_speed + 1, MAX_SPEED)
         _update_streamdeck()
@@ -625,77 +790,90 @@ while running:
         print(">> ZOOM_SPEED", zoom_speed)
 
     cam = CAMS[cur]
-    x, y = js.get_axis(2), -js.get_axis(3)   # right stick (invert Y)
-    visca_move(x, y, cam)
-
-    fy = -js.get_axis(1)                     # left stick Y for focus
-    if fy > FOCUS_DEADZONE:
-        focus_dir = 1
-    elif fy < -FOCUS_DEADZONE:
-        focus_dir = -1
-    else:
-        focus_dir = 0
-    focus_cmd = motion_state.next_focus(focus_dir, cam[1], UDP_STOP_PACKETS)
-    if focus_cmd is not None:
-        focus(focus_cmd, cam)
+    tick_at = time.monotonic()
+    # Identical input on the same camera and tuning needs no new commands,
+    # unless stop retries, a due keepalive or the trigger release grace
+    # still need ticks.
+    input_key = (controls, cur, max_speed, deadzone, zoom_speed)
+    if input_key != computed_for or axes.pending(cam, tick_at) or zoom_trigger_state.releasing:
+        computed_for = input_key
+        x, y = controls.axes[2], -controls.axes[3]   # right stick (invert Y)
+        move = move_command(x, y)
+
+        fy = -controls.axes[1]                   # left stick Y for focus
+        if fy > FOCUS_DEADZONE:
+            focus_dir = 1
+        elif fy < -FOCUS_DEADZONE:
+            focus_dir = -1
+        else:
+            focus_dir = 0
 
-    if "LS" in edges:                       # left stick click
-        autofocus(cam)
+        rt = (controls.axes[4] + 1) / 2  # right trigger (0..1)
+        lt = (controls.axes[5] + 1) / 2  # left trigger (0..1)
+        zoom_val = rt - lt              # combine triggers
 
-    rt = (js.get_axis(4) + 1) / 2  # right trigger (0..1)
-    lt = (js.get_axis(5) + 1) / 2  # left trigger (0..1)
-    zoom_val = rt - lt              # combine triggers
-
-    zoom_dir = resolve_zoom_direction(
-        zoom_val,
-        zoom_trigger_state,
-        start_deadzone=ZOOM_START_DEADZONE,
-        release_loops=ZOOM_STOP_LOOPS,
-    )
-    trigger_speed = (
-        None
-        if abs(zoom_val) <= ZOOM_START_DEADZONE
-        else zoom_speed_for_trigger(
-            zoom_val, zoom_speed, deadzone=ZOOM_START_DEADZONE
+        zoom_dir = resolve_zoom_direction(
+            zoom_val,
+            zoom_trigger_state,
+            start_deadzone=ZOOM_START_DEADZONE,
+            release_loops=ZOOM_STOP_LOOPS,
         )
-    )
-    _input_telemetry.update({
-        "lt": round(lt, 3),
-        "rt": round(rt, 3),
-        "zoom_value": round(zoom_val, 3),
-        "zoom_direction": zoom_dir,
-        "protocol": cam[1],
-    })
+        trigger_speed = (
+            None
+            if abs(zoom_val) <= ZOOM_START_DEADZONE
+            else zoom_speed_for_trigger(
+                zoom_val, zoom_speed, deadzone=ZOOM_START_DEADZONE
+            )
+        )
+        _input_telemetry.update({
+            "lt": round(lt, 3),
+            "rt": round(rt, 3),
+            "zoom_value": round(zoom_val, 3),
+            "zoom_direction": zoom_dir,
+            "protocol": cam[1],
+        })
+
+        engaged = move != NEUTRAL_MOVE or focus_dir != 0 or zoom_dir != 0
+
+        # One pass over the active camera's axes, scheduled from AXIS_TABLE.
+        zoom_axis = axes.scheduler(cam, "zoom")
+        last_zoom_speed = zoom_axis.speed
+        for _, axis, command in axes.step([
+            (cam, "move", move, None),
+            (cam, "focus", focus_dir, None),
+            (cam, "zoom", zoom_dir, trigger_speed),
+        ], tick_at):
+            if axis == "move":
+                visca_move(command, cam)
+            elif axis == "focus":
+                focus(command, cam)
+            else:
+                # Release/trigger grace carries no speed update; directional
+                # starts always have a numeric speed, while stops ignore it.
+                command_speed = trigger_speed
+                if command_speed is None and command != 0:
+                    command_speed = last_zoom_speed if last_zoom_speed >= 0 else 0
+                zoom(command, cam, command_speed)
+
 
-    zoom_cmd = next_zoom_command(
-        zoom_dir,
-        zoom_state,
-        stop_packets=ZOOM_STOP_PACKETS,
-        requested_speed=trigger_speed,
-    )
-    if zoom_cmd is not None:
-        # Release/trigger grace carries no speed update; directional starts
-        # always have a numeric speed, while stops ignore the value.
-        command_speed = trigger_speed
-        if command_speed is None and zoom_cmd != 0:
-            command_speed = zoom_state.last_speed if zoom_state.last_speed >= 0 else 0
-        zoom(zoom_cmd, cam, command_speed)
+    if "LS" in edges:                       # left stick click
+        autofocus(cam)
 
     if DEBUG_INPUT:
         now = time.time()
         if now - last_input_log >= DEBUG_INPUT_INTERVAL:
-            axes = {
-                "rx": f"{x:.2f}",
-                "ry": f"{y:.2f}",
-                "lx": f"{js.get_axis(0):.2f}",
-                "ly": f"{js.get_axis(1):.2f}",
-                "lt": f"{lt:.2f}",
-                "rt": f"{rt:.2f}",
+            lx, ly, rx, ry, lt_axis, rt_axis = controls.axes
+            sticks = {
+                "rx": f"{rx:.2f}",
+                "ry": f"{-ry:.2f}",
+                "lx": f"{lx:.2f}",
+                "ly": f"{ly:.2f}",
+                "lt": f"{(lt_axis + 1) / 2:.2f}",
+                "rt": f"{(rt_axis + 1) / 2:.2f}",
             }
-            buttons = {"A": read_button(js, 0), "LB": read_button(js, layout.lb), "RB": read_button(js, layout.rb), "Y": read_button(js, layout.y), "LS": read_button(js, layout.ls)}
             print(
                 ">>> INPUT",
-                axes,
+                sticks,
                 "hat=(",
                 hat_x,
                 hat_y,
@@ -703,20 +881,36 @@ while running:
                 "zoom_dir=",
                 zoom_dir,
                 "last_zoom_dir=",
-                zoom_state.last_direction,
+                zoom_axis.direction,
                 "max_speed=",
                 max_speed,
                 "deadzone=",
                 f"{deadzone:.2f}",
                 "buttons=",
-                buttons,
+                controls.pressed(),
             )
             last_input_log = now
 
-    time.sleep(LOOP_MS / 1000)
+    # Stick noise inside the deadzone is not activity; pending stops keep
+    # the loop at full rate until they are sent.
+    active = (engaged or deck_input or any(controls.buttons) or controls.hat != (0, 0)
+              or axes.pending(cam, tick_at) or zoom_trigger_state.releasing)
+    transition = _idle.update(active, time.monotonic())
+    if transition is not None:
+        set_power_save(transition == "sleep")
+    if _idle.idle:
+        idle_wait()
+    else:
+        time.sleep(LOOP_MS / 1000)
 
 if CAMS and "cur" in globals():
     stop_all_motion(CAMS[cur])
-if _streamdeck:
-    _streamdeck.close()
+if _bridge:
+    _bridge.close()             # the worker closes the deck, telemetry and OLED
+else:
+    if _telemetry:
+        _telemetry.close()
+    if _streamdeck:
+        _streamdeck.close()
+    status_display.close()
 pygame.quit()
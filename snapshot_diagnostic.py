@@ -3,11 +3,20 @@
 import argparse
 import hashlib
 import html
+import io
 import json
+import math
+import mmap
+import os
+import re
 import shlex
+import statistics
+import struct
 import sys
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from urllib.request import HTTPRedirectHandler, Request, build_opener
 
@@ -15,6 +24,18 @@ from ptz_config import load_config
 from streamdeck_control import validate_snapshot
 
 
+SIGNATURE_SIZE = (32, 24)
+STALE_THRESHOLD = 0.01
+RING_MAGIC = b"PTZRING1"
+# magic, slot count, slot size, next sequence; padded to 64 bytes.
+RING_HEADER = struct.Struct("<8sIIQ40x")
+# sequence, captured_at, latency_ms, length, score (NaN when unscored), flags, sha256.
+RING_ENTRY = struct.Struct("<QdfIfB32s3x")
+RING_DUPLICATE = 1
+RING_ERROR = 2
+RING_STALE = 4
+
+
 class _NoRedirect(HTTPRedirectHandler):
     def redirect_request(self, req, fp, code, msg, headers, newurl):
         raise ValueError("redirect rejected")
@@ -38,6 +59,324 @@ def capture_frame(host, timeout=1.5, opener=None):
         return data, dict(response.headers.items())
 
 
+def frame_signature(data, size=SIGNATURE_SIZE):
+    """Decode a snapshot into a small grayscale image for change scoring.
+
+    JPEG draft mode lets the decoder scale down while decoding, so a 4K
+    frame costs little more than a thumbnail.  Returns None without Pillow.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    image = Image.open(io.BytesIO(data))
+    image.draft("L", (size[0] * 4, size[1] * 4))
+    return image.convert("L").resize(size, Image.BILINEAR)
+
+
+def change_score(previous, current):
+    """Mean absolute pixel difference of two signatures, from 0.0 to 1.0.
+
+    Re-encoded copies of the same frame score near zero even though their
+    bytes (and hashes) differ.
+    """
+    if previous is None or current is None:
+        return None
+    from PIL import ImageChops, ImageStat
+    return round(ImageStat.Stat(ImageChops.difference(previous, current)).mean[0] / 255, 4)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else None
+
+
+def camera_report(host, records, threshold=STALE_THRESHOLD):
+    """Summarise one camera's frames: latency, size, and how many were stale."""
+    frames = [record for record in records if "error" not in record]
+    latencies = [record["latency_ms"] for record in frames]
+    scored = [record for record in frames if record.get("score") is not None or record.get("duplicate")]
+    stale = [record for record in scored if record.get("duplicate") or record["score"] < threshold]
+    return {
+        "host": host,
+        "frames": len(frames),
+        "errors": len(records) - len(frames),
+        "latency_ms": {
+            "p50": _percentile(latencies, 0.5),
+            "p95": _percentile(latencies, 0.95),
+            "max": max(latencies, default=None),
+        },
+        "bytes_avg": round(statistics.mean(r["bytes"] for r in frames)) if frames else None,
+        "duplicates": sum(1 for record in frames if record.get("duplicate")),
+        "stale": len(stale),
+        "stale_rate": round(len(stale) / len(scored), 3) if scored else None,
+        "fresh": bool(scored) and not stale,
+    }
+
+
+def _capture_series(host, count, interval, output, opener, sleeper, fetch):
+    output.mkdir(mode=0o700, parents=True, exist_ok=True)
+    records = []
+    seen = set()
+    previous = None
+    for index in range(1, count + 1):
+        started = time.perf_counter()
+        try:
+            data, headers = fetch(host, opener=opener)
+        except Exception as exc:  # one camera failing must not stop the fleet
+            records.append({"frame": index, "error": str(exc)})
+        else:
+            latency_ms = round((time.perf_counter() - started) * 1000, 1)
+            digest = hashlib.sha256(data).hexdigest()
+            try:
+                signature = frame_signature(data)
+            except OSError:
+                signature = None
+            path = output / f"frame-{index:03d}.jpg"
+            path.write_bytes(data)
+            records.append({
+                "frame": index,
+                "file": path.name,
+                "sha256": digest,
+                "bytes": len(data),
+                "latency_ms": latency_ms,
+                "duplicate": digest in seen,
+                "score": change_score(previous, signature),
+                "headers": headers,
+            })
+            seen.add(digest)
+            previous = signature
+        if index < count:
+            sleeper(interval)
+    (output / "index.html").write_text(_gallery([r for r in records if "file" in r]), encoding="utf-8")
+    return records
+
+
+def run_fleet(hosts, count, interval, output, opener=None, sleeper=time.sleep,
+              threshold=STALE_THRESHOLD, fetch=capture_frame):
+    """Capture every camera concurrently and write ``report.json`` plus galleries.
+
+    Each camera gets its own thread and subdirectory, so one slow camera
+    does not stretch the others' capture intervals.
+    """
+    output.mkdir(mode=0o700, parents=True, exist_ok=True)
+    folders = [f"{index:02d}-{re.sub(r'[^A-Za-z0-9.-]', '_', host)}" for index, host in enumerate(hosts, 1)]
+    with ThreadPoolExecutor(max_workers=max(1, len(hosts))) as pool:
+        series = list(pool.map(
+            lambda item: _capture_series(item[0], count, interval, output / item[1], opener, sleeper, fetch),
+            zip(hosts, folders),
+        ))
+    cameras = []
+    for host, folder, records in zip(hosts, folders, series):
+        report = camera_report(host, records, threshold)
+        report["gallery"] = f"{folder}/index.html"
+        report["records"] = [{k: v for k, v in r.items() if k != "headers"} for r in records]
+        cameras.append(report)
+        state = "fresh" if report["fresh"] else "STALE" if report["stale"] else "no data"
+        print(
+            f"{host}: {state} • {report['frames']} frames, {report['errors']} errors • "
+            f"stale {report['stale']} • p50 {report['latency_ms']['p50']} ms • "
+            f"p95 {report['latency_ms']['p95']} ms"
+        )
+    (output / "report.json").write_text(
+        json.dumps({"threshold": threshold, "cameras": cameras}, indent=2) + "\n", encoding="utf-8"
+    )
+    links = "".join(
+        f'<li><a href="{html.escape(c["gallery"])}">{html.escape(c["host"])}</a> — '
+        f'{"fresh" if c["fresh"] else "stale " + str(c["stale"])}, p95 {c["latency_ms"]["p95"]} ms</li>'
+        for c in cameras
+    )
+    (output / "index.html").write_text(
+        "<!doctype html><meta charset='utf-8'><title>PTZ snapshot fleet</title>"
+        f"<ul>{links}</ul>",
+        encoding="utf-8",
+    )
+    return cameras
+
+
+class SnapshotRing:
+    """Fixed-size memory-mapped ring of snapshot frames.
+
+    The file holds a header, one index entry per slot and the slots
+    themselves, and is allocated in full when created, so a soak run never
+    grows it.  Frame ``n`` lives in slot ``(n - 1) % slots``; entries are
+    written before the header's next sequence, so a torn write only loses
+    the newest frame.
+    """
+
+    def __init__(self, path, slots=256, slot_size=1024 * 1024):
+        self.path = Path(path)
+        if self.path.exists():
+            self._file = open(self.path, "r+b")
+            magic, slots, slot_size, _ = RING_HEADER.unpack(self._file.read(RING_HEADER.size))
+            if magic != RING_MAGIC:
+                self._file.close()
+                raise ValueError(f"{self.path} is not a snapshot ring")
+        else:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self._file = open(self.path, "w+b")
+            size = RING_HEADER.size + slots * (RING_ENTRY.size + slot_size)
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(self._file.fileno(), 0, size)
+            else:
+                self._file.truncate(size)
+            self._file.write(RING_HEADER.pack(RING_MAGIC, slots, slot_size, 1))
+            self._file.flush()
+        self.slots, self.slot_size = slots, slot_size
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._data_start = RING_HEADER.size + slots * RING_ENTRY.size
+
+    @property
+    def next_sequence(self):
+        return RING_HEADER.unpack_from(self._map, 0)[3]
+
+    def append(self, data, captured_at, latency_ms=0.0, score=None, flags=0):
+        """Store one frame (or an error when ``data`` is empty) and return its sequence."""
+        sequence = self.next_sequence
+        slot = (sequence - 1) % self.slots
+        if len(data) > self.slot_size:
+            data, flags = b"", flags | RING_ERROR
+        start = self._data_start + slot * self.slot_size
+        self._map[start:start + len(data)] = data
+        digest = hashlib.sha256(data).digest() if data else bytes(32)
+        RING_ENTRY.pack_into(
+            self._map, RING_HEADER.size + slot * RING_ENTRY.size, sequence, captured_at,
+            latency_ms, len(data), math.nan if score is None else score, flags, digest,
+        )
+        RING_HEADER.pack_into(self._map, 0, RING_MAGIC, self.slots, self.slot_size, sequence + 1)
+        return sequence
+
+    def entries(self, since=None, until=None):
+        """Return the stored frames' index entries, oldest first."""
+        found = []
+        for slot in range(self.slots):
+            sequence, captured_at, latency_ms, length, score, flags, digest = RING_ENTRY.unpack_from(
+                self._map, RING_HEADER.size + slot * RING_ENTRY.size
+            )
+            if not sequence or (since is not None and captured_at < since) or (until is not None and captured_at > until):
+                continue
+            found.append({
+                "sequence": sequence, "slot": slot, "captured_at": captured_at,
+                "latency_ms": round(latency_ms, 1), "bytes": length,
+                "score": None if math.isnan(score) else round(score, 4),
+                "duplicate": bool(flags & RING_DUPLICATE), "stale": bool(flags & RING_STALE),
+                "error": bool(flags & RING_ERROR), "sha256": digest.hex() if length else "",
+            })
+        return sorted(found, key=lambda entry: entry["sequence"])
+
+    def read(self, entry):
+        start = self._data_start + entry["slot"] * self.slot_size
+        return bytes(self._map[start:start + entry["bytes"]])
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def soak_summary(window, started, ended):
+    """Latency percentiles and stale-frame rate for one summary period."""
+    frames = [entry for entry in window if not entry["error"]]
+    latencies = [entry["latency_ms"] for entry in frames]
+    return {
+        "from": started,
+        "to": ended,
+        "frames": len(frames),
+        "errors": len(window) - len(frames),
+        "latency_ms": {fraction: _percentile(latencies, value)
+                       for fraction, value in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))},
+        "stale_rate": round(sum(entry["stale"] for entry in frames) / len(frames), 3) if frames else None,
+    }
+
+
+def soak(host, interval, ring, summary_seconds=300, threshold=STALE_THRESHOLD, opener=None,
+         sleeper=time.sleep, clock=time.time, fetch=capture_frame, max_frames=None, report=print):
+    """Capture ``host`` into ``ring`` until interrupted (or ``max_frames``).
+
+    Every ``summary_seconds`` a summary is passed to ``report`` and appended
+    to ``<ring>.summary.jsonl``.  Returns the summaries written.
+    """
+    summaries = []
+    window = []
+    previous_signature = previous_digest = None
+    period_start = clock()
+    summary_path = ring.path.with_name(ring.path.name + ".summary.jsonl")
+    captured = 0
+
+    def close_period(now):
+        nonlocal window, period_start
+        summary = soak_summary(window, period_start, now)
+        summaries.append(summary)
+        with open(summary_path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(summary) + "\n")
+        ring.flush()
+        report(
+            f"{datetime.fromtimestamp(now):%H:%M:%S} {host}: {summary['frames']} frames, "
+            f"{summary['errors']} errors, p50 {summary['latency_ms']['p50']} ms, "
+            f"p95 {summary['latency_ms']['p95']} ms, stale {summary['stale_rate']}"
+        )
+        window, period_start = [], now
+
+    try:
+        while max_frames is None or captured < max_frames:
+            started = time.perf_counter()
+            captured_at = clock()
+            try:
+                data, _ = fetch(host, opener=opener)
+            except Exception:
+                ring.append(b"", captured_at, flags=RING_ERROR)
+                window.append({"error": True, "stale": False, "latency_ms": None})
+            else:
+                latency_ms = round((time.perf_counter() - started) * 1000, 1)
+                digest = hashlib.sha256(data).digest()
+                try:
+                    signature = frame_signature(data)
+                except OSError:
+                    signature = None
+                score = change_score(previous_signature, signature)
+                flags = RING_DUPLICATE if digest == previous_digest else 0
+                if flags or (score is not None and score < threshold):
+                    flags |= RING_STALE
+                ring.append(data, captured_at, latency_ms, score, flags)
+                window.append({"error": False, "stale": bool(flags & RING_STALE), "latency_ms": latency_ms})
+                previous_signature, previous_digest = signature, digest
+            captured += 1
+            now = clock()
+            if now - period_start >= summary_seconds:
+                close_period(now)
+            sleeper(interval)
+    except KeyboardInterrupt:
+        pass
+    if window:
+        close_period(clock())
+    return summaries
+
+
+def export_ring(ring, output, since=None, until=None):
+    """Extract a time window from ``ring`` into the gallery format."""
+    output.mkdir(mode=0o700, parents=True, exist_ok=True)
+    records = []
+    for entry in ring.entries(since, until):
+        if entry["error"]:
+            continue
+        path = output / f"frame-{entry['sequence']:06d}.jpg"
+        path.write_bytes(ring.read(entry))
+        records.append({**entry, "frame": entry["sequence"], "file": path.name})
+    (output / "index.html").write_text(_gallery(records), encoding="utf-8")
+    (output / "frames.json").write_text(json.dumps(records, indent=2) + "\n", encoding="utf-8")
+    return records
+
+
+def _timestamp(value):
+    """Parse ``--since``/``--until`` as epoch seconds or an ISO 8601 time."""
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
 def run(host, count, interval, output, opener=None, sleeper=time.sleep):
     output.mkdir(mode=0o700, parents=True, exist_ok=True)
     hashes = []
@@ -76,7 +415,12 @@ def run(host, count, interval, output, opener=None, sleeper=time.sleep):
 def _gallery(records):
     cards = []
     for record in records:
-        label = html.escape(f"Frame {record['frame']} — {record['sha256']}")
+        text = f"Frame {record['frame']} — {record['sha256']}"
+        if record.get("latency_ms") is not None:
+            text += f" • {record['latency_ms']} ms • {record['bytes']} bytes"
+        if record.get("score") is not None:
+            text += f" • change {record['score']:.4f}"
+        label = html.escape(text)
         cards.append(
             f'<figure><img src="{html.escape(record["file"])}" alt="{label}">'
             f"<figcaption>{label}</figcaption></figure>"
@@ -95,9 +439,45 @@ def main(argv=None):
     parser.add_argument("--count", type=int, default=5)
     parser.add_argument("--interval", type=float, default=2.0)
     parser.add_argument("--output", type=Path)
+    parser.add_argument("--all", action="store_true", help="capture every configured camera concurrently")
+    parser.add_argument("--stale-threshold", type=float, default=STALE_THRESHOLD,
+                        help="change score below which a frame counts as stale (0..1)")
+    parser.add_argument("--soak", type=Path, metavar="RING",
+                        help="capture until interrupted into a fixed-size ring file")
+    parser.add_argument("--ring-slots", type=int, default=256)
+    parser.add_argument("--slot-kb", type=int, default=1024)
+    parser.add_argument("--summary-minutes", type=float, default=5.0)
+    parser.add_argument("--export", type=Path, metavar="RING", help="extract frames from a ring into a gallery")
+    parser.add_argument("--since", type=_timestamp, help="export frames captured at or after this time")
+    parser.add_argument("--until", type=_timestamp, help="export frames captured at or before this time")
     args = parser.parse_args(argv)
-    if not 2 <= args.count <= 100 or not 0 <= args.interval <= 60:
+    if args.export:
+        if not args.export.exists():
+            parser.error("ring file does not exist")
+        output = args.output or Path(tempfile.mkdtemp(prefix="ptz-snapshot-"))
+        ring = SnapshotRing(args.export)
+        try:
+            records = export_ring(ring, output, args.since, args.until)
+        finally:
+            ring.close()
+        print(f"Exported {len(records)} frames: {output / 'index.html'}")
+        return 0
+    if args.soak:
+        if not 0 <= args.interval <= 60 or not 2 <= args.ring_slots <= 65536 or not 16 <= args.slot_kb <= 4096:
+            parser.error("interval must be 0..60 s, ring slots 2..65536 and slot size 16..4096 KiB")
+    elif not 2 <= args.count <= 100 or not 0 <= args.interval <= 60:
         parser.error("count must be 2..100 and interval 0..60 seconds")
+    if args.all:
+        hosts = [camera["host"] for camera in load_config()["cameras"]]
+        output = args.output or Path(tempfile.mkdtemp(prefix="ptz-snapshot-"))
+        try:
+            run_fleet(hosts, args.count, args.interval, output, threshold=args.stale_threshold)
+        except Exception as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 1
+        print(f"Report: {output / 'report.json'}")
+        print(f"Serve with: python3 -m http.server --directory {shlex.quote(str(output))}")
+        return 0
     if args.camera:
         host = args.camera
     else:
@@ -105,6 +485,14 @@ def main(argv=None):
         if not 1 <= args.camera_index <= len(cameras):
             parser.error("camera index is out of range")
         host = cameras[args.camera_index - 1]["host"]
+    if args.soak:
+        ring = SnapshotRing(args.soak, args.ring_slots, args.slot_kb * 1024)
+        print(f"Soaking {host} into {ring.path} ({ring.slots} slots of {ring.slot_size // 1024} KiB); Ctrl-C stops")
+        try:
+            soak(host, args.interval, ring, args.summary_minutes * 60, args.stale_threshold)
+        finally:
+            ring.close()
+        return 0
     output = args.output or Path(tempfile.mkdtemp(prefix="ptz-snapshot-"))
     try:
         run(host, args.count, args.interval, output)
@@ -4,6 +4,7 @@ The bridge remains usable when the package, USB device, or Pillow is absent.
 HID callbacks only enqueue :class:`DeckAction` values; callers own state changes.
 """
 import hashlib
+import json
 import logging
 import os
 import queue
@@ -11,11 +12,17 @@ import socket
 import tempfile
 import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from http.client import HTTPConnection, HTTPException, RemoteDisconnected
 from pathlib import Path
 from urllib.parse import urlencode
-from urllib.request import HTTPRedirectHandler, Request, build_opener
+
+from visca_inquiry import AE_MODES, INQUIRIES, WB_MODES
+from visca_inquiry import decode as decode_inquiry
+from visca_codec import ViscaCodec
 
 
 class ActionKind(str, Enum):
@@ -23,6 +30,8 @@ class ActionKind(str, Enum):
     NEXT_CAMERA = "next_camera"
     TOGGLE_SAVE = "toggle_save"
     PRESET = "preset"
+    SELECT_CAMERA = "select_camera"
+    DECK_CONNECTED = "deck_connected"
 
 
 def key_layout(key_count: int) -> dict[int, tuple[str, int | None]]:
@@ -47,29 +56,100 @@ def key_layout(key_count: int) -> dict[int, tuple[str, int | None]]:
     }
 
 
+PAGE_KINDS = ("page_next", "page_prev", "cameras", "status_cameras", "back")
+
+
+def _paged(fixed, key_count, item_kind, items, page, page_keys):
+    """Fill the keys left over by ``fixed`` with one page of ``items``.
+
+    Page-switch keys are only added when the items do not fit one page, so
+    a short list keeps every key.  Returns ``(layout, page_count)``.
+    """
+    free = [key for key in range(key_count) if key not in fixed]
+    if len(items) > len(free):
+        fixed = {**fixed, **page_keys}
+        free = [key for key in free if key not in page_keys]
+    per_page = max(1, len(free))
+    page_count = max(1, -(-len(items) // per_page))
+    page = page % page_count
+    chunk = items[page * per_page:(page + 1) * per_page]
+    layout = dict(fixed)
+    for slot, key in enumerate(free):
+        layout[key] = (item_kind, chunk[slot]) if slot < len(chunk) else ("none", None)
+    return layout, page_count
+
+
+def preset_page_layout(key_count, page=0, presets=None, camera_page=False):
+    """Return ``(layout, page_count)`` for one page of a camera's presets.
+
+    ``presets`` is the number of presets reachable from the deck (default:
+    one page).  With ``camera_page`` a key opens :func:`camera_page_layout`.
+    """
+    if key_count == 15:
+        fixed = {
+            0: ("status_next", None),
+            5: ("status", None),
+            10: ("status_cameras" if camera_page else "status", None),
+            4: ("save", None),
+        }
+        page_keys = {9: ("page_prev", None), 14: ("page_next", None)}
+    else:
+        if camera_page:
+            fixed = {0: ("cameras", None), 1: ("save", None)}
+        else:
+            fixed = {0: ("previous", None), 1: ("next", None), 2: ("save", None)}
+        page_keys = {key_count - 1: ("page_next", None)}
+        if key_count >= 15:
+            page_keys[key_count - 2] = ("page_prev", None)
+    if presets is None:
+        presets = key_count - len(fixed)
+    return _paged(fixed, key_count, "preset", list(range(1, min(int(presets), 99) + 1)), page, page_keys)
+
+
+def camera_page_layout(key_count, camera_count, page=0):
+    """Return ``(layout, page_count)`` for the camera-select page."""
+    page_keys = {key_count - 2: ("page_next", None)}
+    return _paged({key_count - 1: ("back", None)}, key_count, "camera",
+                  list(range(camera_count)), page, page_keys)
+
+
 @dataclass(frozen=True)
 class DeckAction:
     kind: ActionKind
     preset: int | None = None
+    camera: int | None = None
+    deck: str | None = None
+
+
+# One shared codec for the preset helpers; the lock keeps a builder call and
+# its ``tobytes()`` copy together when decks on several threads press at once.
+_PRESET_CODEC = ViscaCodec()
+_PRESET_LOCK = threading.Lock()
 
 
 def preset_set_packet(preset: int) -> bytes:
     """Return the VISCA memory-set packet for a 1-based preset number."""
-    if not 1 <= int(preset) <= 99:
-        raise ValueError("preset must be between 1 and 99")
-    return bytes((0x81, 0x01, 0x04, 0x3F, 0x01, int(preset), 0xFF))
+    with _PRESET_LOCK:
+        return _PRESET_CODEC.preset_set(preset).tobytes()
 
 
 def preset_recall_packet(preset: int) -> bytes:
     """Return the VISCA memory-recall packet for a 1-based preset number."""
-    if not 1 <= int(preset) <= 99:
-        raise ValueError("preset must be between 1 and 99")
-    return bytes((0x81, 0x01, 0x04, 0x3F, 0x02, int(preset), 0xFF))
+    with _PRESET_LOCK:
+        return _PRESET_CODEC.preset_recall(preset).tobytes()
+
+
+SNAPSHOT_MAX_BYTES = 2 * 1024 * 1024
+SNAPSHOT_HEADERS = {
+    "Accept": "image/jpeg,image/png",
+    "Cache-Control": "no-cache, no-store, max-age=0",
+    "Pragma": "no-cache",
+}
 
 
 def validate_snapshot(data: bytes, content_type: str = "") -> bytes:
     """Accept only bounded JPEG/PNG snapshot payloads."""
-    if len(data) > 2 * 1024 * 1024 or len(data) < 16:
+    if len(data) > SNAPSHOT_MAX_BYTES or len(data) < 16:
         raise ValueError("snapshot size rejected")
     if data[:2] == b"\xff\xd8" and data[-2:] == b"\xff\xd9":
         return data
@@ -78,18 +158,376 @@ def validate_snapshot(data: bytes, content_type: str = "") -> bytes:
     raise ValueError("snapshot type rejected")
 
 
+class SnapshotClient:
+    """Keep-alive ``/snapshot.jpg`` fetcher for one camera web server."""
+
+    def __init__(self, host, port=80, timeout=1.5, path="/snapshot.jpg"):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.path = path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def fetch(self) -> bytes:
+        """Return one cache-busted, validated frame; redirects are rejected."""
+        with self._lock:
+            reused = self._connection is not None
+            try:
+                return self._fetch_locked()
+            except (RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                self._close_locked()
+                if not reused:
+                    raise
+            return self._fetch_locked()  # the idle keep-alive socket had gone stale
+
+    def _fetch_locked(self):
+        if self._connection is None:
+            self._connection = HTTPConnection(self.host, self.port, timeout=self.timeout)
+        query = urlencode({"ptzpad_ts": time.time_ns()})
+        try:
+            self._connection.request("GET", f"{self.path}?{query}", headers=SNAPSHOT_HEADERS)
+            response = self._connection.getresponse()
+            if 300 <= response.status < 400:
+                raise ValueError("snapshot redirect rejected")
+            if response.status != 200:
+                raise ValueError(f"snapshot HTTP {response.status}")
+            if (response.length or 0) > SNAPSHOT_MAX_BYTES:
+                raise ValueError("snapshot size rejected")
+            data = response.read(SNAPSHOT_MAX_BYTES + 1)
+            if response.will_close or not response.isclosed():
+                self._close_locked()
+            return validate_snapshot(data, response.getheader("Content-Type", ""))
+        except (ValueError, OSError, HTTPException):
+            self._close_locked()
+            raise
+
+    def close(self):
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class PositionWatch:
+    """Report when a TCP camera's pan/tilt position stops changing.
+
+    Returns None when the camera cannot answer, so callers fall back to
+    comparing frames.
+    """
+
+    def __init__(self, camera, timeout=0.25):
+        self.camera = camera
+        self.timeout = timeout
+        self._last = None
+
+    def __call__(self):
+        host, proto, port = self.camera[:3]
+        if str(proto).lower() != "tcp":
+            return None
+        try:
+            with socket.create_connection((host, port), timeout=self.timeout) as sock:
+                sock.settimeout(self.timeout)
+                sock.sendall(INQUIRIES["pan_tilt_position"].packet)
+                reply = sock.recv(16)
+        except OSError:
+            return None
+        position = decode_inquiry("pan_tilt_position", reply)
+        if position is None:
+            return None
+        settled, self._last = position == self._last, position
+        return settled
+
+
+THUMBNAIL_BACKGROUND = (20, 20, 20)
+THUMBNAIL_INDEX = "index.json"
+
+
+def camera_identity(camera) -> tuple:
+    """Return the (host, protocol, port) identity thumbnails are keyed by."""
+    return tuple(camera[:3]) if isinstance(camera, tuple) else (str(camera), "tcp", 80)
+
+
+def _env_number(name, default):
+    try:
+        return max(0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def image_bytes(image) -> int:
+    """Approximate memory held by native key bytes or a decoded PIL image."""
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        return len(image)
+    width, height = image.size
+    return width * height * len(image.getbands())
+
+
+class ImageLRU:
+    """Thread-safe LRU of key images bounded by approximate bytes held."""
+
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key, image):
+        cost = image_bytes(image)
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._items[key] = (image, cost)
+            self.size += cost
+            while self.size > self.max_bytes and len(self._items) > 1:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+
+def scale_thumbnail(image, size):
+    """Fit ``image`` into a key-sized RGB tile centred on the key background."""
+    from PIL import Image
+    tile = Image.new("RGB", size, THUMBNAIL_BACKGROUND)
+    thumb = image.convert("RGB")
+    thumb.thumbnail(size)
+    tile.paste(thumb, ((size[0] - thumb.width) // 2, (size[1] - thumb.height) // 2))
+    return tile
+
+
 class ThumbnailStore:
-    def __init__(self, root=None, sleeper=time.sleep):
+    """Preset snapshots on disk plus raw key-sized variants for each deck size."""
+
+    def __init__(self, root=None, sleeper=time.sleep, cache_bytes=None,
+                 client_factory=SnapshotClient, clock=time.monotonic,
+                 max_bytes=None, max_age=None):
         self.root = Path(root or os.environ.get("PTZPAD_CACHE", "~/.cache/ptzpad/thumbnails")).expanduser()
         self.sleeper = sleeper
+        self.clock = clock
+        self.client_factory = client_factory
+        self._clients = {}
         self._lock = threading.Lock()
         self._generations = {}
+        self._versions = {}
+        self._key_sizes = set()
+        self._images = ImageLRU(
+            cache_bytes or int(os.environ.get("PTZPAD_THUMB_CACHE_BYTES", 4 * 1024 * 1024))
+        )
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            _env_number("PTZPAD_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        )
+        self.max_age = max_age if max_age is not None else (
+            _env_number("PTZPAD_CACHE_MAX_AGE_DAYS", 90) * 86400
+        )
+        self.hits = 0
+        self.misses = 0
+        self._index = self._load_index()
+        self._index_dirty = False
 
     def path(self, camera, preset):
-        identity = tuple(camera[:3]) if isinstance(camera, tuple) else (str(camera), "tcp", 80)
-        key = hashlib.sha256(repr(identity).encode()).hexdigest()[:20]
+        key = hashlib.sha256(repr(camera_identity(camera)).encode()).hexdigest()[:20]
         return self.root / f"{key}-{int(preset)}.jpg"
 
+    def _load_index(self):
+        """Read ``index.json``, rebuilding it from the files when it is unusable."""
+        try:
+            entries = json.loads((self.root / THUMBNAIL_INDEX).read_text(encoding="utf-8"))["entries"]
+            if not isinstance(entries, dict):
+                raise ValueError("index entries must be an object")
+        except (OSError, ValueError, KeyError, TypeError):
+            entries = {}
+            for path in self.root.glob("*.jpg"):
+                try:
+                    stat = path.stat()
+                    preset = int(path.stem.rsplit("-", 1)[1])
+                except (OSError, IndexError, ValueError):
+                    continue
+                size = stat.st_size + sum(
+                    variant.stat().st_size for variant in self.root.glob(f"{path.stem}-*.rgb")
+                )
+                entries[path.name] = {"camera": None, "preset": preset, "bytes": size,
+                                      "captured_at": stat.st_mtime, "last_used": stat.st_mtime,
+                                      "sha256": None}
+        return {
+            name: entry for name, entry in entries.items()
+            if isinstance(entry, dict) and Path(name).name == name and name.endswith(".jpg")
+            and (self.root / name).is_file()
+        }
+
+    def _save_index_locked(self):
+        payload = json.dumps({"version": 1, "entries": self._index}, indent=1, sort_keys=True)
+        try:
+            self._write_atomic(self.root / THUMBNAIL_INDEX, payload.encode())
+        except OSError as exc:
+            logging.info("thumbnail index not saved: %s", exc)
+        else:
+            self._index_dirty = False
+
+    def _remove_locked(self, name):
+        self._index.pop(name, None)
+        target = self.root / name
+        for path in (target, *self.root.glob(f"{target.stem}-*.rgb")):
+            try: path.unlink()
+            except FileNotFoundError: pass
+        self._versions.pop(target, None)
+
+    def enforce_budget(self, now=None):
+        """Drop entries past the age budget, then least recently used ones over the byte budget."""
+        now = time.time() if now is None else now
+        with self._lock:
+            evict = [
+                name for name, entry in self._index.items()
+                if self.max_age and now - entry.get("captured_at", 0) > self.max_age
+            ]
+            remaining = [(name, entry) for name, entry in self._index.items() if name not in evict]
+            total = sum(entry.get("bytes", 0) for _, entry in remaining)
+            for name, entry in sorted(remaining, key=lambda item: item[1].get("last_used", 0)):
+                if total <= self.max_bytes:
+                    break
+                evict.append(name)
+                total -= entry.get("bytes", 0)
+            for name in evict:
+                self._remove_locked(name)
+            self._save_index_locked()
+        return len(evict)
+
+    def prune(self, cameras):
+        """Delete thumbnails of cameras that are no longer configured."""
+        keep = {self.path(camera, 0).stem.rsplit("-", 1)[0] for camera in cameras}
+        with self._lock:
+            orphans = [name for name in self._index if name.rsplit("-", 1)[0] not in keep]
+            for name in orphans:
+                self._remove_locked(name)
+            if orphans or self._index_dirty:
+                self._save_index_locked()
+        return len(orphans)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "bytes": sum(entry.get("bytes", 0) for entry in self._index.values()),
+                "entries": len(self._index),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+    def _touch(self, target, hit, grown=0):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            entry = self._index.get(target.name)
+            if entry is not None:
+                entry["last_used"] = time.time()
+                entry["bytes"] = entry.get("bytes", 0) + grown
+                self._index_dirty = True  # written with the next budget pass or on close
+
+    @staticmethod
+    def variant_path(target, size):
+        return target.with_name(f"{target.stem}-{size[0]}x{size[1]}.rgb")
+
+    def register_key_size(self, size):
+        """Produce variants of this key size for every later capture."""
+        with self._lock:
+            self._key_sizes.add((int(size[0]), int(size[1])))
+
+    def key_image(self, camera, preset, size):
+        """Return the key-sized RGB tile for a preset, or None without a thumbnail.
+
+        Tiles come from memory, then the raw variant on disk; the full snapshot
+        is only decoded when no variant of this size exists yet.
+        """
+        from PIL import Image
+        size = (int(size[0]), int(size[1]))
+        self.register_key_size(size)
+        version = self.version(camera, preset)
+        if version is None:
+            return None
+        cache_key = (version, size)
+        target = self.path(camera, preset)
+        tile = self._images.get(cache_key)
+        if tile is not None:
+            self._touch(target, hit=True)
+            return tile
+        variant = self.variant_path(target, size)
+        grown = 0
+        try:
+            data = variant.read_bytes()
+            if len(data) != size[0] * size[1] * 3:
+                raise ValueError("truncated thumbnail variant")
+            tile = Image.frombytes("RGB", size, data)
+        except (OSError, ValueError):
+            with Image.open(target) as original:
+                tile = scale_thumbnail(original, size)
+            grown = len(tile.tobytes())
+            self._write_atomic(variant, tile.tobytes())
+        self._images.put(cache_key, tile)
+        self._touch(target, hit=False, grown=grown)
+        return tile
+
+    def _write_atomic(self, target, data):
+        target.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(prefix=".tmp-", dir=str(target.parent))
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(temp, target)
+        finally:
+            try: os.unlink(temp)
+            except FileNotFoundError: pass
+
+    def _variants(self, data):
+        """Decode a capture once and scale it to every registered key size."""
+        with self._lock:
+            sizes = sorted(self._key_sizes)
+        if not sizes:
+            return {}
+        try:
+            from io import BytesIO
+            from PIL import Image
+            with Image.open(BytesIO(data)) as original:
+                original.load()
+                return {size: scale_thumbnail(original, size).tobytes() for size in sizes}
+        except Exception:  # undecodable payloads still keep the original
+            return {}
+
+    def version(self, camera, preset):
+        """Return a token that changes whenever the stored thumbnail does."""
+        target = self.path(camera, preset)
+        with self._lock:
+            if target in self._versions:
+                return self._versions[target]
+        try:
+            stat = target.stat()
+            token = (target.name, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            token = None
+        with self._lock:
+            return self._versions.setdefault(target, token)
+
     def reserve(self, camera, preset):
         target = self.path(camera, preset)
         with self._lock:
@@ -97,32 +535,47 @@ class ThumbnailStore:
             self._generations[target] = token
         return target, token
 
-    def capture(self, camera, preset, timeout=1.5, reservation=None):
+    def client(self, camera, timeout=1.5):
+        """Return the shared keep-alive snapshot client for a camera host."""
         host = camera[0] if isinstance(camera, tuple) else str(camera)
-        target, generation = reservation or self.reserve(camera, preset)
-        class NoRedirect(HTTPRedirectHandler):
-            def redirect_request(self, req, fp, code, msg, headers, newurl):
-                raise ValueError("snapshot redirect rejected")
+        with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                client = self._clients[host] = self.client_factory(host, timeout=timeout)
+            return client
 
-        def fetch():
-            query = urlencode({"ptzpad_ts": time.time_ns()})
-            request = Request(
-                f"http://{host}/snapshot.jpg?{query}",
-                headers={
-                    "Accept": "image/jpeg,image/png",
-                    "Cache-Control": "no-cache, no-store, max-age=0",
-                    "Pragma": "no-cache",
-                },
-            )
-            with build_opener(NoRedirect).open(request, timeout=timeout) as response:
-                return validate_snapshot(
-                    response.read(2 * 1024 * 1024 + 1),
-                    response.headers.get("Content-Type", ""),
-                )
+    def close(self):
+        with self._lock:
+            if self._index_dirty:
+                self._save_index_locked()
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+    def fresh_frame(self, client, deadline=2.0, settled=None, interval=0.1):
+        """Poll frames until two match or ``settled()`` reports the camera stopped.
+
+        The first frame may be a stale buffer, so at least two are fetched;
+        after ``deadline`` seconds the latest frame is used.
+        """
+        end = self.clock() + deadline
+        previous = None
+        still = False
+        frames = 0
+        while True:
+            data = client.fetch()
+            frames += 1
+            digest = hashlib.sha256(data).digest()
+            if frames > 1 and (digest == previous or still or self.clock() >= end):
+                return data
+            previous = digest
+            still = bool(settled and settled())
+            self.sleeper(interval)
 
-        fetch()
-        self.sleeper(0.25)
-        data = fetch()
+    def capture(self, camera, preset, timeout=1.5, reservation=None, deadline=2.0, settled=None):
+        target, generation = reservation or self.reserve(camera, preset)
+        data = self.fresh_frame(self.client(camera, timeout), deadline, settled)
+        variants = self._variants(data)
         target.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
         fd, temp = tempfile.mkstemp(prefix=".snapshot-", dir=str(target.parent))
         try:
@@ -131,10 +584,25 @@ class ThumbnailStore:
             with self._lock:
                 if self._generations.get(target) != generation:
                     return target
+                for stale in target.parent.glob(f"{target.stem}-*.rgb"):
+                    stale.unlink(missing_ok=True)
+                for size, tile in variants.items():
+                    self._write_atomic(self.variant_path(target, size), tile)
                 os.replace(temp, target)
+                self._versions.pop(target, None)
+                now = time.time()
+                self._index[target.name] = {
+                    "camera": list(camera_identity(camera)),
+                    "preset": int(preset),
+                    "bytes": len(data) + sum(len(tile) for tile in variants.values()),
+                    "captured_at": now,
+                    "last_used": now,
+                    "sha256": hashlib.sha256(data).hexdigest(),
+                }
         finally:
             try: os.unlink(temp)
             except FileNotFoundError: pass
+        self.enforce_budget()
         return target
 
 
@@ -143,18 +611,18 @@ def parse_visca_telemetry(response: bytes) -> dict:
     if not response or response[0] & 0xF0 != 0x90:
         return {}
     values = {}
-    if len(response) >= 5 and response[1] == 0x50:
+    if len(response) >= 4 and response[1] == 0x50:
         raw = response[2:-1]
         values["value"] = raw.hex()
     return values
 
 
 def telemetry_mode(label: str, raw: str) -> str:
-    maps = {
-        "wb_mode": {"00": "Auto", "01": "Indoor", "02": "Outdoor", "03": "OnePush", "05": "Manual", "20": "ColorTemp"},
-        "ae_mode": {"00": "Auto", "03": "Manual", "0a": "SAE", "0b": "AAE", "0d": "Bright"},
-    }
-    return maps.get(label, {}).get(raw.lower(), raw)
+    table = {"wb_mode": WB_MODES, "ae_mode": AE_MODES}.get(label, {})
+    try:
+        return table.get(int(raw, 16), raw)
+    except ValueError:
+        return raw
 
 
 def camera_label_lines(name: str, max_chars: int = 10) -> list[str]:
@@ -190,16 +658,57 @@ def status_key_lines(
     return []
 
 
-WB_INQUIRY = b"\x81\x09\x04\x35\xff"
-AE_INQUIRY = b"\x81\x09\x04\x39\xff"
+STATUS_KINDS = ("status", "status_next", "status_cameras")
+
+
+def key_content(key, kind, preset_slot, key_count, state):
+    """Return the text lines a key displays for the given controller state."""
+    armed = state["armed"]
+    if kind in STATUS_KINDS:
+        return tuple(status_key_lines(
+            key,
+            state["index"],
+            state["total"],
+            state["name"],
+            state["camera"],
+            state["max_speed"],
+            state["zoom_speed"],
+            state["telemetry"],
+        ))
+    if kind == "save" and key_count != 15:
+        telemetry = state["telemetry"]
+        return (
+            "SAVE" + ("*" if armed else ""),
+            *camera_label_lines(state["name"]),
+            f"WB {telemetry.get('wb_mode', '-')} AE {telemetry.get('ae_mode', '-')}",
+        )
+    if kind == "camera":
+        names = state.get("names") or ()
+        name = names[preset_slot] if preset_slot < len(names) else f"Camera {preset_slot + 1}"
+        return (f"Cam {preset_slot + 1}", *camera_label_lines(name))
+    index, total = state["index"], state["total"]
+    page, pages = state.get("page", 0), state.get("pages", 1)
+    labels = {
+        "previous": f"< {index + 1}/{total}",
+        "next": f"{index + 1}/{total} >",
+        "save": "SAVE" + ("*" if armed else ""),
+        "preset": str(preset_slot),
+        "page_next": f"Pg {page + 1}/{pages} >",
+        "page_prev": f"< Pg {page + 1}/{pages}",
+        "cameras": "CAMERAS",
+        "back": "BACK",
+    }
+    return (labels.get(kind, ""),)
+
+
+WB_INQUIRY = INQUIRIES["wb_mode"].packet
+AE_INQUIRY = INQUIRIES["ae_mode"].packet
 
 
 def inquiry_packet(name: str) -> bytes:
-    if name == "wb_mode":
-        return WB_INQUIRY
-    if name == "ae_mode":
-        return AE_INQUIRY
-    raise ValueError("unsupported inquiry")
+    if name not in INQUIRIES:
+        raise ValueError("unsupported inquiry")
+    return INQUIRIES[name].packet
 
 
 def poll_visca_telemetry(camera, timeout=0.25) -> dict:
@@ -236,76 +745,203 @@ def resolve_deck_action(action: DeckAction, armed: bool) -> tuple[bool, bytes |
     return armed, None, None
 
 
+def deck_max_fps(default=15.0) -> float:
+    """Read the render rate cap from ``PTZPAD_DECK_MAX_FPS``."""
+    try:
+        return max(1.0, float(os.environ.get("PTZPAD_DECK_MAX_FPS", default)))
+    except ValueError:
+        return default
+
+
+class DeckSession:
+    """One connected deck: its device handle, display state and render worker.
+
+    State fields are guarded by the controller lock; ``device_lock`` only
+    serialises writes to this deck, so a slow deck never blocks another.
+    """
+
+    def __init__(self, deck=None, deck_id=None, device="", key_count=0, path=None):
+        self.deck = deck
+        self.deck_id = deck_id
+        self.device = device
+        self.key_count = key_count
+        self.path = path
+        self.device_lock = threading.RLock()
+        self.closed = False
+        self.pushed = {}
+        self.key_images = ImageLRU()
+        self.armed = False
+        self.camera_index = 0
+        self.camera_name = "Camera"
+        self.camera_count = 1
+        self.camera_host = None
+        self.camera_names = ()
+        self.camera_presets = None
+        self.max_speed = 24
+        self.zoom_speed = 7
+        self.view = "presets"
+        self.page = {"presets": 0, "cameras": 0}
+        self.render_wake = threading.Event()
+        self.render_thread = None
+        self.render_pending = False
+        self.next_frame_at = 0.0
+        self.render_ms = None
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self.last_render_at = None
+
+    def copy_view(self, other):
+        """Start from another session's camera state, e.g. when a deck connects."""
+        for name in ("camera_index", "camera_name", "camera_count", "camera_host", "camera_names",
+                     "camera_presets", "max_speed", "zoom_speed"):
+            setattr(self, name, getattr(other, name))
+
+
 class StreamDeckController:
-    """Best-effort first-device controller with retry and clean shutdown."""
+    """Best-effort controller for every attached deck, with retry and clean shutdown.
+
+    Decks are identified by serial number; each gets a :class:`DeckSession`
+    with its own render worker and Save state, and its key events carry the
+    serial in :attr:`DeckAction.deck`.
+    """
 
-    def __init__(self, actions: "queue.Queue[DeckAction]", retry_seconds: float = 3.0):
+    def __init__(self, actions: "queue.Queue[DeckAction]", retry_seconds: float = 3.0, max_fps=None):
         self.actions = actions
         self.retry_seconds = retry_seconds
+        self.max_fps = max_fps or deck_max_fps()
         self._stop = threading.Event()
         self._thread = None
-        self._deck = None
-        self._armed = False
-        self._camera_index = 0
-        self._camera_name = "Camera"
-        self._camera_count = 1
+        self._template = DeckSession()
+        self._sessions = {}
         self._lock = threading.Lock()
         self._device_lock = threading.RLock()
         self._enabled = True
         self._brightness = 35
+        self._presets = None
+        self._camera_page = False
+        self._bound = frozenset()
         self._library_available = None
         self._last_error = None
-        self._last_render_at = None
         self._last_event_at = None
-        self._device = ""
-        self._key_count = 0
-        self._camera_host = None
-        self._max_speed = 24
-        self._zoom_speed = 7
         self._thumbnails = ThumbnailStore()
+        self._capture_lock = threading.Lock()
+        self._captures = {}
+        self._capture_pool = ThreadPoolExecutor(
+            max(1, int(os.environ.get("PTZPAD_CAPTURE_WORKERS", "2"))),
+            thread_name_prefix="thumbnail",
+        )
         self._telemetry = {}
         self._telemetry_camera = None
+        self._camera_telemetry = {}
         self._telemetry_thread = None
+        self._telemetry_service = None
         self.telemetry_interval = 5.0
 
-    def configure(self, enabled=True, brightness=35):
+    def configure(self, enabled=True, brightness=35, presets=None, camera_page=False, decks=None):
+        """Apply the ``streamdeck`` config section; ``presets`` enables paging.
+
+        ``decks`` maps serial numbers to camera groups; only the serials are
+        used here, to report which connected decks are bound.
+        """
         with self._device_lock:
             with self._lock:
                 self._enabled = bool(enabled)
                 self._brightness = int(brightness)
-                deck = self._deck
+                self._bound = frozenset(decks or ())
+                layout = (presets, bool(camera_page))
+                if layout != (self._presets, self._camera_page):
+                    self._presets, self._camera_page = layout
+                    for session in (self._template, *self._sessions.values()):
+                        session.view = "presets"
+                        session.page = {"presets": 0, "cameras": 0}
+                sessions = list(self._sessions.values())
                 if not enabled:
                     self._last_error = None
-            if not enabled:
-                self._close_deck_locked()
-            elif deck is not None:
+            for session in sessions:
+                if not enabled:
+                    self._detach(session)
+                    continue
                 try:
-                    deck.set_brightness(int(brightness))
+                    with session.device_lock:
+                        session.deck.set_brightness(int(brightness))
                 except Exception as exc:
                     self._record_error(str(exc))
+        self._request_render()
+
+    def deck_ids(self) -> list:
+        """Serial numbers of the connected decks."""
+        with self._lock:
+            return list(self._sessions)
+
+    def _session_snapshot_locked(self, session):
+        return {"id": session.deck_id, "device": session.device, "key_count": session.key_count,
+                "bound": session.deck_id in self._bound, "save_armed": session.armed,
+                "camera_index": session.camera_index, "camera_name": session.camera_name,
+                "view": session.view, "page": session.page[session.view],
+                "last_render_at": session.last_render_at, "render_ms": session.render_ms,
+                "frames_rendered": session.frames_rendered, "frames_skipped": session.frames_skipped}
 
     def snapshot(self):
         with self._lock:
+            sessions = list(self._sessions.values())
+            primary = sessions[0] if sessions else self._template
             return {"enabled": self._enabled, "library_available": self._library_available,
-                    "connected": self._deck is not None, "device": self._device,
-                    "key_count": self._key_count, "brightness": self._brightness,
-                    "last_error": self._last_error, "last_render_at": self._last_render_at,
-                    "last_event_at": self._last_event_at, "save_armed": self._armed,
-                    "camera_index": self._camera_index, "camera_name": self._camera_name,
-                    "telemetry": dict(self._telemetry)}
+                    "connected": bool(sessions), "device": primary.device,
+                    "key_count": primary.key_count, "brightness": self._brightness,
+                    "last_error": self._last_error, "last_render_at": primary.last_render_at,
+                    "last_event_at": self._last_event_at, "save_armed": primary.armed,
+                    "camera_index": primary.camera_index, "camera_name": primary.camera_name,
+                    "view": primary.view, "page": primary.page[primary.view],
+                    "telemetry": dict(self._telemetry), "render_ms": primary.render_ms,
+                    "frames_rendered": sum(s.frames_rendered for s in sessions or [primary]),
+                    "frames_skipped": sum(s.frames_skipped for s in sessions or [primary]),
+                    "thumbnail_cache": self._thumbnails.stats(),
+                    "decks": [self._session_snapshot_locked(session) for session in sessions]}
 
     def capture_thumbnail(self, camera, preset):
-        """Capture asynchronously; network failures never affect controls."""
-        with self._lock:
-            self._camera_host = camera[0] if isinstance(camera, tuple) else str(camera)
+        """Capture asynchronously; network failures never affect controls.
+
+        Captures share a small pool and run one at a time per camera; saving
+        the same preset again before it runs only replaces the queued request.
+        """
         reservation = self._thumbnails.reserve(camera, preset)
-        threading.Thread(target=self._capture_thumbnail, args=(camera, preset, reservation), daemon=True).start()
+        with self._capture_lock:
+            pending = self._captures.get(camera)
+            idle = pending is None
+            if idle:
+                pending = self._captures[camera] = {}
+            pending[preset] = reservation
+        if idle:
+            self._capture_pool.submit(self._drain_captures, camera)
+
+    def prune_thumbnails(self, cameras):
+        """Drop cached thumbnails for cameras no longer in the config, off the caller's thread."""
+        self._capture_pool.submit(self._prune_thumbnails, list(cameras))
+
+    def _prune_thumbnails(self, cameras):
+        try:
+            self._thumbnails.prune(cameras)
+        except OSError as exc:
+            self._record_error("thumbnail cache: " + str(exc))
+
+    def _drain_captures(self, camera):
+        while not self._stop.is_set():
+            with self._capture_lock:
+                pending = self._captures.get(camera)
+                if not pending:
+                    self._captures.pop(camera, None)
+                    return
+                preset = next(iter(pending))
+                reservation = pending.pop(preset)
+            self._capture_thumbnail(camera, preset, reservation)
+        with self._capture_lock:
+            self._captures.pop(camera, None)
 
     def _capture_thumbnail(self, camera, preset, reservation):
         try:
-            time.sleep(0.4)
-            self._thumbnails.capture(camera, preset, reservation=reservation)
-            self._render()
+            settled = PositionWatch(camera) if isinstance(camera, tuple) else None
+            self._thumbnails.capture(camera, preset, reservation=reservation, settled=settled)
+            self._request_render()
         except Exception as exc:
             self._record_error("thumbnail: " + str(exc))
 
@@ -325,17 +961,62 @@ class StreamDeckController:
                 continue
         return ""
 
+
+    @staticmethod
+    def _deck_serial(deck, fallback):
+        try:
+            serial = str(deck.get_serial_number() or "").strip("\x00 ")
+        except Exception:
+            serial = ""
+        return serial or fallback
+
+    @staticmethod
+    def _deck_path(deck):
+        try:
+            return str(deck.id())
+        except Exception:
+            return str(id(deck))
+
     def start(self) -> None:
         if self._thread is None:
             self._thread = threading.Thread(target=self._run, name="streamdeck", daemon=True)
             self._thread.start()
 
+    def attach_telemetry(self, service):
+        """Read telemetry from a shared service instead of polling cameras here."""
+        self._telemetry_service = service
+
+    def telemetry_changed(self, camera, values):
+        """Service callback; redraws only the decks showing ``camera``."""
+        with self._lock:
+            self._camera_telemetry[camera] = dict(values)
+            changed = False
+            if camera == self._telemetry_camera:
+                changed = values != self._telemetry
+                self._telemetry = dict(values)
+            showing = [s for s in self._sessions.values() if s.camera_host == camera]
+        if changed and not showing:
+            self._request_render()
+        for session in showing:
+            self._request_render(session)
+
+    def _telemetry_for_locked(self, camera):
+        if camera == self._telemetry_camera:
+            return dict(self._telemetry)
+        if camera in self._camera_telemetry:
+            return dict(self._camera_telemetry[camera])
+        service = self._telemetry_service
+        return service.get(camera) if service is not None and isinstance(camera, tuple) else {}
     def set_telemetry_camera(self, camera):
+        service = self._telemetry_service
         with self._lock:
             if camera == self._telemetry_camera:
                 return
             self._telemetry_camera = camera
-            self._telemetry = {}
+            self._telemetry = service.get(camera) if service is not None else {}
+        if service is not None:
+            service.focus(camera)
+            return
         if self._telemetry_thread is None:
             self._telemetry_thread = threading.Thread(target=self._telemetry_loop, daemon=True)
             self._telemetry_thread.start()
@@ -352,7 +1033,7 @@ class StreamDeckController:
             changed = values != self._telemetry
             self._telemetry = values
         if changed:
-            self._render()
+            self._request_render()
 
     def _telemetry_loop(self):
         while not self._stop.wait(self.telemetry_interval):
@@ -362,27 +1043,83 @@ class StreamDeckController:
                 continue
             self._poll_telemetry_once()
 
-    def update(self, camera_index: int, camera_name: str, camera_count: int, armed: bool, camera_host=None, max_speed=24, zoom_speed=7) -> None:
+    def update(self, camera_index: int, camera_name: str, camera_count: int, armed: bool, camera_host=None,
+               max_speed=24, zoom_speed=7, camera_names=None, presets=None, deck=None) -> None:
+        """Publish bridge state to one deck, or to every deck when ``deck`` is None.
+
+        ``presets`` overrides the deck's preset count for this camera.
+        """
         with self._lock:
-            self._camera_index = camera_index
-            self._camera_name = camera_name
-            self._camera_count = max(1, camera_count)
-            self._armed = armed
-            self._camera_host = camera_host
-            self._max_speed, self._zoom_speed = max_speed, zoom_speed
-        if isinstance(camera_host, tuple):
+            if deck is None:
+                targets = [self._template, *self._sessions.values()]
+            else:
+                targets = [self._sessions[deck]] if deck in self._sessions else []
+            for session in targets:
+                if camera_index != session.camera_index:
+                    session.page["presets"] = 0
+                session.camera_index = camera_index
+                session.camera_name = camera_name
+                session.camera_count = max(1, camera_count)
+                session.armed = armed
+                session.camera_host = camera_host
+                session.max_speed, session.zoom_speed = max_speed, zoom_speed
+                session.camera_presets = presets
+                if camera_names is not None:
+                    session.camera_names = tuple(camera_names)
+        if deck is None and isinstance(camera_host, tuple):
             self.set_telemetry_camera(camera_host)
-        with self._device_lock:
-            self._render()
+        for session in targets:
+            if session is not self._template:
+                self._request_render(session)
+
+    def _request_render(self, session=None) -> None:
+        """Wake a deck's render worker; bursts collapse into one render of the latest state."""
+        with self._lock:
+            sessions = [session] if session is not None else list(self._sessions.values())
+            for target in sessions:
+                if target.render_pending:
+                    target.frames_skipped += 1
+                target.render_pending = True
+                if target.render_thread is None and not self._stop.is_set() and not target.closed:
+                    target.render_thread = threading.Thread(
+                        target=self._render_loop, args=(target,), daemon=True,
+                        name=f"streamdeck-render-{target.deck_id}",
+                    )
+                    target.render_thread.start()
+        for target in sessions:
+            target.render_wake.set()
+
+    def _render_loop(self, session) -> None:
+        while not self._stop.is_set() and not session.closed:
+            session.render_wake.wait()
+            session.render_wake.clear()
+            delay = session.next_frame_at - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            with self._lock:
+                pending, session.render_pending = session.render_pending, False
+            if pending and not self._stop.is_set() and not session.closed:
+                session.next_frame_at = time.monotonic() + 1.0 / self.max_fps
+                self._render(session)
 
     def close(self) -> None:
         self._stop.set()
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            session.render_wake.set()
         if self._thread:
             self._thread.join(timeout=2)
+        for session in sessions:
+            if session.render_thread:
+                session.render_thread.join(timeout=2)
+        self._capture_pool.shutdown(wait=False)
+        self._thumbnails.close()
         if self._telemetry_thread:
             self._telemetry_thread.join(timeout=2)
         with self._device_lock:
-            self._close_deck_locked()
+            for session in sessions:
+                self._detach(session)
 
     def _run(self) -> None:
         try:
@@ -398,64 +1135,86 @@ class StreamDeckController:
         while not self._stop.is_set():
             with self._lock:
                 enabled = self._enabled
-                deck = self._deck
+                sessions = list(self._sessions.values())
             if not enabled:
                 self._stop.wait(self.retry_seconds)
                 continue
-            if deck is not None:
-                with self._device_lock:
-                    with self._lock:
-                        deck = self._deck
-                    if deck is not None and not self._deck_connected(deck):
-                        self._close_deck_locked()
+            with self._device_lock:
+                for session in sessions:
+                    if not self._deck_connected(session.deck):
+                        logging.info("Stream Deck %s disconnected", session.deck_id)
+                        self._detach(session)
+            try:
+                decks = DeviceManager().enumerate()
+            except Exception as exc:  # optional hardware must never stop bridge
+                self._record_error(exc)
+                decks = []
             with self._lock:
-                deck = self._deck
-            if deck is None:
-                candidate = None
+                known = {session.path for session in self._sessions.values()}
+            if not decks and not known:
+                self._record_error("No Stream Deck detected")
+            for candidate in decks:
+                path = self._deck_path(candidate)
+                if path in known or self._stop.is_set():
+                    continue
                 try:
-                    decks = DeviceManager().enumerate()
-                    if decks:
-                        candidate = decks[0]
-                        with self._device_lock:
-                            with self._lock:
-                                should_open = (
-                                    self._enabled
-                                    and not self._stop.is_set()
-                                    and self._deck is None
-                                )
-                                brightness = self._brightness
-                            if not should_open:
-                                continue
-                            candidate.open()
-                            device_name = self._device_name(candidate)
-                            key_count = int(candidate.key_count())
-                            if key_count < 4:
-                                raise RuntimeError("unsupported Stream Deck with fewer than 4 keys")
-                            candidate.set_brightness(brightness)
-                            candidate.set_key_callback(self._key_callback)
-                            with self._lock:
-                                self._deck = candidate
-                                self._device = device_name
-                                self._key_count = key_count
-                            self._render_locked()
-                        logging.info("Stream Deck connected (%s keys)", key_count)
-                    else:
-                        with self._lock:
-                            still_enabled = self._enabled
-                        if still_enabled:
-                            self._record_error("No Stream Deck detected")
-                except Exception as exc:  # optional hardware must never stop bridge
+                    self._open_deck(candidate, path)
+                except Exception as exc:
                     self._record_error(exc)
                     logging.info("Stream Deck unavailable: %s", exc)
-                    with self._device_lock:
-                        with self._lock:
-                            published = candidate is not None and self._deck is candidate
-                        if published:
-                            self._close_deck_locked()
-                        elif candidate is not None:
-                            self._close_device(candidate)
+                    self._close_device(candidate)
             self._stop.wait(self.retry_seconds)
 
+    def _open_deck(self, candidate, path) -> None:
+        with self._device_lock:
+            with self._lock:
+                if not self._enabled or self._stop.is_set():
+                    return
+                brightness = self._brightness
+            candidate.open()
+            key_count = int(candidate.key_count())
+            if key_count < 4:
+                raise RuntimeError("unsupported Stream Deck with fewer than 4 keys")
+            serial = self._deck_serial(candidate, path)
+            candidate.set_brightness(brightness)
+            session = self._attach(candidate, serial, self._device_name(candidate), key_count, path)
+            candidate.set_key_callback(self._key_callback)
+        logging.info("Stream Deck %s connected (%s keys)", serial, key_count)
+        self._request_render(session)
+        self.actions.put(DeckAction(ActionKind.DECK_CONNECTED, deck=serial))
+
+    def _attach(self, deck, deck_id=None, device="", key_count=None, path=None):
+        """Register an opened deck and return its session."""
+        if key_count is None:
+            key_count = int(deck.key_count())
+        with self._lock:
+            if deck_id is None or deck_id in self._sessions:
+                deck_id = f"{deck_id or 'deck'}-{len(self._sessions) + 1}"
+            session = DeckSession(deck, deck_id, device, key_count, path)
+            session.copy_view(self._template)
+            session.view, session.page = self._template.view, dict(self._template.page)
+            self._sessions[deck_id] = session
+            self._last_error = None
+        return session
+
+    def _detach(self, session) -> None:
+        with self._lock:
+            if self._sessions.get(session.deck_id) is session:
+                del self._sessions[session.deck_id]
+            session.closed = True
+        session.render_wake.set()
+        with session.device_lock:
+            deck, session.deck = session.deck, None
+            session.pushed = {}
+        self._close_device(deck)
+
+    def _session_for(self, deck):
+        with self._lock:
+            for session in self._sessions.values():
+                if session.deck is deck:
+                    return session
+        return self._template
+
     @staticmethod
     def _deck_connected(deck) -> bool:
         """Check optional connection APIs without assuming a package version."""
@@ -470,16 +1229,6 @@ class StreamDeckController:
         except Exception:
             return False
 
-    def _close_deck(self) -> None:
-        with self._device_lock:
-            self._close_deck_locked()
-
-    def _close_deck_locked(self) -> None:
-        with self._lock:
-            deck, self._deck = self._deck, None
-            self._key_count = 0
-        self._close_device(deck)
-
     @staticmethod
     def _close_device(deck) -> None:
         if deck is not None:
@@ -495,125 +1244,193 @@ class StreamDeckController:
     def _key_callback(self, deck, key: int, state: bool) -> None:
         if not state:
             return
-        with self._lock:
-            self._last_event_at = time.time()
         try:
-            action = map_key_action(key, int(deck.key_count()))
+            key_count = int(deck.key_count())
         except Exception as exc:
             self._record_error("key event: " + str(exc))
             return
+        session = self._session_for(deck)
+        with self._lock:
+            self._last_event_at = time.time()
+            layout, pages, _ = self._layout_locked(session, key_count)
+            kind, value = layout.get(key, ("none", None))
+            if kind in ("page_next", "page_prev"):
+                step = 1 if kind == "page_next" else -1
+                session.page[session.view] = (session.page[session.view] + step) % pages
+            elif kind in ("cameras", "status_cameras"):
+                session.view = "cameras"
+            elif kind in ("back", "camera"):
+                session.view = "presets"
+        if (kind in PAGE_KINDS or kind == "camera") and session is not self._template:
+            self._request_render(session)
+        action = layout_action(kind, value)
         if action is not None:
-            self.actions.put(action)
+            self.actions.put(replace(action, deck=session.deck_id))
 
-    def _render(self) -> None:
-        with self._device_lock:
-            self._render_locked()
+    def _layout_locked(self, session, key_count, view=None, page=None):
+        """Return ``(layout, page_count, page)`` for a view of the session's camera."""
+        view = view or session.view
+        page = session.page[view] if page is None else page
+        if view == "cameras":
+            layout, pages = camera_page_layout(key_count, session.camera_count, page)
+        else:
+            presets = session.camera_presets or self._presets
+            if presets is None and not self._camera_page:
+                return key_layout(key_count), 1, 0
+            layout, pages = preset_page_layout(key_count, page, presets, self._camera_page)
+        return layout, pages, page % pages
 
-    def _render_locked(self) -> None:
-        deck = self._deck
+    def _neighbour_views_locked(self, session, key_count):
+        """Views one flip away from the current one, rendered ahead of time."""
+        view = session.view
+        _, pages, page = self._layout_locked(session, key_count)
+        views = [(view, (page + step) % pages) for step in (1, -1) if pages > 1]
+        if self._camera_page:
+            other = "presets" if view == "cameras" else "cameras"
+            views.append((other, session.page[other]))
+        return [(v, self._layout_locked(session, key_count, v, p)) for v, p in dict.fromkeys(views)]
+
+    def _render(self, session=None) -> None:
+        if session is None:
+            with self._lock:
+                sessions = list(self._sessions.values())
+        else:
+            sessions = [session]
+        for target in sessions:
+            with target.device_lock:
+                deck, neighbours = self._render_locked(target)
+            if neighbours:
+                self._prerender(target, deck, neighbours)
+
+    def _render_state_locked(self, session):
+        return {
+            "index": session.camera_index,
+            "name": session.camera_name,
+            "total": session.camera_count,
+            "armed": session.armed,
+            "camera": session.camera_host,
+            "max_speed": session.max_speed,
+            "zoom_speed": session.zoom_speed,
+            "telemetry": self._telemetry_for_locked(session.camera_host),
+            "names": session.camera_names,
+        }
+
+    def _key_frames(self, layout, key_count, state):
+        """Yield ``(key, fingerprint, thumbnail)`` for every key of one page."""
+        camera = state["camera"]
+        for key in range(key_count):
+            kind, slot = layout.get(key, ("none", None))
+            lines = key_content(key, kind, slot, key_count, state)
+            version = None
+            if kind == "preset" and camera:
+                version = self._thumbnails.version(camera, slot)
+            highlighted = (kind == "save" and state["armed"]) or (kind == "camera" and slot == state["index"])
+            thumbnail = (camera, slot) if version else None
+            yield key, (kind, highlighted, lines, version), thumbnail
+
+    def _key_image(self, session, deck, key_count, fingerprint, thumbnail):
+        image = session.key_images.get(fingerprint)
+        if image is None:
+            kind, highlighted, lines, _ = fingerprint
+            image = self._draw_key(deck, key_count, kind, highlighted, lines, thumbnail)
+            session.key_images.put(fingerprint, image)
+        return image
+
+    def _render_locked(self, session):
+        """Push only keys whose content fingerprint changed since the last push.
+
+        Returns ``(deck, neighbours)`` so the caller can render the pages one
+        flip away into the image cache once the device lock is released.
+        """
+        deck = session.deck
         if deck is None:
-            return
+            return None, []
+        started = time.perf_counter()
         try:
-            from PIL import ImageDraw, ImageFont
-            from StreamDeck.ImageHelpers import PILHelper
-            font = ImageFont.load_default()
-            with self._lock:
-                idx = self._camera_index
-                name = self._camera_name
-                total = self._camera_count
-                armed = self._armed
-                camera = self._camera_host
-                max_speed = self._max_speed
-                zoom_speed = self._zoom_speed
-                telemetry = dict(self._telemetry)
             key_count = int(deck.key_count())
-            layout = key_layout(key_count)
-            for key in range(key_count):
-                kind, preset_slot = layout.get(key, ("none", None))
-                create = getattr(PILHelper, "create_key_image", None)
-                native = getattr(PILHelper, "to_native_key_format", None)
-                if native is None:
-                    native = PILHelper.to_native_format
-                native_image = create(deck) if create is not None else PILHelper.create_image(deck)
-                width, height = native_image.size
-                draw = ImageDraw.Draw(native_image)
-                background = (
-                    (120, 40, 20)
-                    if kind == "save" and armed
-                    else (20, 20, 20)
-                )
-                draw.rectangle((0, 0, width, height), fill=background)
-                thumbnail = None
-                if kind == "preset" and camera:
-                    thumbnail = self._thumbnails.path(camera, preset_slot)
-                if thumbnail and thumbnail.exists():
-                    try:
-                        from PIL import Image
-                        thumb = Image.open(thumbnail).convert(native_image.mode)
-                        thumb.thumbnail((width, height))
-                        native_image.paste(
-                            thumb,
-                            ((width - thumb.width) // 2, (height - thumb.height) // 2),
-                        )
-                        draw = ImageDraw.Draw(native_image)
-                    except Exception as exc:
-                        self._record_error("thumbnail: " + str(exc))
-                if kind in ("status", "status_next"):
-                    lines = status_key_lines(
-                        key,
-                        idx,
-                        total,
-                        name,
-                        camera,
-                        max_speed,
-                        zoom_speed,
-                        telemetry,
-                    )
-                    for line_no, line in enumerate(lines):
-                        draw.text((4, 4 + line_no * 9), line, fill="white", font=font)
-                elif kind == "save" and key_count != 15:
-                    label = "SAVE" + ("*" if armed else "")
-                    draw.text((4, 4), label, fill="white", font=font)
-                    lines = camera_label_lines(name)
-                    for line_no, line in enumerate(lines):
-                        draw.text(
-                            (4, 20 + line_no * 10),
-                            line,
-                            fill="white",
-                            font=font,
-                        )
-                    status = (
-                        f"WB {telemetry.get('wb_mode', '-')} "
-                        f"AE {telemetry.get('ae_mode', '-')}"
-                    )
-                    draw.text(
-                        (4, height - 12),
-                        status,
-                        fill="white",
-                        font=font,
-                    )
-                else:
-                    labels = {
-                        "previous": f"< {idx + 1}/{total}",
-                        "next": f"{idx + 1}/{total} >",
-                        "save": "SAVE" + ("*" if armed else ""),
-                        "preset": str(preset_slot),
-                    }
-                    label = labels.get(kind, "")
-                    draw.text((4, height // 3), label, fill="white", font=font)
-                deck.set_key_image(key, native(deck, native_image))
             with self._lock:
-                self._last_render_at = time.time()
+                state = self._render_state_locked(session)
+                layout, state["pages"], state["page"] = self._layout_locked(session, key_count)
+                neighbours = [
+                    ({**state, "pages": pages, "page": page}, layout_)
+                    for _, (layout_, pages, page) in self._neighbour_views_locked(session, key_count)
+                ]
+            for key, fingerprint, thumbnail in self._key_frames(layout, key_count, state):
+                if session.pushed.get(key) == fingerprint:
+                    continue
+                deck.set_key_image(key, self._key_image(session, deck, key_count, fingerprint, thumbnail))
+                session.pushed[key] = fingerprint
+            with self._lock:
+                session.last_render_at = time.time()
                 self._last_error = None
+                session.render_ms = round((time.perf_counter() - started) * 1000, 2)
+                session.frames_rendered += 1
         except Exception as exc:
+            session.pushed = {}
             self._record_error("render: " + str(exc))
             logging.info("Stream Deck render failed: %s", exc)
-            return
+            return None, []
+        return deck, neighbours
+
+    def _prerender(self, session, deck, neighbours) -> None:
+        """Fill the image cache for nearby pages; yields to any pending render."""
+        key_count = int(deck.key_count())
+        try:
+            for state, layout in neighbours:
+                for _, fingerprint, thumbnail in self._key_frames(layout, key_count, state):
+                    if session.render_pending or self._stop.is_set():
+                        return
+                    self._key_image(session, deck, key_count, fingerprint, thumbnail)
+        except Exception as exc:
+            logging.debug("Stream Deck prerender failed: %s", exc)
+
+    def _draw_key(self, deck, key_count, kind, highlighted, lines, thumbnail):
+        """Draw one key and return it in the deck's native format."""
+        from PIL import ImageDraw, ImageFont
+        from StreamDeck.ImageHelpers import PILHelper
+        font = ImageFont.load_default()
+        create = getattr(PILHelper, "create_key_image", None)
+        native = getattr(PILHelper, "to_native_key_format", None)
+        if native is None:
+            native = PILHelper.to_native_format
+        native_image = create(deck) if create is not None else PILHelper.create_image(deck)
+        width, height = native_image.size
+        draw = ImageDraw.Draw(native_image)
+        background = (120, 40, 20) if highlighted else THUMBNAIL_BACKGROUND
+        draw.rectangle((0, 0, width, height), fill=background)
+        if thumbnail:
+            try:
+                tile = self._thumbnails.key_image(*thumbnail, (width, height))
+                if tile is not None:
+                    if tile.mode != native_image.mode:
+                        tile = tile.convert(native_image.mode)
+                    native_image.paste(tile)
+                    draw = ImageDraw.Draw(native_image)
+            except Exception as exc:
+                self._record_error("thumbnail: " + str(exc))
+        if kind in STATUS_KINDS or kind == "camera":
+            for line_no, line in enumerate(lines):
+                draw.text((4, 4 + line_no * 9), line, fill="white", font=font)
+        elif kind == "save" and key_count != 15:
+            draw.text((4, 4), lines[0], fill="white", font=font)
+            for line_no, line in enumerate(lines[1:-1]):
+                draw.text((4, 20 + line_no * 10), line, fill="white", font=font)
+            draw.text((4, height - 12), lines[-1], fill="white", font=font)
+        else:
+            draw.text((4, height // 3), lines[0], fill="white", font=font)
+        return native(deck, native_image)
 
 
 def map_key_action(key: int, key_count: int) -> DeckAction | None:
     """Pure key mapping helper used by tests and callback implementations."""
-    kind, preset = key_layout(key_count).get(key, ("none", None))
+    return layout_action(*key_layout(key_count).get(key, ("none", None)))
+
+
+def layout_action(kind: str, value: int | None) -> DeckAction | None:
+    """Return the bridge action for a layout entry; page keys have none."""
+    if kind == "camera":
+        return DeckAction(ActionKind.SELECT_CAMERA, camera=value)
+    preset = value
     if kind == "status_next":
         return DeckAction(ActionKind.NEXT_CAMERA)
     if kind == "previous":
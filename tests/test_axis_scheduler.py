@@ -0,0 +1,74 @@
+import unittest
+
+from axis_scheduler import AXES, NEUTRAL_MOVE, AxisBank, AxisScheduler, AxisSpec
+
+ACTIVE_MOVE = (2, 2, 2, 2)
+TCP_CAM = ("10.0.0.1", "tcp", 5678)
+UDP_CAM = ("10.0.0.2", "udp", 52381)
+
+# (axis, camera, [(direction, speed), ...], expected commands) taken from the
+# zoom_control and input_control unit tests; None means nothing is sent.
+SCENARIOS = [
+    ("zoom", TCP_CAM, [(1, None), (1, None)], [1, None]),
+    ("zoom", UDP_CAM, [(1, None), (1, None), (-1, None)], [1, None, -1]),
+    ("zoom", TCP_CAM, [(1, 1), (1, 1), (1, 3)], [1, None, 1]),
+    ("zoom", TCP_CAM, [(1, 4), (1, None), (0, None)], [1, None, 0]),
+    ("zoom", UDP_CAM, [(1, None)] + [(0, None)] * 4, [1, 0, 0, 0, None]),
+    ("zoom", TCP_CAM, [(1, None)] + [(0, None)] * 4, [1, 0, 0, 0, None]),
+    ("move", TCP_CAM, [(NEUTRAL_MOVE, None)] * 2, [NEUTRAL_MOVE, None]),
+    ("move", UDP_CAM, [(ACTIVE_MOVE, None)] + [(NEUTRAL_MOVE, None)] * 4,
+     [ACTIVE_MOVE, NEUTRAL_MOVE, NEUTRAL_MOVE, NEUTRAL_MOVE, None]),
+    ("move", TCP_CAM, [(ACTIVE_MOVE, None)] + [(NEUTRAL_MOVE, None)] * 2, [ACTIVE_MOVE, NEUTRAL_MOVE, None]),
+    ("focus", TCP_CAM, [(0, None), (1, None), (1, None), (0, None), (0, None)], [None, 1, None, 0, None]),
+    ("focus", UDP_CAM, [(1, None)] + [(0, None)] * 4, [1, 0, 0, 0, None]),
+]
+
+
+class AxisSchedulerTests(unittest.TestCase):
+    def test_packet_counts_match_the_original_schedulers(self):
+        for axis, camera, requests, expected in SCENARIOS:
+            with self.subTest(axis=axis, protocol=camera[1], requests=requests):
+                scheduler = AxisScheduler(AXES[axis])
+                sent = [scheduler.next(direction, camera[1], speed) for direction, speed in requests]
+                self.assertEqual(sent, expected)
+
+    def test_bank_steps_every_camera_in_one_pass(self):
+        bank = AxisBank()
+        started = bank.step([(UDP_CAM, "zoom", 1, None), (TCP_CAM, "zoom", 1, None)])
+        self.assertEqual(started, [(UDP_CAM, "zoom", 1), (TCP_CAM, "zoom", 1)])
+        released = [(UDP_CAM, "zoom", 0, None), (TCP_CAM, "zoom", 0, None),
+                    (UDP_CAM, "move", NEUTRAL_MOVE, None)]
+        counts = [len(bank.step(released)) for _ in range(4)]
+        self.assertEqual(counts, [3, 2, 2, 0])
+        self.assertFalse(bank.pending(UDP_CAM))
+        bank.step([(UDP_CAM, "zoom", 1, None)])
+        bank.step([(UDP_CAM, "zoom", 0, None)])
+        self.assertTrue(bank.pending(UDP_CAM))
+        self.assertFalse(bank.pending(TCP_CAM))
+        bank.reset(UDP_CAM)
+        self.assertEqual(bank.scheduler(UDP_CAM, "move").direction, None)
+        self.assertEqual(bank.scheduler(TCP_CAM, "zoom").direction, 0)
+
+    def test_keepalive_refreshes_only_active_axes(self):
+        scheduler = AxisScheduler(AxisSpec(keepalive=1.0))
+        self.assertEqual(scheduler.next(1, now=0.0), 1)
+        self.assertIsNone(scheduler.next(1, now=0.5))
+        self.assertEqual(scheduler.next(1, now=1.0), 1)
+        self.assertEqual(scheduler.next(0, now=1.2), 0)
+        self.assertIsNone(scheduler.next(0, now=5.0))
+
+    def test_pending_reports_only_unsent_commands(self):
+        bank = AxisBank({"iris": AxisSpec(keepalive=1.0)})
+        bank.step([(TCP_CAM, "iris", 1, None)], now=0.0)
+        self.assertFalse(bank.pending(TCP_CAM, 0.5))
+        self.assertTrue(bank.pending(TCP_CAM, 1.0))
+        self.assertEqual(bank.step([(TCP_CAM, "iris", 1, None)], now=1.0), [(TCP_CAM, "iris", 1)])
+        self.assertFalse(bank.pending(TCP_CAM, 1.5))
+
+    def test_schedulers_are_slotted(self):
+        with self.assertRaises(AttributeError):
+            AxisScheduler().extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import json
+import os
+import queue
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from bridge_split import (
+    SLOT_HEADER, STOP, RingQueue, SharedRegion, SplitBridge, Worker, apply_realtime,
+)
+from streamdeck_control import ActionKind, DeckAction
+
+
+class _Target:
+    def __init__(self, decks=()):
+        self.calls = []
+        self.decks = list(decks)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def deck_ids(self):
+        return self.decks
+
+    def snapshot(self):
+        return {"from": "worker"}
+
+
+class SharedRegionTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "bridge.shm"
+        self.bridge = SharedRegion(self.path, create=True, slots=4, slot_size=64, block_size=256)
+        self.worker = SharedRegion(self.path)
+
+    def tearDown(self):
+        self.worker.close()
+        self.bridge.close(unlink=True)
+        self.assertFalse(self.path.exists())
+        self.tmp.cleanup()
+
+    def test_ring_passes_messages_in_order_and_drops_when_full(self):
+        for index in range(5):
+            self.assertEqual(self.bridge.to_worker.put(bytes([index])), index < 4)
+        self.assertEqual(self.bridge.to_worker.dropped, 1)
+        self.assertEqual([self.worker.to_worker.get() for _ in range(5)],
+                         [b"\x00", b"\x01", b"\x02", b"\x03", None])
+        self.assertTrue(self.bridge.to_worker.put(b"again"))
+        self.assertEqual(self.worker.to_worker.get(), b"again")
+        with self.assertRaises(ValueError):
+            self.bridge.to_worker.put(bytes(64))
+
+    def test_reader_skips_a_half_written_slot_until_it_is_complete(self):
+        self.bridge.to_bridge.put(b"hello")
+        ring = self.worker.to_bridge
+        start = 64 + SLOT_HEADER.size
+        ring._buf[start] = ord("j")
+        self.assertIsNone(ring.get())
+        ring._buf[start] = ord("h")
+        self.assertEqual(ring.get(), b"hello")
+
+    def test_state_block_returns_each_complete_value_once(self):
+        self.assertIsNone(self.worker.bridge_state.read())
+        self.bridge.bridge_state.write(b"first")
+        self.bridge.bridge_state.write(b"second")
+        self.assertEqual(self.worker.bridge_state.read(), b"second")
+        self.assertIsNone(self.worker.bridge_state.read())
+        self.bridge.bridge_state._buf[0] += 1           # writer mid-update
+        self.assertIsNone(self.worker.bridge_state.read())
+
+
+class WorkerTests(unittest.TestCase):
+    def test_worker_runs_queued_calls_and_publishes_status(self):
+        with tempfile.TemporaryDirectory() as root:
+            bridge = SplitBridge(Path(root) / "bridge.shm", start=False)
+            region = SharedRegion(bridge.region.path)
+            targets = {"oled": _Target(), "streamdeck": _Target(["deck-1"]), "telemetry": _Target()}
+            worker = Worker(region, targets, Path(root) / "status.json")
+            try:
+                oled = bridge.proxy("oled", refresh=lambda: "local")
+                oled.camera_active(1, "10.0.0.2")
+                self.assertEqual(oled.refresh(), "local")
+                bridge.publish({"service": "running"}, [{"host": "10.0.0.2"}])
+                RingQueue(region.to_bridge).put(DeckAction(ActionKind.NEXT_CAMERA, deck="deck-2"))
+                self.assertTrue(worker.step())
+                self.assertEqual(targets["oled"].calls[0], ("camera_active", (1, "10.0.0.2"), {}))
+                self.assertEqual(targets["oled"].calls[1][0], "set_state")
+                written = json.loads((Path(root) / "status.json").read_text())
+                self.assertEqual(written, {"service": "running", "streamdeck": {"from": "worker"},
+                                           "telemetry": {"from": "worker"}})
+                self.assertEqual(bridge.get_nowait().kind, ActionKind.NEXT_CAMERA)
+                with self.assertRaises(queue.Empty):
+                    bridge.get_nowait()
+                self.assertEqual(bridge.deck_ids(), ["deck-1", "deck-2"])
+                bridge.calls.put((STOP, None, (), {}))
+                self.assertFalse(worker.step())
+            finally:
+                region.close()
+                bridge.close()
+
+    def test_deck_actions_wake_the_bridge_through_the_pipe(self):
+        with tempfile.TemporaryDirectory() as root:
+            woken = threading.Event()
+            bridge = SplitBridge(Path(root) / "bridge.shm", start=False, on_action=woken.set)
+            region = SharedRegion(bridge.region.path)
+            wake_read, wake_write = os.pipe()
+            watcher = bridge.watch(wake_read)
+            try:
+                RingQueue(region.to_bridge, wake_fd=wake_write).put(DeckAction(ActionKind.NEXT_CAMERA))
+                self.assertTrue(woken.wait(2))
+                self.assertEqual(bridge.get_nowait().kind, ActionKind.NEXT_CAMERA)
+            finally:
+                os.close(wake_write)
+                watcher.join(2)
+                region.close()
+                bridge.close()
+        self.assertFalse(watcher.is_alive())
+
+    def test_run_backs_off_while_quiet(self):
+        with tempfile.TemporaryDirectory() as root:
+            region = SharedRegion(Path(root) / "bridge.shm", create=True)
+            delays = []
+            worker = Worker(region, {}, Path(root) / "status.json", poll=(0.02, 0.1))
+            worker.run(lambda: len(delays) >= 5, delays.append)
+            region.close()
+        self.assertEqual(delays, [0.04, 0.08, 0.1, 0.1, 0.1])
+
+
+class RealtimeTests(unittest.TestCase):
+    def test_apply_realtime_reports_what_was_permitted(self):
+        with patch("bridge_split.os.sched_setaffinity") as affinity, \
+                patch("bridge_split.os.sched_setscheduler", side_effect=PermissionError("EPERM")):
+            with self.assertLogs(level="WARNING"):
+                self.assertEqual(apply_realtime(3, 50), {"cpu": 3})
+        affinity.assert_called_once_with(0, {3})
+        self.assertEqual(apply_realtime(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ from input_control import (
     EVDEV_LAYOUT,
     HIDAPI_LAYOUT,
     ButtonEdges,
+    InputSnapshot,
     MotionState,
     ZoomTriggerState,
     controller_layout,
@@ -74,6 +75,28 @@ class InputControlTests(unittest.TestCase):
         self.assertEqual(state.next_focus(0, "tcp"), 0)
         self.assertIsNone(state.next_focus(0, "tcp"))
 
+    def test_input_snapshot_equality_drives_the_fast_path(self):
+        axes = (0.0, 0.01, 0.5, -0.2, -1.0, -1.0)
+        first = InputSnapshot(axes, (0, 0), (False, True, False, False, False), (15, 0), HIDAPI_LAYOUT)
+        same = InputSnapshot(list(axes), [0, 0], [False, True, False, False, False], (15, 0), HIDAPI_LAYOUT)
+        self.assertEqual(first, same)
+        self.assertNotEqual(first, InputSnapshot(axes[:5] + (-0.9,), (0, 0), first.buttons, (15, 0), HIDAPI_LAYOUT))
+        self.assertNotEqual(first, InputSnapshot(axes, (1, 0), first.buttons, (15, 0), HIDAPI_LAYOUT))
+        self.assertNotEqual((first, 0, 12), (same, 1, 12))
+        self.assertEqual(first.pressed(), {"A": False, "LB": True, "RB": False, "Y": False, "LS": False})
+        with self.assertRaises(AttributeError):
+            first.extra = True
+
+    def test_trigger_release_grace_is_reported(self):
+        state = ZoomTriggerState()
+        resolve_zoom_direction(0.5, state)
+        self.assertFalse(state.releasing)
+        grace = []
+        for _ in range(3):
+            resolve_zoom_direction(0.0, state)
+            grace.append(state.releasing)
+        self.assertEqual(grace, [True, True, False])
+
     def test_dashboard_distinguishes_live_and_saved_tuning(self):
         dashboard = Path(__file__).parents[1].joinpath("ptz_dashboard.py").read_text()
         self.assertIn("Live speed", dashboard)
@@ -1,7 +1,13 @@
+import threading
 import unittest
 from unittest.mock import patch
 
-from oled_status import OledStatus
+from oled_status import ByteBudget, OledStatus, changed_spans, frame_pages, line_height, status_pages
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # pragma: no cover - Pillow ships with the OLED driver
+    Image = None
 
 
 class _Font:
@@ -14,61 +20,173 @@ class _LegacyFont:
         return (8, 7)
 
 
-class _Draw:
-    def __init__(self):
-        self.positions = []
-
-    def rectangle(self, *_args, **_kwargs):
-        pass
-
-    def text(self, position, _line, **_kwargs):
-        self.positions.append(position)
+class _Device:
+    width, height = 128, 64
 
-
-class _Canvas:
-    def __init__(self, draw):
-        self.draw = draw
-
-    def __enter__(self):
-        return self.draw
-
-    def __exit__(self, *_args):
-        return False
+    def __init__(self):
+        self.writes = []
+
+    def command(self, *args):
+        self.writes.append(("command", args))
+
+    def data(self, values):
+        self.writes.append(("data", list(values)))
+
+
+def _display():
+    display = OledStatus.__new__(OledStatus)
+    display._available = True
+    display._last_lines = []
+    display._last_update = 0.0
+    display._min_interval = 0
+    display._keepalive_interval = 30
+    display._failed_once = False
+    display._log = __import__("logging").getLogger(__name__)
+    display._lock = threading.Lock()
+    display._wake = threading.Event()
+    display._stop = threading.Event()
+    display._pending = None
+    display._frame = None
+    display._pushed_at = 0.0
+    display.bytes_written = 0
+    display._budget = ByteBudget(0)
+    display._state = None
+    display._event_lines = []
+    display._event_at = 0.0
+    display._event_hold = 5.0
+    display._page_interval = 4.0
+    display._page_index = -1
+    display._page_due = 0.0
+    display._idle = False
+    return display
+
+
+STATE = {
+    "active_camera": 1,
+    "cameras": [
+        {"name": "Wide", "host": "10.0.0.1", "protocol": "tcp", "port": 5678},
+        {"name": "Stage", "host": "10.0.0.2", "protocol": "udp", "port": 52381},
+    ],
+    "controller": {"name": "Xbox", "connected": True},
+    "max_speed": 18, "zoom_speed": 5, "deadzone": 0.15,
+    "camera_send": {"10.0.0.1": {"last_success": 5, "errors": 0},
+                    "10.0.0.2": {"last_success": 5, "last_error": 9, "errors": 3}},
+    "loop": {"rate_hz": 19.6, "target_hz": 20, "overruns": 2, "worst_ms": 130},
+}
 
 
 class OledRenderingTests(unittest.TestCase):
-    def test_render_uses_supplied_lines(self):
-        display = OledStatus.__new__(OledStatus)
-        display._available = True
-        display._last_lines = []
-        display._last_update = 0.0
-        display._min_interval = 0
-        display._keepalive_interval = 30
-        display._failed_once = False
-        display._log = __import__("logging").getLogger(__name__)
+    def test_render_posts_lines_for_the_worker(self):
+        display = _display()
         with patch.object(display, "show") as show:
             display._render(["Joystick connected", "Pad"])
-        show.assert_called_once_with(["Joystick connected", "Pad"], force=False)
-
-    def _show_positions(self, font):
-        display = OledStatus.__new__(OledStatus)
-        display._available = True
-        display._font = font
-        display._device = type(
-            "Device",
-            (),
-            {"bounding_box": (0, 0, 127, 63), "show": lambda _self: None},
-        )()
-        draw = _Draw()
-        with patch("oled_status.canvas", return_value=_Canvas(draw)):
-            display.show(["one", "two"])
-        return draw.positions
-
-    def test_show_uses_font_bbox_for_line_height(self):
-        self.assertEqual(self._show_positions(_Font()), [(0, 2), (0, 15)])
-
-    def test_show_falls_back_to_legacy_getsize(self):
-        self.assertEqual(self._show_positions(_LegacyFont()), [(0, 2), (0, 11)])
+            show.assert_not_called()
+            display._render(["Camera 2", "10.0.0.2"])
+            display._drain()
+        show.assert_called_once_with(["Camera 2", "10.0.0.2"], force=False)
+
+    def test_line_height_uses_bbox_then_legacy_getsize(self):
+        self.assertEqual(line_height(_Font()), 11)
+        self.assertEqual(line_height(_LegacyFont()), 7)
+
+    @unittest.skipIf(Image is None, "Pillow is unavailable in this environment")
+    def test_frame_pages_use_ssd1306_byte_order(self):
+        image = Image.new("1", (128, 64))
+        image.putpixel((3, 10), 1)
+        image.putpixel((127, 63), 1)
+        pages = frame_pages(image)
+        self.assertEqual((len(pages), len(pages[0])), (8, 128))
+        self.assertEqual(pages[1][3], 1 << 2)
+        self.assertEqual(pages[7][127], 1 << 7)
+        self.assertEqual(sum(map(sum, pages)), (1 << 2) + (1 << 7))
+
+    @unittest.skipIf(Image is None, "Pillow is unavailable in this environment")
+    def test_show_sends_only_changed_pages_and_columns(self):
+        display = _display()
+        display._device = _Device()
+        display._width, display._height = 128, 64
+        display._font = ImageFont.load_default()
+        display._line_height = line_height(display._font)
+        display._image = Image.new("1", (128, 64))
+        display._draw = ImageDraw.Draw(display._image)
+        display.show(["Camera 1", "10.0.0.1"])
+        self.assertEqual(display.bytes_written, 1024)
+        display._device.writes.clear()
+        display.show(["Camera 1", "10.0.0.2"])
+        commands = [args for kind, args in display._device.writes if kind == "command"]
+        self.assertTrue(commands)
+        self.assertTrue(all(args[3] == 0x22 and args[4] == args[5] for args in commands))
+        self.assertLess(display.bytes_written - 1024, 64)
+        written = display.bytes_written
+        display.show(["Camera 1", "10.0.0.2"])
+        self.assertEqual(display.bytes_written, written)
+
+    def test_status_pages_come_from_bridge_state(self):
+        pages = status_pages(STATE)
+        self.assertEqual(pages[0], ["Cam 2/2 Stage", "10.0.0.2", "udp:52381", "Xbox"])
+        self.assertEqual(pages[1], ["Speeds", "Pan/tilt 18/24", "Zoom 5/7", "Deadzone 0.15"])
+        self.assertEqual(pages[2][1:], ["10.0.0.1      ok    0", "10.0.0.2     ERR    3"])
+        self.assertEqual(pages[3], ["Control loop", "19.6 Hz of 20", "Overruns 2", "Worst 130 ms"])
+        self.assertTrue(all(len(line) <= 21 and len(page) <= 4 for page in pages for line in page))
+
+    def test_events_hold_the_screen_then_pages_rotate(self):
+        display = _display()
+        display.set_state(STATE)
+        with patch.object(display, "show") as show, patch("oled_status.time.time") as clock:
+            clock.return_value = 100.0
+            display._render(["Error", "Socket send failed"])
+            display._drain()
+            clock.return_value = 103.0
+            display._drain()
+            clock.return_value = 106.0
+            display._drain()
+            clock.return_value = 111.0
+            display._drain()
+        shown = [call.args[0] for call in show.call_args_list]
+        self.assertEqual(shown[0], ["Error", "Socket send failed"])
+        self.assertEqual(shown[1:], status_pages(STATE)[:2])
+
+    def test_pages_rotate_while_the_loop_refreshes_every_tick(self):
+        display = _display()
+        display.set_state(STATE)
+        with patch.object(display, "show") as show, patch("oled_status.time.time") as clock:
+            for tick in range(200):              # 10 s of 50 ms loop ticks
+                clock.return_value = 100.0 + tick * 0.05
+                display.refresh()
+                display._drain()
+        shown = [call.args[0] for call in show.call_args_list]
+        self.assertEqual(shown[:3], status_pages(STATE)[:3])
+
+    def test_idle_holds_the_page_and_skips_keepalives(self):
+        display = _display()
+        display.set_state({**STATE, "loop": {**STATE["loop"], "idle": True}})
+        with patch.object(display, "show") as show, patch("oled_status.time.time") as clock:
+            clock.return_value = 100.0
+            display._drain()
+            display.set_idle(True)
+            for now in (110.0, 200.0):
+                clock.return_value = now
+                display._drain()
+            display.set_idle(False)
+            clock.return_value = 210.0
+            display._drain()
+        shown = [call.args[0] for call in show.call_args_list]
+        self.assertEqual(shown, status_pages(STATE)[:2])
+        self.assertEqual(status_pages({"loop": {"idle": True}})[-1][0], "Control loop idle")
+
+    def test_byte_budget_delays_bursts(self):
+        now = [0.0]
+        budget = ByteBudget(1000, burst=1000, clock=lambda: now[0])
+        self.assertEqual(budget.reserve(800), 0.0)
+        self.assertAlmostEqual(budget.reserve(700), 0.5)
+        now[0] = 2.0
+        self.assertEqual(budget.reserve(400), 0.0)
+        self.assertEqual(ByteBudget(0).reserve(10 ** 6), 0.0)
+
+    def test_changed_spans(self):
+        previous = [bytes(8), bytes(8)]
+        current = [bytes(8), bytes([0, 0, 1, 0, 0, 2, 0, 0])]
+        self.assertEqual(list(changed_spans(previous, current)), [(1, 2, 5)])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from power_save import IdlePolicy, IdleWaiter, ProcessLoad
+
+
+class IdlePolicyTests(unittest.TestCase):
+    def test_idles_after_quiet_period_and_wakes_on_input(self):
+        policy = IdlePolicy(idle_after=10, now=0.0)
+        self.assertIsNone(policy.update(False, 9.9))
+        self.assertEqual(policy.update(False, 10.0), "sleep")
+        self.assertIsNone(policy.update(False, 50.0))
+        self.assertEqual(policy.update(True, 51.0), "wake")
+        self.assertFalse(policy.idle)
+        self.assertIsNone(policy.update(False, 60.0))
+        self.assertEqual(policy.update(False, 61.0), "sleep")
+
+    def test_zero_disables_idle(self):
+        policy = IdlePolicy(idle_after=0, now=0.0)
+        self.assertIsNone(policy.update(False, 10 ** 6))
+        self.assertFalse(policy.idle)
+
+
+class IdleWaiterTests(unittest.TestCase):
+    def test_deadzone_noise_does_not_raise_the_idle_wake_rate(self):
+        now = [0.0]
+
+        def noise(timeout_ms):                    # 100 noise events per second
+            step = min(0.01, timeout_ms / 1000)
+            now[0] += step
+            return ("axis", 0.05) if step == 0.01 else None
+
+        waiter = IdleWaiter(noise, lambda event: abs(event[1]) > 0.15, period=0.25, clock=lambda: now[0])
+        wakes = 0
+        while now[0] < 10.0:
+            self.assertFalse(waiter.wait())
+            wakes += 1
+        self.assertLessEqual(wakes / now[0], 4.0)
+
+    def test_real_input_returns_at_once(self):
+        now = [0.0]
+        events = iter([("axis", 0.05), ("axis", 0.9)])
+
+        def next_event(_timeout_ms):
+            now[0] += 0.01
+            return next(events)
+
+        waiter = IdleWaiter(next_event, lambda event: abs(event[1]) > 0.15, period=0.25, clock=lambda: now[0])
+        self.assertTrue(waiter.wait())
+        self.assertAlmostEqual(now[0], 0.02)
+
+
+class ProcessLoadTests(unittest.TestCase):
+    def test_reports_cpu_share_and_wakeups_per_second(self):
+        with tempfile.TemporaryDirectory() as root:
+            tasks = Path(root)
+            for task, switches in (("1", 100), ("2", 50)):
+                (tasks / task).mkdir()
+                (tasks / task / "status").write_text(
+                    f"Name:\tptzpad\nvoluntary_ctxt_switches:\t{switches}\nnonvoluntary_ctxt_switches:\t3\n")
+            now, cpu = [0.0], [1.0]
+            load = ProcessLoad(root, clock=lambda: now[0], cpu_clock=lambda: cpu[0])
+            (tasks / "1" / "status").write_text("voluntary_ctxt_switches:\t140\n")
+            now[0], cpu[0] = 2.0, 1.1
+            self.assertEqual(load.sample(min_interval=5), {"cpu_percent": None, "wakeups_per_s": None})
+            now[0] = 10.0
+            self.assertEqual(load.sample(min_interval=5), {"cpu_percent": 1.0, "wakeups_per_s": 4.0})
+
+    def test_missing_proc_reports_cpu_only(self):
+        now, cpu = [0.0], [0.0]
+        load = ProcessLoad(os.path.join(tempfile.gettempdir(), "no-such-task-dir"),
+                           clock=lambda: now[0], cpu_clock=lambda: cpu[0])
+        now[0], cpu[0] = 10.0, 0.5
+        self.assertEqual(load.sample(), {"cpu_percent": 5.0, "wakeups_per_s": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import importlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.client import HTTPConnection
+from unittest.mock import patch
+
+
+class AsyncDashboardServerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        os.environ["PTZPAD_TOKEN_FILE"] = os.path.join(cls.tmp.name, "token")
+        os.environ["PTZPAD_CONFIG"] = os.path.join(cls.tmp.name, "config.json")
+        os.environ["PTZPAD_STATE"] = os.path.join(cls.tmp.name, "state.json")
+        cls.mod = importlib.import_module("ptz_dashboard")
+        cls.mod.save_config({"cameras": [{"host": "127.0.0.1", "protocol": "tcp", "port": 1}]})
+        from ptz_async_server import AsyncDashboardServer
+
+        cls.server = AsyncDashboardServer(
+            ("127.0.0.1", 0), cls.mod.Handler, workers=4, queue_timeout=0.2,
+            request_timeout=1.0, max_body=cls.mod.MAX_BODY,
+        )
+        cls.server.start_background()
+        cls.auth = {"Authorization": "Bearer " + cls.mod.TOKEN}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown(); cls.tmp.cleanup()
+
+    def connection(self):
+        return HTTPConnection(*self.server.server_address, timeout=5)
+
+    def test_routes_and_auth_match_threaded_server(self):
+        connection = self.connection()
+        connection.request("GET", "/api/health")
+        response = connection.getresponse()
+        response.read()
+        self.assertEqual(response.status, 401)
+        connection = self.connection()
+        connection.request("GET", "/api/config", headers=self.auth)
+        self.assertEqual(json.load(connection.getresponse())["cameras"][0]["port"], 1)
+
+    def test_keep_alive_serves_several_requests_per_connection(self):
+        connection = self.connection()
+        for _ in range(3):
+            connection.request("GET", "/api/config", headers=self.auth)
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 200)
+        self.assertFalse(response.will_close)
+
+    def test_post_body_reaches_handler(self):
+        result = {"reachable": True, "latency_ms": 3.0}
+        with patch.object(self.mod, "test_camera", return_value=result):
+            connection = self.connection()
+            connection.request(
+                "POST", "/api/cameras/test",
+                body=json.dumps({"host": "192.168.1.20", "protocol": "tcp", "port": 5678}),
+                headers=dict(self.auth, **{"Content-Type": "application/json"}),
+            )
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertTrue(json.load(response)["reachable"])
+
+    def test_busy_route_is_shed_with_503(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_scan(subnet, protocol, port, on_result=None, full=False):
+            started.set()
+            release.wait(2)
+            return []
+
+        payload = json.dumps({"subnet": "192.168.1.0/24", "protocol": "tcp", "port": 5678})
+        headers = dict(self.auth, **{"Content-Type": "application/json"})
+        with patch.object(self.mod, "discover_network", side_effect=slow_scan):
+            first = self.connection()
+            first.request("POST", "/api/cameras/discover", body=payload, headers=headers)
+            self.assertTrue(started.wait(2))
+            second = self.connection()
+            second.request("POST", "/api/cameras/discover", body=payload, headers=headers)
+            self.assertEqual(second.getresponse().status, 503)
+            release.set()
+            self.assertEqual(first.getresponse().status, 200)
+
+    def test_previews_leave_a_worker_for_other_routes(self):
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def hold(handler, index):
+            started.release()
+            release.wait(3)
+            handler.send_response(200)
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+
+        with patch.object(self.mod.Handler, "_stream", hold):
+            viewers = []
+            for _ in range(3):
+                viewer = self.connection()
+                viewer.request("GET", "/api/cameras/0/stream", headers=self.auth)
+                viewers.append(viewer)
+                self.assertTrue(started.acquire(timeout=2))
+            extra = self.connection()
+            extra.request("GET", "/api/cameras/0/stream", headers=self.auth)
+            self.assertEqual(extra.getresponse().status, 503)
+            status = self.connection()
+            status.request("GET", "/api/config", headers=self.auth)
+            self.assertEqual(status.getresponse().status, 200)
+            release.set()
+            for viewer in viewers:
+                self.assertEqual(viewer.getresponse().status, 200)
+        for _ in range(100):                 # the count drops on the event loop
+            if not self.server.streams:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(self.server.streams, 0)
+
+    def test_slow_handler_times_out_with_504(self):
+        def stuck(camera):
+            threading.Event().wait(1.5)
+            return {"reachable": False}
+
+        with patch.object(self.mod, "test_camera", side_effect=stuck):
+            connection = self.connection()
+            connection.request(
+                "POST", "/api/cameras/test",
+                body=json.dumps({"host": "192.168.1.20", "protocol": "tcp", "port": 5678}),
+                headers=dict(self.auth, **{"Content-Type": "application/json"}),
+            )
+            self.assertEqual(connection.getresponse().status, 504)
+
+
+if __name__ == "__main__":
+    unittest.main()
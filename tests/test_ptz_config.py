@@ -71,6 +71,30 @@ class ConfigTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_config({"cameras": [{"host": "cam"}], "streamdeck": {"brightness": True}})
 
+    def test_streamdeck_page_settings_are_optional_and_validated(self):
+        config = validate_config({
+            "cameras": [{"host": "cam", "presets": 40}, {"host": "cam2"}],
+            "streamdeck": {"presets": 32, "camera_page": True},
+        })
+        self.assertEqual(config["streamdeck"], {"enabled": True, "brightness": 35, "presets": 32, "camera_page": True})
+        self.assertEqual(config["cameras"][0]["presets"], 40)
+        self.assertNotIn("presets", config["cameras"][1])
+        for bad in ({"presets": 0}, {"presets": 100}, {"presets": True}, {"camera_page": "yes"}):
+            with self.assertRaises(ValueError):
+                validate_config({"cameras": [{"host": "cam"}], "streamdeck": bad})
+        with self.assertRaises(ValueError):
+            validate_config({"cameras": [{"host": "cam", "presets": "30"}]})
+
+    def test_streamdeck_deck_bindings(self):
+        cameras = [{"host": "a"}, {"host": "b"}, {"host": "c"}]
+        config = validate_config({"cameras": cameras, "streamdeck": {"decks": {"AL1": {"cameras": [1, 3]}}}})
+        self.assertEqual(config["streamdeck"]["decks"], {"AL1": {"cameras": [1, 3]}})
+        self.assertNotIn("decks", validate_config({"cameras": cameras})["streamdeck"])
+        for bad in ([], {"AL1": {"cameras": [4]}}, {"AL1": {"cameras": []}}, {"AL1": {"cameras": [1, 1]}},
+                    {"": {"cameras": [1]}}, {"AL1": [1]}):
+            with self.assertRaises(ValueError):
+                validate_config({"cameras": cameras, "streamdeck": {"decks": bad}})
+
     def test_streamdeck_roundtrip(self):
         with tempfile.TemporaryDirectory() as td:
             path = Path(td) / "config.json"
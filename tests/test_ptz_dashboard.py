@@ -4,6 +4,7 @@ import os
 import tempfile
 import unittest
 from http.client import HTTPConnection
+from pathlib import Path
 from threading import Thread
 from unittest.mock import patch
 
@@ -40,6 +41,54 @@ class DashboardHTTPTests(unittest.TestCase):
         self.assertEqual(self.request("/api/health").status, 401)
         self.assertEqual(self.request("/api/health", Authorization="Bearer " + self.mod.TOKEN).status, 200)
 
+    def test_page_is_precompressed_and_revalidates(self):
+        import gzip
+
+        connection = HTTPConnection(*self.server.server_address)
+        connection.request("GET", "/", headers={"Accept-Encoding": "gzip"})
+        response = connection.getresponse()
+        body = response.read()
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertIn(b"PTZPad", gzip.decompress(body))
+        etag = response.getheader("ETag")
+        connection.request("GET", "/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        second = connection.getresponse()
+        second.read()
+        self.assertEqual(second.status, 304)
+
+    def test_status_etag_ignores_heartbeats_and_skips_probes(self):
+        auth = {"Authorization": "Bearer " + self.mod.TOKEN}
+        state = {"service": "running", "heartbeat": 1000.0, "active_camera": 0, "loop": {"rate_hz": 19.9}}
+        state_file = Path(self.tmp.name) / "status-etag.json"
+        state_file.write_text(json.dumps(state), encoding="utf-8")
+        with patch.object(self.mod, "STATE_FILE", state_file), \
+                patch.object(self.mod, "PROBES", self.mod.ProbeCache(ttl=60)), \
+                patch.object(self.mod, "probe", return_value="reachable") as probe:
+            first = self.request("/api/status", **auth)
+            etag = first.getheader("ETag")
+            first.read()
+            state_file.write_text(json.dumps({**state, "heartbeat": 1001.0, "loop": {"rate_hz": 20.0}}))
+            self.assertEqual(self.request("/api/status", **auth, **{"If-None-Match": etag}).status, 304)
+            self.assertEqual(probe.call_count, 1)
+            state_file.write_text(json.dumps({**state, "active_camera": 1}))
+            changed = self.request("/api/status", **auth, **{"If-None-Match": etag})
+            self.assertEqual(changed.status, 200)
+            changed.read()
+
+    def test_config_etag_follows_saved_version(self):
+        auth = {"Authorization": "Bearer " + self.mod.TOKEN}
+        first = self.request("/api/config", **auth)
+        etag = first.getheader("ETag")
+        first.read()
+        self.assertEqual(self.request("/api/config", **auth, **{"If-None-Match": etag}).status, 304)
+        self.mod.save_config({"cameras": [{"host": "127.0.0.1", "protocol": "tcp", "port": 2}]})
+        try:
+            changed = self.request("/api/config", **auth, **{"If-None-Match": etag})
+            self.assertEqual(changed.status, 200)
+            self.assertEqual(json.load(changed)["cameras"][0]["port"], 2)
+        finally:
+            self.mod.save_config({"cameras": [{"host": "127.0.0.1", "protocol": "tcp", "port": 1}]})
+
     def test_log_filters_are_bounded(self):
         response = self.request("/api/logs?lines=not-a-number&search=%27%3B%20rm%20-rf", Authorization="Bearer " + self.mod.TOKEN)
         self.assertEqual(response.status, 200)
@@ -60,6 +109,93 @@ class DashboardHTTPTests(unittest.TestCase):
             self.assertEqual(json.load(response)["model_id"], "1234")
             camera_test.assert_called_once()
 
+    def test_snapshot_endpoint_serves_the_shared_cache_with_validators(self):
+        auth = {"Authorization": "Bearer " + self.mod.TOKEN}
+        frame = (b"\xff\xd8thumb\xff\xd9", '"abc"', 1_700_000_000.0)
+        with patch.object(self.mod.SNAPSHOTS, "get", return_value=frame) as get:
+            response = self.request("/api/cameras/0/snapshot", **auth)
+            self.assertEqual((response.status, response.read()), (200, frame[0]))
+            self.assertEqual(response.getheader("Content-Type"), "image/jpeg")
+            modified = response.getheader("Last-Modified")
+            self.assertEqual(self.request("/api/cameras/0/snapshot", **auth, **{"If-None-Match": '"abc"'}).status, 304)
+            self.assertEqual(self.request("/api/cameras/0/snapshot", **auth, **{"If-Modified-Since": modified}).status, 304)
+            get.assert_called_with("127.0.0.1")
+            self.assertEqual(self.request("/api/cameras/5/snapshot", **auth).status, 404)
+            self.assertEqual(self.request("/api/cameras/0/snapshot").status, 401)
+        with patch.object(self.mod.SNAPSHOTS, "get", side_effect=OSError("refused")):
+            self.assertEqual(self.request("/api/cameras/0/snapshot", **auth).status, 502)
+
+    def test_snapshot_proxy_fetches_once_per_interval(self):
+        fetches = []
+        frames = iter([b"one", b"one", b"two", None])
+
+        class Client:
+            def __init__(self, host):
+                self.host = host
+
+            def fetch(self):
+                fetches.append(self.host)
+                data = next(frames)
+                if data is None:
+                    raise OSError("camera offline")
+                return data
+
+            def close(self):
+                pass
+
+        now = [0.0]
+        proxy = self.mod.SnapshotProxy(interval=2.0, client_factory=Client,
+                                       shrink=lambda data: data.upper(), clock=lambda: now[0])
+        first = proxy.get("cam")
+        self.assertEqual(proxy.get("cam"), first)
+        self.assertEqual((first[0], fetches), (b"ONE", ["cam"]))
+        now[0] = 2.0
+        self.assertIs(proxy.get("cam"), first)  # same bytes keep the cached thumbnail
+        now[0] = 4.0
+        second = proxy.get("cam")
+        self.assertEqual((second[0], len(fetches)), (b"TWO", 3))
+        self.assertNotEqual(second[1], first[1])
+        now[0] = 6.0
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                proxy.get("cam")
+        self.assertEqual(len(fetches), 4)
+
+    def test_mjpeg_stream_shares_one_poller_and_pauses_without_viewers(self):
+        import time
+
+        fetches = []
+
+        class Client:
+            def fetch(self):
+                fetches.append(time.monotonic())
+                return b"\xff\xd8" + str(len(fetches) // 3).encode() + b"\xff\xd9"
+
+        hub = self.mod.PreviewHub(max_viewers=2, client_for=lambda host: Client(), fps=20, shrink=bytes)
+        auth = {"Authorization": "Bearer " + self.mod.TOKEN}
+        with patch.object(self.mod, "PREVIEWS", hub):
+            viewers = [self.request("/api/cameras/0/stream", **auth) for _ in range(2)]
+            self.assertEqual(self.request("/api/cameras/0/stream", **auth).status, 503)
+            for response in viewers:
+                self.assertEqual(response.status, 200)
+                self.assertIn("multipart/x-mixed-replace", response.getheader("Content-Type"))
+                head = response.fp.readline() + response.fp.readline() + response.fp.readline()
+                self.assertIn(b"--" + self.mod.MJPEG_BOUNDARY.encode(), head)
+            feed = hub._feeds["127.0.0.1"]
+            first = feed.wait(0, 1)[1]
+            self.assertIs(feed.wait(0, 1)[1], first)  # every viewer writes the same object
+            self.assertEqual(feed.viewers, 2)
+            for response in viewers:
+                response.close()
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and (feed.viewers or feed._thread is not None):
+                time.sleep(0.05)
+            self.assertEqual((feed.viewers, feed._thread), (0, None))
+            paused = len(fetches)
+            time.sleep(0.2)
+            self.assertEqual(len(fetches), paused)
+            self.assertLess(paused, 20 * 12)
+
     def test_discovery_endpoint_uses_bounded_scanner(self):
         found = [{"host": "192.168.1.20", "protocol": "tcp", "port": 5678}]
         with patch.object(self.mod, "discover_network", return_value=found):
@@ -70,6 +206,22 @@ class DashboardHTTPTests(unittest.TestCase):
             self.assertEqual(response.status, 200)
             self.assertEqual(json.load(response)["results"], found)
 
+    def test_discovery_stream_sends_results_as_found(self):
+        found = {"host": "192.168.1.20", "protocol": "tcp", "port": 5678}
+
+        def scan(subnet, protocol, port, on_result=None, full=False):
+            on_result(found)
+            return [found]
+
+        with patch.object(self.mod, "discover_network", side_effect=scan):
+            response = self.post(
+                "/api/cameras/discover",
+                {"subnet": "all", "protocol": "tcp", "port": 5678, "stream": True},
+            )
+            self.assertEqual(response.getheader("Content-Type"), "application/x-ndjson")
+            lines = [json.loads(line) for line in response.read().splitlines()]
+        self.assertEqual(lines, [{"result": found}, {"done": True, "count": 1}])
+
 
 class DashboardHelperTests(unittest.TestCase):
     def test_public_or_overly_broad_discovery_is_rejected(self):
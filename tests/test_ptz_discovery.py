@@ -0,0 +1,188 @@
+import socket
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from ptz_discovery import (
+    DiscoveryInventory,
+    Interface,
+    InterfaceTable,
+    RttEstimator,
+    describe_model,
+    parse_visca_version,
+    read_arp_table,
+    read_interfaces,
+    scan_hosts,
+)
+
+VERSION_REPLY = bytes.fromhex("90 50 00 01 12 34 00 02 00 01 ff")
+
+
+class _TcpCamera:
+    def __init__(self):
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self):
+        connection, _ = self.server.accept()
+        with connection:
+            connection.recv(16)
+            connection.sendall(VERSION_REPLY)
+
+    def close(self):
+        self.server.close()
+
+
+class DiscoveryScannerTests(unittest.TestCase):
+    def test_rtt_estimator_bounds_timeout(self):
+        rtt = RttEstimator(initial=0.5, minimum=0.15, maximum=1.0)
+        self.assertEqual(rtt.timeout, 0.5)
+        for _ in range(5):
+            rtt.observe(0.001)
+        self.assertEqual(rtt.timeout, 0.15)
+        rtt.observe(5.0)
+        self.assertEqual(rtt.timeout, 1.0)
+
+    def test_tcp_scan_reports_camera_and_skips_refused_hosts(self):
+        camera = _TcpCamera()
+        streamed = []
+        try:
+            found = scan_hosts(
+                ["127.0.0.2", "127.0.0.1"],
+                "tcp",
+                camera.port,
+                on_result=streamed.append,
+            )
+        finally:
+            camera.close()
+        self.assertEqual([item["host"] for item in found], ["127.0.0.1"])
+        self.assertEqual(found[0]["model_id"], "1234")
+        self.assertEqual(streamed, found)
+
+    def test_udp_scan_matches_replies_by_source(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(2)
+
+        def reply():
+            data, address = server.recvfrom(64)
+            server.sendto(VERSION_REPLY, address)
+
+        thread = threading.Thread(target=reply, daemon=True)
+        thread.start()
+        try:
+            found = scan_hosts(["127.0.0.1"], "udp", server.getsockname()[1])
+        finally:
+            thread.join(2)
+            server.close()
+        self.assertEqual(found[0]["vendor_id"], "0001")
+        self.assertEqual(found[0]["protocol"], "udp")
+
+    def test_invalid_protocol_is_rejected(self):
+        with self.assertRaises(ValueError):
+            scan_hosts(["127.0.0.1"], "http", 80)
+
+    def test_version_parser_skips_leading_bytes(self):
+        self.assertEqual(parse_visca_version(b"\x00" + VERSION_REPLY)["model_id"], "1234")
+
+
+class DiscoveryInventoryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.now = [1000.0]
+        self.path = Path(self.tmp.name) / "discovery.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def inventory(self):
+        return DiscoveryInventory(self.path, clock=lambda: self.now[0])
+
+    def test_fresh_hosts_replay_without_probe_until_stale(self):
+        inventory = self.inventory()
+        camera = {"host": "192.168.1.20", "protocol": "tcp", "port": 5678,
+                  "vendor_id": "0001", "model_id": "0519", "rom_version": "0100"}
+        arp = {"192.168.1.20": "aa:bb:cc:dd:ee:ff"}
+        result = inventory.record(["192.168.1.20"], [camera], "tcp", 5678, arp)[0]
+        inventory.record(["192.168.1.21"], [], "tcp", 5678)
+        self.assertEqual(result["model_name"], "Sony model 0519")
+        self.assertEqual(result["mac"], "aa:bb:cc:dd:ee:ff")
+        inventory.save()
+
+        reloaded = self.inventory()
+        hosts = ["192.168.1.20", "192.168.1.21", "192.168.1.22"]
+        probe, cached = reloaded.plan(hosts, "tcp", 5678, arp)
+        self.assertEqual(probe, ["192.168.1.22"])
+        self.assertEqual([item["host"] for item in cached], ["192.168.1.20"])
+        self.assertTrue(cached[0]["cached"])
+
+        self.now[0] += 61
+        probe, _ = reloaded.plan(hosts, "tcp", 5678, arp)
+        self.assertEqual(probe, ["192.168.1.21", "192.168.1.22"])
+        probe, _ = reloaded.plan(hosts, "tcp", 5678, {"192.168.1.20": "11:22:33:44:55:66"})
+        self.assertIn("192.168.1.20", probe)
+
+    def test_camera_moving_to_new_address_keeps_first_seen(self):
+        inventory = self.inventory()
+        camera = {"host": "192.168.1.20", "protocol": "tcp", "port": 5678}
+        inventory.record(["192.168.1.20"], [camera], "tcp", 5678, {"192.168.1.20": "aa:aa:aa:aa:aa:aa"})
+        self.now[0] += 30
+        moved = dict(camera, host="192.168.1.30")
+        result = inventory.record(["192.168.1.30"], [moved], "tcp", 5678, {"192.168.1.30": "aa:aa:aa:aa:aa:aa"})[0]
+        self.assertEqual(result["first_seen"], 1000.0)
+        self.assertNotIn("tcp:192.168.1.20:5678", inventory.records)
+
+    def test_model_lookup_prefers_table_then_banner(self):
+        fingerprint = {"vendor_id": "0001", "model_id": "0519", "http_title": "PTZOptics Move 4K"}
+        self.assertEqual(describe_model(fingerprint, {("0001", "0519"): "Table name"}), "Table name")
+        self.assertEqual(describe_model(fingerprint, {}), "PTZOptics Move 4K")
+        self.assertEqual(describe_model({}, {}), "")
+
+    def test_arp_table_skips_incomplete_entries(self):
+        path = Path(self.tmp.name) / "arp"
+        path.write_text(
+            "IP address       HW type     Flags       HW address            Mask     Device\n"
+            "192.168.1.20     0x1         0x2         AA:BB:CC:DD:EE:FF     *        eth0\n"
+            "192.168.1.21     0x1         0x0         00:00:00:00:00:00     *        eth0\n"
+        )
+        self.assertEqual(read_arp_table(path), {"192.168.1.20": "aa:bb:cc:dd:ee:ff"})
+
+
+class InterfaceTableTests(unittest.TestCase):
+    def test_table_is_cached_until_invalidated_or_expired(self):
+        import ipaddress
+
+        now = [0.0]
+        reads = []
+
+        def reader():
+            reads.append(now[0])
+            return [
+                Interface("eth0", ipaddress.ip_address("192.168.10.5"),
+                          ipaddress.ip_network("192.168.10.0/24"), "aa:bb:cc:dd:ee:ff"),
+                Interface("lo", ipaddress.ip_address("127.0.0.1"),
+                          ipaddress.ip_network("127.0.0.0/8")),
+            ]
+
+        table = InterfaceTable(ttl=30, reader=reader, clock=lambda: now[0], watch=False)
+        details = table.private_details()
+        self.assertEqual([str(network) for _, network in details], ["192.168.10.0/24"])
+        table.private_details()
+        self.assertEqual(len(reads), 1)
+        table.invalidate()
+        self.assertEqual(table.entries()[0].mac, "aa:bb:cc:dd:ee:ff")
+        self.assertEqual(len(reads), 2)
+        now[0] = 31
+        table.entries()
+        self.assertEqual(len(reads), 3)
+
+    def test_read_interfaces_reports_loopback(self):
+        names = {entry.name for entry in read_interfaces()}
+        self.assertIn("lo", names)
+
+
+if __name__ == "__main__":
+    unittest.main()
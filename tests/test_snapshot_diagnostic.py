@@ -1,3 +1,5 @@
+import io
+import json
 import tempfile
 import unittest
 from pathlib import Path
@@ -56,6 +58,85 @@ class SnapshotDiagnosticTests(unittest.TestCase):
         self.assertEqual(opener.requests[0].headers["Pragma"], "no-cache")
         self.assertIn("ptzpad_ts=", opener.requests[0].full_url)
 
+    def test_fleet_flags_recompressed_stale_frames_per_camera(self):
+        try:
+            from PIL import Image, ImageDraw
+        except ImportError:
+            self.skipTest("Pillow is unavailable in this environment")
+
+        def jpeg(offset, quality):
+            image = Image.new("RGB", (320, 240), (30, 30, 30))
+            ImageDraw.Draw(image).rectangle((offset, 60, offset + 80, 180), fill=(240, 240, 240))
+            buffer = io.BytesIO()
+            image.save(buffer, "JPEG", quality=quality)
+            return buffer.getvalue()
+
+        frames = {
+            "stale": iter([jpeg(20, 90), jpeg(20, 70), jpeg(20, 50)]),
+            "moving": iter([jpeg(20, 90), jpeg(120, 90), jpeg(220, 90)]),
+        }
+
+        def fetch(host, opener=None):
+            if host == "offline":
+                raise OSError("timed out")
+            return next(frames[host]), {"Content-Type": "image/jpeg"}
+
+        with tempfile.TemporaryDirectory() as root:
+            cameras = snapshot_diagnostic.run_fleet(
+                ["stale", "moving", "offline"], 3, 0, Path(root), sleeper=lambda _: None, fetch=fetch
+            )
+            report = json.loads((Path(root) / "report.json").read_text())
+            self.assertTrue((Path(root) / "01-stale" / "index.html").exists())
+            self.assertIn("change", (Path(root) / "02-moving" / "index.html").read_text())
+        stale, moving, offline = cameras
+        self.assertEqual((stale["duplicates"], stale["stale"], stale["fresh"]), (0, 2, False))
+        self.assertEqual((moving["stale"], moving["fresh"]), (0, True))
+        self.assertEqual((offline["frames"], offline["errors"], offline["fresh"]), (0, 3, False))
+        self.assertEqual(moving["bytes_avg"], round(sum(r["bytes"] for r in moving["records"]) / 3))
+        self.assertIsNotNone(moving["latency_ms"]["p95"])
+        self.assertEqual([c["host"] for c in report["cameras"]], ["stale", "moving", "offline"])
+
+    def test_soak_ring_wraps_summarises_and_exports_a_window(self):
+        frames = iter([b"\xff\xd8a\xff\xd9", b"\xff\xd8a\xff\xd9", None] + [
+            b"\xff\xd8" + bytes([n]) * 8 + b"\xff\xd9" for n in range(6)
+        ])
+        now = [1000.0]
+
+        def fetch(host, opener=None):
+            data = next(frames)
+            if data is None:
+                raise OSError("timed out")
+            return data, {}
+
+        def sleeper(seconds):
+            now[0] += 10
+
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "soak.ring"
+            ring = snapshot_diagnostic.SnapshotRing(path, slots=4, slot_size=64)
+            size = path.stat().st_size
+            summaries = snapshot_diagnostic.soak(
+                "camera", 10, ring, summary_seconds=30, fetch=fetch, sleeper=sleeper,
+                clock=lambda: now[0], max_frames=9, report=lambda _: None,
+            )
+            entries = ring.entries()
+            ring.close()
+            self.assertEqual(path.stat().st_size, size)
+            self.assertEqual([entry["sequence"] for entry in entries], [6, 7, 8, 9])
+            self.assertEqual((summaries[0]["frames"], summaries[0]["errors"]), (3, 1))
+            self.assertEqual(summaries[0]["stale_rate"], 0.333)
+            self.assertEqual(sum(summary["frames"] + summary["errors"] for summary in summaries), 9)
+            logged = (Path(root) / "soak.ring.summary.jsonl").read_text().splitlines()
+            self.assertEqual(len(logged), len(summaries))
+
+            reopened = snapshot_diagnostic.SnapshotRing(path, slots=99)
+            self.assertEqual((reopened.slots, reopened.next_sequence), (4, 10))
+            records = snapshot_diagnostic.export_ring(reopened, Path(root) / "out", since=1070, until=1080)
+            self.assertEqual([record["sequence"] for record in records], [8, 9])
+            self.assertEqual((Path(root) / "out" / "frame-000009.jpg").read_bytes(), reopened.read(entries[-1]))
+            self.assertIn("frame-000008.jpg", (Path(root) / "out" / "index.html").read_text())
+            reopened.close()
+
     def test_capture_uses_fake_response(self):
         opener = Opener(b"\xff\xd8" + b"x" * 20 + b"\xff\xd9")
         data, _ = snapshot_diagnostic.capture_frame("camera", opener=opener)
@@ -1,5 +1,7 @@
+import itertools
 import queue
 import json
+import time
 import sys
 import types
 import tempfile
@@ -13,8 +15,10 @@ from streamdeck_control import (
     StreamDeckController,
     ThumbnailStore,
     camera_label_lines,
+    camera_page_layout,
     key_layout,
     map_key_action,
+    preset_page_layout,
     preset_recall_packet,
     preset_set_packet,
     resolve_deck_action,
@@ -22,6 +26,19 @@ from streamdeck_control import (
 )
 
 
+class _FrameClient:
+    def __init__(self, frames):
+        self.frames = iter(frames)
+        self.fetches = 0
+
+    def fetch(self):
+        self.fetches += 1
+        return next(self.frames)
+
+    def close(self):
+        pass
+
+
 class StreamDeckControlTests(unittest.TestCase):
     def test_key_mapping_adapts_to_key_count(self):
         self.assertEqual(map_key_action(0, 6).kind, ActionKind.PREVIOUS_CAMERA)
@@ -69,7 +86,7 @@ class StreamDeckControlTests(unittest.TestCase):
 
     def test_snapshot_is_json_safe(self):
         controller = StreamDeckController(queue.Queue())
-        controller._device = controller._device_name(type("Fake", (), {"id": lambda self: "Deck Mini"})())
+        controller._attach(object(), "A1", controller._device_name(type("Fake", (), {"id": lambda self: "Deck Mini"})()), 6)
         json.dumps(controller.snapshot())
         self.assertEqual(controller.snapshot()["device"], "Deck Mini")
 
@@ -91,7 +108,7 @@ class StreamDeckControlTests(unittest.TestCase):
 
         controller = StreamDeckController(queue.Queue())
         fake = FakeDeck()
-        controller._deck = fake
+        controller._attach(fake, "A1", key_count=6)
         controller.configure(enabled=False, brightness=20)
         self.assertEqual((fake.reset_count, fake.close_count), (1, 1))
         self.assertFalse(controller.snapshot()["enabled"])
@@ -101,7 +118,7 @@ class StreamDeckControlTests(unittest.TestCase):
         class FakeDeck:
             def set_brightness(self, value): self.brightness = value
         controller = StreamDeckController(queue.Queue())
-        fake = FakeDeck(); controller._deck = fake
+        fake = FakeDeck(); controller._attach(fake, "A1", key_count=6)
         controller.configure(enabled=True, brightness=72)
         self.assertEqual(fake.brightness, 72)
         self.assertEqual(controller.snapshot()["brightness"], 72)
@@ -146,13 +163,100 @@ class StreamDeckControlTests(unittest.TestCase):
         streamdeck_module.ImageHelpers = helpers_module
         deck = FakeDeck()
         controller = StreamDeckController(queue.Queue())
-        controller._deck = deck
+        controller._attach(deck, "A1")
         with patch.dict(sys.modules, {"StreamDeck": streamdeck_module, "StreamDeck.ImageHelpers": helpers_module}):
             controller._render()
         self.assertEqual(len(deck.images), 4)
         self.assertIsNotNone(controller.snapshot()["last_render_at"])
         self.assertIsNone(controller.snapshot()["last_error"])
 
+    def test_renderer_pushes_only_changed_keys(self):
+        try:
+            from PIL import Image
+        except ImportError:
+            self.skipTest("Pillow is unavailable in this environment")
+
+        class Helper:
+            drawn = 0
+
+            @staticmethod
+            def create_key_image(deck):
+                Helper.drawn += 1
+                return Image.new("RGB", (72, 72))
+
+            @staticmethod
+            def to_native_key_format(deck, image):
+                return image.tobytes()
+
+        class FakeDeck:
+            def __init__(self):
+                self.images = []
+
+            def key_count(self):
+                return 6
+
+            def set_key_image(self, key, image):
+                self.images.append(key)
+
+        streamdeck_module = types.ModuleType("StreamDeck")
+        helpers_module = types.ModuleType("StreamDeck.ImageHelpers")
+        helpers_module.PILHelper = Helper
+        streamdeck_module.ImageHelpers = helpers_module
+        deck = FakeDeck()
+        with tempfile.TemporaryDirectory() as root:
+            controller = StreamDeckController(queue.Queue())
+            controller._thumbnails = ThumbnailStore(root)
+            controller._attach(deck, "A1")
+            controller._request_render = controller._render
+            modules = {"StreamDeck": streamdeck_module, "StreamDeck.ImageHelpers": helpers_module}
+            with patch.dict(sys.modules, modules):
+                controller.update(0, "Cam", 2, False, "cam", max_speed=24)
+                self.assertEqual(deck.images, list(range(6)))
+                deck.images.clear()
+                controller.update(0, "Cam", 2, False, "cam", max_speed=20)
+                self.assertEqual(deck.images, [])
+                controller.update(0, "Cam", 2, True, "cam", max_speed=20)
+                self.assertEqual(deck.images, [2])
+                drawn = Helper.drawn
+                controller.update(0, "Cam", 2, False, "cam", max_speed=20)
+                self.assertEqual(Helper.drawn, drawn)
+                deck.images.clear()
+                Image.new("RGB", (8, 8)).save(controller._thumbnails.path("cam", 2))
+                controller._thumbnails._versions.clear()
+                controller._render()
+                self.assertEqual(deck.images, [4])
+
+    def test_render_worker_coalesces_bursts(self):
+        import threading
+
+        controller = StreamDeckController(queue.Queue(), max_fps=20)
+        started = threading.Event()
+        release = threading.Event()
+        rendered = []
+
+        def render(session):
+            rendered.append(session.camera_index)
+            started.set()
+            release.wait(2)
+
+        controller._render = render
+        controller._attach(object(), "A1", key_count=6)
+        try:
+            controller.update(0, "Cam", 3, False)
+            self.assertTrue(started.wait(2))
+            for index in range(1, 6):
+                controller.update(index, "Cam", 3, False)
+            release.set()
+            for _ in range(100):
+                if len(rendered) == 2:
+                    break
+                threading.Event().wait(0.02)
+            self.assertEqual(rendered, [0, 5])
+            self.assertEqual(controller.snapshot()["frames_skipped"], 4)
+        finally:
+            release.set()
+            controller.close()
+
     def test_renderer_uses_native_image_size(self):
         source = Path(__file__).parents[1].joinpath("streamdeck_control.py").read_text()
         self.assertIn("native_image.size", source)
@@ -171,97 +275,225 @@ class StreamDeckControlTests(unittest.TestCase):
         self.assertNotEqual(store.path(("cam", "tcp", 1), 1), store.path(("cam", "tcp", 2), 1))
 
     def test_thumbnail_reservation_invalidates_older_capture(self):
-        class Response:
-            headers = {"Content-Type": "image/jpeg"}
-
-            def __init__(self, payload):
-                self.payload = payload
-
-            def read(self, _):
-                return self.payload
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-        class Opener:
-            def __init__(self, payload):
-                self.payload = payload
-                self.request = None
-
-            def open(self, request, timeout):
-                self.request = request
-                return Response(self.payload)
-
         old = b"\xff\xd8" + b"old-image-data" * 2 + b"\xff\xd9"
         new = b"\xff\xd8" + b"new-image-data" * 2 + b"\xff\xd9"
         with tempfile.TemporaryDirectory() as root:
-            store = ThumbnailStore(root)
+            store = ThumbnailStore(root, sleeper=lambda _: None,
+                                   client_factory=lambda host, timeout: _FrameClient([new] * 4))
             target = store.path(("cam", "tcp", 1), 1)
             target.parent.mkdir(parents=True, exist_ok=True)
             target.write_bytes(old)
-            opener = Opener(new)
-            with patch("streamdeck_control.build_opener", return_value=opener):
-                first = store.reserve(("cam", "tcp", 1), 1)
-                second = store.reserve(("cam", "tcp", 1), 1)
-                store.capture(("cam", "tcp", 1), 1, reservation=first)
-                self.assertEqual(target.read_bytes(), old)
-                store.capture(("cam", "tcp", 1), 1, reservation=second)
+            first = store.reserve(("cam", "tcp", 1), 1)
+            second = store.reserve(("cam", "tcp", 1), 1)
+            store.capture(("cam", "tcp", 1), 1, reservation=first)
+            self.assertEqual(target.read_bytes(), old)
+            store.capture(("cam", "tcp", 1), 1, reservation=second)
             self.assertEqual(target.read_bytes(), new)
-            self.assertIn("ptzpad_ts=", opener.request.full_url)
-            self.assertEqual(
-                opener.request.headers["Cache-control"],
-                "no-cache, no-store, max-age=0",
-            )
-            self.assertEqual(opener.request.headers["Pragma"], "no-cache")
 
-    def test_thumbnail_double_fetch_persists_second_frame(self):
-        class TwoResponse:
-            def __init__(self, values):
-                self.values = iter(values)
-                self.requests = []
+    def test_thumbnail_polls_until_frames_repeat(self):
+        frames = [b"\xff\xd8" + name * 4 + b"\xff\xd9" for name in (b"stale", b"moving", b"settled")]
+        client = _FrameClient([frames[0], frames[1], frames[2], frames[2], frames[0]])
+        with tempfile.TemporaryDirectory() as root:
+            sleeps = []
+            store = ThumbnailStore(root, sleeper=sleeps.append,
+                                   client_factory=lambda host, timeout: client)
+            store.capture(("cam", "tcp", 1), 1)
+            self.assertEqual(client.fetches, 4)
+            self.assertEqual(len(sleeps), 3)
+            self.assertEqual(store.path(("cam", "tcp", 1), 1).read_bytes(), frames[2])
+
+    def test_thumbnail_uses_frame_after_camera_reports_settled(self):
+        frames = [b"\xff\xd8" + bytes([index]) * 20 + b"\xff\xd9" for index in range(5)]
+        client = _FrameClient(frames)
+        reports = iter([False, True])
+        with tempfile.TemporaryDirectory() as root:
+            store = ThumbnailStore(root, sleeper=lambda _: None,
+                                   client_factory=lambda host, timeout: client)
+            store.capture(("cam", "tcp", 1), 1, settled=lambda: next(reports))
+            self.assertEqual(store.path(("cam", "tcp", 1), 1).read_bytes(), frames[2])
+
+    def test_thumbnail_deadline_bounds_polling(self):
+        frames = [b"\xff\xd8" + bytes([index]) * 20 + b"\xff\xd9" for index in range(50)]
+        now = [0.0]
+        client = _FrameClient(frames)
 
-            def open(self, request, timeout):
-                self.requests.append(request)
+        def sleep(seconds):
+            now[0] += seconds
 
-                class R:
-                    headers = {"Content-Type": "image/jpeg"}
+        with tempfile.TemporaryDirectory() as root:
+            store = ThumbnailStore(root, sleeper=sleep, clock=lambda: now[0],
+                                   client_factory=lambda host, timeout: client)
+            store.capture(("cam", "tcp", 1), 1, deadline=0.5)
+        self.assertLessEqual(client.fetches, 7)
+
+    def test_snapshot_client_keeps_connection_and_rejects_redirects(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from streamdeck_control import SnapshotClient
 
-                    def __init__(self, data):
-                        self.data = data
+        frame = b"\xff\xd8" + b"frame-data" * 4 + b"\xff\xd9"
+        seen = {"connections": set(), "paths": [], "headers": []}
 
-                    def read(self, _):
-                        return self.data
+        class Camera(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
 
-                    def __enter__(self):
-                        return self
+            def do_GET(self):
+                seen["connections"].add(self.client_address)
+                seen["paths"].append(self.path)
+                seen["headers"].append(dict(self.headers))
+                if self.path.startswith("/redirect"):
+                    self.send_response(302)
+                    self.send_header("Location", "http://example.invalid/")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(frame)))
+                self.end_headers()
+                self.wfile.write(frame)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Camera)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client = SnapshotClient("127.0.0.1", server.server_address[1])
+            self.assertEqual(client.fetch(), frame)
+            self.assertEqual(client.fetch(), frame)
+            self.assertEqual(len(seen["connections"]), 1)
+            self.assertNotEqual(seen["paths"][0], seen["paths"][1])
+            self.assertIn("ptzpad_ts=", seen["paths"][0])
+            self.assertEqual(seen["headers"][0]["Cache-Control"], "no-cache, no-store, max-age=0")
+            self.assertEqual(seen["headers"][0]["Pragma"], "no-cache")
+            redirect = SnapshotClient("127.0.0.1", server.server_address[1], path="/redirect")
+            with self.assertRaises(ValueError):
+                redirect.fetch()
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_capture_requests_are_deduplicated_per_camera(self):
+        import threading
 
-                    def __exit__(self, *args):
-                        pass
+        controller = StreamDeckController(queue.Queue())
+        started = threading.Event()
+        release = threading.Event()
+        captured = []
 
-                return R(next(self.values))
+        def capture(camera, preset, reservation):
+            captured.append(preset)
+            started.set()
+            release.wait(2)
 
-        first = b"\xff\xd8" + b"first-frame-data" * 2 + b"\xff\xd9"
-        second = b"\xff\xd8" + b"second-frame-data" * 2 + b"\xff\xd9"
+        controller._capture_thumbnail = capture
+        camera = ("cam", "tcp", 1)
+        try:
+            controller.capture_thumbnail(camera, 1)
+            self.assertTrue(started.wait(2))
+            for _ in range(5):
+                controller.capture_thumbnail(camera, 2)
+            controller.capture_thumbnail(camera, 3)
+            release.set()
+            for _ in range(100):
+                if not controller._captures:
+                    break
+                threading.Event().wait(0.02)
+            self.assertEqual(captured, [1, 2, 3])
+        finally:
+            release.set()
+            controller.close()
+
+    def test_capture_writes_key_sized_variants_served_from_memory(self):
+        try:
+            from PIL import Image
+        except ImportError:
+            self.skipTest("Pillow is unavailable in this environment")
+        import io
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (320, 180), (200, 10, 10)).save(buffer, "JPEG")
+        frame = buffer.getvalue()
+
+        camera = ("cam", "tcp", 1)
         with tempfile.TemporaryDirectory() as root:
-            sleeps = []
-            store = ThumbnailStore(root, sleeper=sleeps.append)
-            opener = TwoResponse([first, second])
-            reservation = store.reserve(("cam", "tcp", 1), 1)
-            with patch("streamdeck_control.build_opener", return_value=opener):
-                store.capture(("cam", "tcp", 1), 1, reservation=reservation)
-            self.assertEqual(len(opener.requests), 2)
-            self.assertNotEqual(
-                opener.requests[0].full_url,
-                opener.requests[1].full_url,
-            )
-            self.assertEqual(sleeps, [0.25])
-            self.assertEqual(
-                store.path(("cam", "tcp", 1), 1).read_bytes(),
-                second,
-            )
+            store = ThumbnailStore(root, sleeper=lambda _: None,
+                                   client_factory=lambda host, timeout: _FrameClient([frame] * 2))
+            store.register_key_size((72, 72))
+            store.capture(camera, 3)
+            variant = store.variant_path(store.path(camera, 3), (72, 72))
+            self.assertEqual(len(variant.read_bytes()), 72 * 72 * 3)
+            with patch("PIL.Image.open", side_effect=AssertionError("decoded original")):
+                tile = store.key_image(camera, 3, (72, 72))
+            self.assertEqual(tile.size, (72, 72))
+            self.assertGreater(tile.getpixel((36, 36))[0], 150)
+            with patch("pathlib.Path.read_bytes", side_effect=AssertionError("disk read")):
+                self.assertIs(store.key_image(camera, 3, (72, 72)), tile)
+
+    def test_thumbnail_cache_index_budget_and_orphans(self):
+        frame = b"\xff\xd8" + b"x" * 100 + b"\xff\xd9"
+        cameras = [("a", "tcp", 1), ("b", "tcp", 1)]
+        with tempfile.TemporaryDirectory() as root:
+            store = ThumbnailStore(root, sleeper=lambda _: None, max_bytes=350, max_age=3600,
+                                   client_factory=lambda host, timeout: _FrameClient(itertools.repeat(frame)))
+            for camera in cameras:
+                store.capture(camera, 1)
+                store.capture(camera, 2)
+            self.assertFalse(store.path(cameras[0], 1).exists())
+            self.assertEqual(store.stats()["entries"], 3)
+            self.assertEqual(store.stats()["bytes"], 3 * len(frame))
+
+            reloaded = ThumbnailStore(root, max_bytes=350, max_age=3600)
+            entry = reloaded._index[store.path(cameras[1], 2).name]
+            self.assertEqual(entry["camera"], ["b", "tcp", 1])
+            self.assertEqual(entry["preset"], 2)
+            self.assertEqual(reloaded.prune([cameras[1]]), 1)
+            self.assertFalse(store.path(cameras[0], 2).exists())
+            self.assertEqual(reloaded.enforce_budget(now=time.time() + 3601), 2)
+            self.assertEqual(list(Path(root).glob("*.jpg")), [])
+
+    def test_thumbnail_last_used_is_persisted(self):
+        frame = b"\xff\xd8" + b"x" * 100 + b"\xff\xd9"
+        cameras = [("a", "tcp", 1), ("b", "tcp", 1)]
+        with tempfile.TemporaryDirectory() as root:
+            store = ThumbnailStore(root, sleeper=lambda _: None, max_bytes=1000,
+                                   client_factory=lambda host, timeout: _FrameClient(itertools.repeat(frame)))
+            for when, camera in enumerate(cameras):
+                with patch("streamdeck_control.time.time", return_value=1000.0 + when):
+                    store.capture(camera, 1)
+            with patch("streamdeck_control.time.time", return_value=2000.0):
+                store._touch(store.path(cameras[0], 1), hit=True)
+            store.close()
+
+            reloaded = ThumbnailStore(root, max_bytes=len(frame))
+            self.assertEqual(reloaded._index[store.path(cameras[0], 1).name]["last_used"], 2000.0)
+            self.assertEqual(reloaded.enforce_budget(now=2000.0), 1)
+            self.assertTrue(store.path(cameras[0], 1).exists())
+            self.assertFalse(store.path(cameras[1], 1).exists())
+
+    def test_thumbnail_index_is_rebuilt_from_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            store = ThumbnailStore(root)
+            target = store.path(("a", "tcp", 1), 4)
+            target.write_bytes(b"\xff\xd8" + b"x" * 30 + b"\xff\xd9")
+            rebuilt = ThumbnailStore(root)
+            self.assertEqual(rebuilt._index[target.name]["preset"], 4)
+            self.assertEqual(rebuilt.stats()["bytes"], 34)
+            self.assertIsNone(rebuilt.stats()["hit_rate"])
+
+    def test_image_lru_is_bounded_by_bytes(self):
+        from streamdeck_control import ImageLRU
+
+        cache = ImageLRU(max_bytes=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.get("a")
+        cache.put("c", b"1234")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"12345")
+        self.assertEqual(cache.size, 9)
 
     def test_telemetry_worker_wiring_and_render_surface(self):
         from unittest.mock import patch
@@ -312,6 +544,162 @@ class StreamDeckControlTests(unittest.TestCase):
         self.assertNotIn(DeckAction(ActionKind.PREVIOUS_CAMERA), actions)
         self.assertEqual(key_layout(6)[0][0], "previous")
 
+    def test_paged_layouts_reach_every_preset_and_camera(self):
+        layout, pages = preset_page_layout(15, 0, presets=32, camera_page=True)
+        self.assertEqual(pages, 4)
+        self.assertEqual((layout[9], layout[10], layout[14]), (("page_prev", None), ("status_cameras", None), ("page_next", None)))
+        reached = []
+        for page in range(pages):
+            layout, _ = preset_page_layout(15, page, presets=32, camera_page=True)
+            reached += [value for kind, value in layout.values() if kind == "preset"]
+        self.assertEqual(sorted(reached), list(range(1, 33)))
+        self.assertEqual(preset_page_layout(15, 0, presets=11), (key_layout(15), 1))
+        mini, pages = preset_page_layout(6, 1, presets=7, camera_page=True)
+        self.assertEqual(pages, 3)
+        self.assertEqual(mini, {0: ("cameras", None), 1: ("save", None), 5: ("page_next", None),
+                                2: ("preset", 4), 3: ("preset", 5), 4: ("preset", 6)})
+        cameras, pages = camera_page_layout(6, 8, 1)
+        self.assertEqual(pages, 2)
+        self.assertEqual(cameras[5], ("back", None))
+        self.assertEqual([cameras[key] for key in range(4)], [("camera", 4), ("camera", 5), ("camera", 6), ("camera", 7)])
+
+    def test_page_flip_is_one_burst_from_prerendered_images(self):
+        try:
+            from PIL import Image
+        except ImportError:
+            self.skipTest("Pillow is unavailable in this environment")
+
+        class Helper:
+            drawn = 0
+
+            @staticmethod
+            def create_key_image(deck):
+                Helper.drawn += 1
+                return Image.new("RGB", (72, 72))
+
+            @staticmethod
+            def to_native_key_format(deck, image):
+                return image.tobytes()
+
+        class FakeDeck:
+            def __init__(self):
+                self.images = []
+                self.drawn_at_push = []
+
+            def key_count(self):
+                return 15
+
+            def set_key_image(self, key, image):
+                self.images.append(key)
+                self.drawn_at_push.append(Helper.drawn)
+
+        streamdeck_module = types.ModuleType("StreamDeck")
+        helpers_module = types.ModuleType("StreamDeck.ImageHelpers")
+        helpers_module.PILHelper = Helper
+        streamdeck_module.ImageHelpers = helpers_module
+        deck = FakeDeck()
+        actions = queue.Queue()
+        with tempfile.TemporaryDirectory() as root:
+            controller = StreamDeckController(actions)
+            controller._thumbnails = ThumbnailStore(root)
+            controller._attach(deck, "A1")
+            controller._request_render = controller._render
+            controller.configure(presets=32, camera_page=True)
+            modules = {"StreamDeck": streamdeck_module, "StreamDeck.ImageHelpers": helpers_module}
+            with patch.dict(sys.modules, modules):
+                controller.update(0, "Cam", 3, False, "cam", camera_names=["A", "B", "C"], presets=40)
+                self.assertEqual(deck.images, list(range(15)))
+                deck.images.clear()
+                deck.drawn_at_push.clear()
+                drawn = Helper.drawn
+                controller._key_callback(deck, 14, True)
+                self.assertEqual(set(deck.drawn_at_push), {drawn})
+                self.assertEqual(sorted(deck.images), [1, 2, 3, 6, 7, 8, 9, 11, 12, 13, 14])
+                controller._key_callback(deck, 1, True)
+                self.assertEqual(actions.get_nowait(), DeckAction(ActionKind.PRESET, 10, deck="A1"))
+                controller._key_callback(deck, 10, True)
+                self.assertEqual(controller.snapshot()["view"], "cameras")
+                controller._key_callback(deck, 2, True)
+                self.assertEqual(actions.get_nowait(), DeckAction(ActionKind.SELECT_CAMERA, camera=2, deck="A1"))
+                controller.update(2, "C", 3, False, "cam", camera_names=["A", "B", "C"])
+                self.assertEqual((controller.snapshot()["view"], controller.snapshot()["page"]), ("presets", 0))
+
+    def test_every_deck_is_opened_by_serial_and_renders_independently(self):
+        import threading
+        try:
+            from PIL import Image
+        except ImportError:
+            self.skipTest("Pillow is unavailable in this environment")
+
+        class Helper:
+            @staticmethod
+            def create_key_image(deck):
+                return Image.new("RGB", (72, 72))
+
+            @staticmethod
+            def to_native_key_format(deck, image):
+                return image.tobytes()
+
+        class FakeDeck:
+            def __init__(self, serial, gate=None):
+                self.serial, self.gate = serial, gate
+                self.images = []
+                self.callback = None
+
+            def id(self): return "/dev/hid-" + self.serial
+            def open(self): pass
+            def close(self): pass
+            def reset(self): pass
+            def key_count(self): return 6
+            def deck_type(self): return "Stream Deck Mini"
+            def get_serial_number(self): return self.serial
+            def set_brightness(self, value): pass
+            def set_key_callback(self, callback): self.callback = callback
+
+            def set_key_image(self, key, image):
+                if self.gate is not None:
+                    self.gate.wait(2)
+                self.images.append(key)
+
+        gate = threading.Event()
+        decks = [FakeDeck("SLOW", gate), FakeDeck("FAST")]
+        manager_module = types.ModuleType("StreamDeck.DeviceManager")
+        manager_module.DeviceManager = lambda: types.SimpleNamespace(enumerate=lambda: decks)
+        helpers_module = types.ModuleType("StreamDeck.ImageHelpers")
+        helpers_module.PILHelper = Helper
+        streamdeck_module = types.ModuleType("StreamDeck")
+        streamdeck_module.ImageHelpers = helpers_module
+        modules = {"StreamDeck": streamdeck_module, "StreamDeck.DeviceManager": manager_module,
+                   "StreamDeck.ImageHelpers": helpers_module}
+        actions = queue.Queue()
+        controller = StreamDeckController(actions, retry_seconds=0.05)
+        try:
+            with tempfile.TemporaryDirectory() as root, patch.dict(sys.modules, modules):
+                controller._thumbnails = ThumbnailStore(root)
+                controller.start()
+                connected = {actions.get(timeout=2), actions.get(timeout=2)}
+                self.assertEqual(connected, {DeckAction(ActionKind.DECK_CONNECTED, deck="SLOW"),
+                                             DeckAction(ActionKind.DECK_CONNECTED, deck="FAST")})
+                self.assertEqual(sorted(controller.deck_ids()), ["FAST", "SLOW"])
+                controller.update(1, "Stage", 3, True, "stage", deck="FAST")
+                for _ in range(100):
+                    if 1 in decks[1].images:
+                        break
+                    time.sleep(0.02)
+                self.assertIn(1, decks[1].images)
+                self.assertEqual(decks[0].images, [])
+                by_id = {deck["id"]: deck for deck in controller.snapshot()["decks"]}
+                self.assertEqual((by_id["FAST"]["save_armed"], by_id["FAST"]["camera_index"]), (True, 1))
+                self.assertEqual((by_id["SLOW"]["save_armed"], by_id["SLOW"]["camera_index"]), (False, 0))
+                decks[0].callback(decks[0], 1, True)
+                decks[1].callback(decks[1], 4, True)
+                self.assertEqual(actions.get_nowait(), DeckAction(ActionKind.NEXT_CAMERA, deck="SLOW"))
+                self.assertEqual(actions.get_nowait(), DeckAction(ActionKind.PRESET, 2, deck="FAST"))
+                gate.set()
+        finally:
+            gate.set()
+            controller.close()
+
     def test_original_v2_status_lines(self):
         telemetry = {"wb_mode": "Auto", "ae_mode": "Manual"}
         camera = ("192.168.10.44", "tcp", 5678)
@@ -343,6 +731,31 @@ class StreamDeckControlTests(unittest.TestCase):
         self.assertIn("zoom_speed = max(zoom_speed - 1", source)
         self.assertGreaterEqual(source.count("_update_streamdeck()"), 7)
 
+    def test_shared_telemetry_service_replaces_local_polling(self):
+        class Service:
+            def __init__(self):
+                self.focused = []
+
+            def get(self, camera):
+                return {"wb_mode": "Auto"} if camera == ("a", "tcp", 1) else {}
+
+            def focus(self, camera):
+                self.focused.append(camera)
+
+        service = Service()
+        controller = StreamDeckController(queue.Queue())
+        controller._request_render = lambda session=None: None
+        controller.attach_telemetry(service)
+        controller.set_telemetry_camera(("a", "tcp", 1))
+        self.assertEqual(controller.snapshot()["telemetry"], {"wb_mode": "Auto"})
+        self.assertIsNone(controller._telemetry_thread)
+        controller.telemetry_changed(("b", "tcp", 2), {"wb_mode": "Manual"})
+        self.assertEqual(controller.snapshot()["telemetry"], {"wb_mode": "Auto"})
+        controller.telemetry_changed(("a", "tcp", 1), {"wb_mode": "Manual"})
+        self.assertEqual(controller.snapshot()["telemetry"], {"wb_mode": "Manual"})
+        self.assertEqual(service.focused, [("a", "tcp", 1)])
+        controller.close()
+
     def test_telemetry_switch_does_not_commit_stale_poll(self):
         controller = StreamDeckController(queue.Queue())
         controller.set_telemetry_camera(("a", "tcp", 1))
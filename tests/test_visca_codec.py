@@ -0,0 +1,34 @@
+import unittest
+
+from visca_codec import ViscaCodec
+from visca_inquiry import INQUIRIES
+
+
+class ViscaCodecTests(unittest.TestCase):
+    def test_packets_match_the_visca_commands(self):
+        codec = ViscaCodec()
+        self.assertEqual(bytes(codec.move(5, 7, 0x01, 0x02)), bytes.fromhex("81 01 06 01 05 07 01 02 ff"))
+        self.assertEqual(bytes(codec.stop()), bytes.fromhex("81 01 06 01 00 00 03 03 ff"))
+        self.assertEqual(bytes(codec.zoom(1, 3)), bytes.fromhex("81 01 04 07 23 ff"))
+        self.assertEqual(bytes(codec.zoom(-1, 7)), bytes.fromhex("81 01 04 07 37 ff"))
+        self.assertEqual(bytes(codec.zoom(0, 5)), bytes.fromhex("81 01 04 07 00 ff"))
+        self.assertEqual([bytes(codec.focus(d))[4] for d in (1, -1, 0)], [0x02, 0x03, 0x00])
+        self.assertEqual(bytes(codec.autofocus()), bytes.fromhex("81 01 04 18 01 ff"))
+        self.assertEqual(bytes(codec.preset_set(12)), bytes.fromhex("81 01 04 3f 01 0c ff"))
+        self.assertEqual(bytes(codec.preset_recall(99)), bytes.fromhex("81 01 04 3f 02 63 ff"))
+        self.assertEqual(bytes(codec.inquiry("power")), INQUIRIES["power"].packet)
+        with self.assertRaises(ValueError):
+            codec.preset_recall(0)
+
+    def test_templates_are_patched_in_place_per_address(self):
+        codec = ViscaCodec(address=3)
+        first = codec.move(1, 1, 0x01, 0x03)
+        self.assertIs(codec.move(9, 9, 0x02, 0x02), first)
+        self.assertEqual(bytes(first), bytes.fromhex("83 01 06 01 09 09 02 02 ff"))
+        self.assertIs(codec.zoom(1, 2), codec.zoom(-1, 2))
+        self.assertEqual(bytes(codec.inquiry("wb_mode"))[0], 0x83)
+        self.assertIs(codec.inquiry("wb_mode"), codec.inquiry("wb_mode"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from visca_inquiry import (
+    INQUIRIES,
+    Inquiry,
+    decode,
+    frame_spans,
+    is_ack,
+    iter_frames,
+    pack_nibbles,
+    register,
+)
+
+
+class ViscaInquiryTests(unittest.TestCase):
+    def test_nibble_fold_matches_per_byte_decode(self):
+        for payload in (b"\x0a", b"\x01\x02", b"\x0a\x0b\x0c\x0d", bytes(range(8)), b"\x0f" * 8):
+            expected = 0
+            for byte in payload:
+                expected = (expected << 4) | byte
+            self.assertEqual(pack_nibbles(payload), expected)
+        with self.assertRaises(ValueError):
+            pack_nibbles(bytes(9))
+
+    def test_registered_replies_decode(self):
+        self.assertEqual(decode("zoom_position", bytes.fromhex("90 50 04 00 00 00 ff")), 0x4000)
+        self.assertEqual(decode("power", bytes.fromhex("90 50 02 ff")), "On")
+        self.assertEqual(decode("focus_mode", bytes.fromhex("90 50 03 ff")), "Manual")
+        self.assertEqual(decode("iris", bytes.fromhex("90 50 00 00 01 0a ff")), 0x1A)
+        self.assertEqual(decode("preset", bytes.fromhex("90 50 07 ff")), 7)
+        self.assertEqual(
+            decode("pan_tilt_position", bytes.fromhex("90 50 0f 0f 0e 0c 00 01 02 03 ff")),
+            {"pan": -20, "tilt": 0x0123},
+        )
+
+    def test_error_and_short_replies_are_ignored(self):
+        self.assertIsNone(decode("zoom_position", bytes.fromhex("90 60 02 ff")))
+        self.assertIsNone(decode("zoom_position", bytes.fromhex("90 50 04 00 ff")))
+        self.assertIsNone(decode("power", None))
+
+    def test_registry_is_extensible_and_addressable(self):
+        inquiry = register(Inquiry("test_bright", b"\x81\x09\x04\x4d\xff", 7, pack_nibbles))
+        try:
+            self.assertIs(INQUIRIES["test_bright"], inquiry)
+            self.assertEqual(inquiry.for_address(3)[0], 0x83)
+        finally:
+            INQUIRIES.pop("test_bright")
+
+    def test_frame_splitter_returns_views_without_copying(self):
+        buffer = bytearray(bytes.fromhex("90 41 ff 90 50 02 ff 90 50 00 01"))
+        spans, consumed = frame_spans(buffer)
+        self.assertEqual(spans, [(0, 3), (3, 7)])
+        self.assertEqual(consumed, 7)
+        frames = list(iter_frames(buffer))
+        self.assertTrue(is_ack(frames[0]))
+        self.assertIsInstance(frames[1], memoryview)
+        self.assertIs(frames[1].obj, buffer)
+        self.assertEqual(decode("power", frames[1]), "On")
+
+
+if __name__ == "__main__":
+    unittest.main()
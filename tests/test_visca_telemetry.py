@@ -0,0 +1,193 @@
+import asyncio
+import socket
+import struct
+import threading
+import time
+import unittest
+
+from visca_inquiry import INQUIRIES
+from visca_telemetry import TelemetryService, camera_key, open_link
+
+WB_INQUIRY = INQUIRIES["wb_mode"].packet
+WB_AUTO = bytes.fromhex("90 50 00 ff")
+AE_SAE = bytes.fromhex("90 50 0a ff")
+REPLIES = {
+    INQUIRIES["ae_mode"].packet: AE_SAE,
+    INQUIRIES["power"].packet: bytes.fromhex("90 50 02 ff"),
+    INQUIRIES["pan_tilt_position"].packet: bytes.fromhex("90 50 0f 0f 0f 0f 00 00 01 00 ff"),
+}
+NOT_SUPPORTED = bytes.fromhex("90 60 02 ff")
+EXPECTED = {"power": "On", "wb_mode": "Auto", "ae_mode": "SAE",
+            "pan_tilt_position": {"pan": -1, "tilt": 16}}
+
+
+class _PipelinedCamera:
+    """TCP camera that answers every inquiry in a burst on one connection."""
+
+    def __init__(self):
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        self.connections = 0
+        self.wb = WB_AUTO
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._answer, args=(connection,), daemon=True).start()
+
+    def _answer(self, connection):
+        buffer = b""
+        with connection:
+            while True:
+                try:
+                    data = connection.recv(64)
+                except OSError:
+                    return
+                if not data:
+                    return
+                buffer += data
+                while b"\xff" in buffer:
+                    packet, _, buffer = buffer.partition(b"\xff")
+                    packet += b"\xff"
+                    reply = self.wb if packet == WB_INQUIRY else REPLIES.get(packet, NOT_SUPPORTED)
+                    connection.sendall(reply)
+
+    def close(self):
+        self.server.close()
+
+
+class TelemetryLinkTests(unittest.TestCase):
+    def test_tcp_link_pipelines_inquiries_on_one_connection(self):
+        camera = _PipelinedCamera()
+        service = TelemetryService()
+
+        async def poll_twice():
+            link = open_link(("127.0.0.1", "tcp", camera.port), timeout=1.0)
+            try:
+                return [await service.poll_once(link), await service.poll_once(link)]
+            finally:
+                link.close()
+
+        try:
+            first, second = asyncio.run(poll_twice())
+        finally:
+            camera.close()
+        self.assertEqual(first, EXPECTED)
+        self.assertEqual(second, first)
+        self.assertEqual(camera.connections, 1)
+
+    def test_udp_link_matches_visca_over_ip_sequence(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(2)
+        sequences = []
+
+        def reply():
+            for _ in range(2):
+                data, address = server.recvfrom(64)
+                kind, length, sequence = struct.unpack_from(">HHI", data)
+                sequences.append(sequence)
+                payload = WB_AUTO if data[8:] == WB_INQUIRY else AE_SAE
+                stale = struct.pack(">HHI", 0x0111, len(payload), sequence - 1) + bytes.fromhex("90 50 05 ff")
+                server.sendto(stale, address)
+                server.sendto(struct.pack(">HHI", 0x0111, len(payload), sequence) + payload, address)
+
+        threading.Thread(target=reply, daemon=True).start()
+        service = TelemetryService(inquiries=("wb_mode", "ae_mode"))
+
+        async def poll():
+            link = open_link(("127.0.0.1", "udp", server.getsockname()[1]), timeout=1.0)
+            link.framed = True
+            try:
+                return await service.poll_once(link)
+            finally:
+                link.close()
+
+        try:
+            values = asyncio.run(poll())
+        finally:
+            server.close()
+        self.assertEqual(values, {"wb_mode": "Auto", "ae_mode": "SAE"})
+        self.assertEqual(sequences, [1, 2])
+
+
+class TelemetryServiceTests(unittest.TestCase):
+    def test_service_polls_cameras_concurrently_and_backs_off(self):
+        cameras = [_PipelinedCamera(), _PipelinedCamera()]
+        changes = []
+        service = TelemetryService(min_interval=0.05, max_interval=0.2, focus_interval=0.05,
+                                   timeout=1.0, on_change=lambda camera, values: changes.append(camera))
+        configured = [("127.0.0.1", "tcp", camera.port) for camera in cameras]
+        try:
+            service.start(configured)
+            deadline = time.monotonic() + 3
+            while time.monotonic() < deadline and len(service.snapshot()) < 2:
+                time.sleep(0.02)
+            time.sleep(0.4)
+            snapshot = service.snapshot()
+            self.assertEqual(set(snapshot), {camera_key(camera) for camera in configured})
+            self.assertEqual(service.get(configured[0]), EXPECTED)
+            self.assertEqual(snapshot[camera_key(configured[1])]["interval"], 0.2)
+            self.assertEqual(sorted(changes), sorted(configured))
+            cameras[0].wb = bytes.fromhex("90 50 05 ff")
+            service.focus(configured[0])
+            deadline = time.monotonic() + 3
+            while time.monotonic() < deadline and service.get(configured[0]).get("wb_mode") != "Manual":
+                time.sleep(0.02)
+            self.assertEqual(service.get(configured[0])["wb_mode"], "Manual")
+            service.set_cameras(configured[1:])
+            time.sleep(0.1)
+            self.assertNotIn(camera_key(configured[0]), service.snapshot())
+        finally:
+            service.close()
+            for camera in cameras:
+                camera.close()
+
+    def test_paused_service_stops_polling_until_resumed(self):
+        camera = _PipelinedCamera()
+        configured = ("127.0.0.1", "tcp", camera.port)
+        service = TelemetryService(min_interval=0.05, max_interval=0.1, timeout=1.0)
+        try:
+            service.start([configured])
+            deadline = time.monotonic() + 3
+            while time.monotonic() < deadline and not service.get(configured):
+                time.sleep(0.02)
+            service.pause()
+            time.sleep(0.2)
+            camera.wb = bytes.fromhex("90 50 05 ff")
+            time.sleep(0.3)
+            self.assertEqual(service.get(configured)["wb_mode"], "Auto")
+            service.resume()
+            deadline = time.monotonic() + 1
+            while time.monotonic() < deadline and service.get(configured).get("wb_mode") != "Manual":
+                time.sleep(0.02)
+            self.assertEqual(service.get(configured)["wb_mode"], "Manual")
+        finally:
+            service.close()
+            camera.close()
+
+    def test_unreachable_camera_reports_error_without_values(self):
+        closed = socket.create_server(("127.0.0.1", 0))
+        port = closed.getsockname()[1]
+        closed.close()
+        service = TelemetryService(min_interval=0.05, max_interval=0.5, timeout=0.2)
+        try:
+            service.start([("127.0.0.1", "tcp", port)])
+            deadline = time.monotonic() + 2
+            while time.monotonic() < deadline and not service.snapshot():
+                time.sleep(0.02)
+            entry = service.snapshot()[camera_key(("127.0.0.1", "tcp", port))]
+        finally:
+            service.close()
+        self.assertEqual(entry["values"], {})
+        self.assertTrue(entry["error"])
+        self.assertEqual(entry["interval"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
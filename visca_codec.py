@@ -0,0 +1,88 @@
+"""Preallocated VISCA command packets.
+
+A :class:`ViscaCodec` holds one ``bytearray`` per command for a camera
+address.  Builders patch the speed, direction or preset bytes in place and
+return a ``memoryview`` of that buffer, so the control loop sends packets
+without allocating.  A returned view is only valid until the next call to
+the same builder: send it first, and give each thread its own codec.
+"""
+
+from visca_inquiry import INQUIRIES
+
+ZOOM_TELE = 0x20
+ZOOM_WIDE = 0x30
+
+
+def _template(*values):
+    packet = bytearray(values)
+    return packet, memoryview(packet)
+
+
+class ViscaCodec:
+    """Packet templates for the camera at VISCA ``address`` (1-7)."""
+
+    __slots__ = ("address", "_move", "_move_view", "_zoom", "_zoom_view", "_preset", "_preset_view",
+                 "_stop", "_focus", "_autofocus", "_inquiries")
+
+    def __init__(self, address: int = 1):
+        self.address = address
+        head = 0x80 | (address & 0x07)
+        self._move, self._move_view = _template(head, 0x01, 0x06, 0x01, 0x00, 0x00, 0x03, 0x03, 0xFF)
+        self._zoom, self._zoom_view = _template(head, 0x01, 0x04, 0x07, 0x00, 0xFF)
+        self._preset, self._preset_view = _template(head, 0x01, 0x04, 0x3F, 0x02, 0x01, 0xFF)
+        self._stop = _template(head, 0x01, 0x06, 0x01, 0x00, 0x00, 0x03, 0x03, 0xFF)[1]
+        self._focus = {
+            direction: _template(head, 0x01, 0x04, 0x08, value, 0xFF)[1]
+            for direction, value in ((1, 0x02), (-1, 0x03), (0, 0x00))
+        }
+        self._autofocus = _template(head, 0x01, 0x04, 0x18, 0x01, 0xFF)[1]
+        self._inquiries = {}
+
+    def move(self, pan_speed: int, tilt_speed: int, pan_dir: int, tilt_dir: int) -> memoryview:
+        """Pan/tilt drive; directions are 1/2 (left/up, right/down) or 3 (stop)."""
+        packet = self._move
+        packet[4] = pan_speed
+        packet[5] = tilt_speed
+        packet[6] = pan_dir
+        packet[7] = tilt_dir
+        return self._move_view
+
+    def stop(self) -> memoryview:
+        return self._stop
+
+    def zoom(self, direction: int, speed: int = 0) -> memoryview:
+        """Zoom tele (1), wide (-1) or stop (0) at speed 0-7."""
+        if direction > 0:
+            self._zoom[4] = ZOOM_TELE | (speed & 0x07)
+        elif direction < 0:
+            self._zoom[4] = ZOOM_WIDE | (speed & 0x07)
+        else:
+            self._zoom[4] = 0x00
+        return self._zoom_view
+
+    def focus(self, direction: int) -> memoryview:
+        """Focus far (1), near (-1) or stop (0)."""
+        return self._focus[1 if direction > 0 else -1 if direction < 0 else 0]
+
+    def autofocus(self) -> memoryview:
+        return self._autofocus
+
+    def preset_set(self, preset: int) -> memoryview:
+        return self._memory(0x01, preset)
+
+    def preset_recall(self, preset: int) -> memoryview:
+        return self._memory(0x02, preset)
+
+    def _memory(self, action, preset):
+        if not 1 <= int(preset) <= 99:
+            raise ValueError("preset must be between 1 and 99")
+        self._preset[4] = action
+        self._preset[5] = int(preset)
+        return self._preset_view
+
+    def inquiry(self, name: str) -> memoryview:
+        """Registered inquiry ``name`` addressed to this camera."""
+        view = self._inquiries.get(name)
+        if view is None:
+            view = self._inquiries[name] = memoryview(INQUIRIES[name].for_address(self.address))
+        return view
@@ -0,0 +1,129 @@
+"""Declarative VISCA inquiry registry and reply-frame helpers.
+
+Each :class:`Inquiry` names its packet, the exact length of a successful
+reply and a decoder that receives the reply's payload (the bytes between
+``90 50`` and ``FF``) as a memoryview.  Cameras answer unsupported
+inquiries with a 4-byte error frame, which :func:`decode` maps to None.
+"""
+from dataclasses import dataclass
+from typing import Callable
+
+WB_MODES = {0x00: "Auto", 0x01: "Indoor", 0x02: "Outdoor", 0x03: "OnePush", 0x05: "Manual", 0x20: "ColorTemp"}
+AE_MODES = {0x00: "Auto", 0x03: "Manual", 0x0A: "SAE", 0x0B: "AAE", 0x0D: "Bright"}
+POWER_STATES = {0x02: "On", 0x03: "Standby", 0x04: "Standby"}
+FOCUS_MODES = {0x02: "Auto", 0x03: "Manual"}
+
+# Each step folds pairs of lanes together: 0a 0b 0c 0d -> 0x00ab00cd -> 0xabcd.
+_NIBBLE_STEPS = (
+    (4, 0x00FF00FF00FF00FF),
+    (8, 0x0000FFFF0000FFFF),
+    (16, 0x00000000FFFFFFFF),
+)
+
+
+def pack_nibbles(payload) -> int:
+    """Collapse up to eight ``0n`` payload bytes into one integer, most significant first.
+
+    The bytes are read as a single integer and folded with shifts and masks
+    instead of a per-byte loop.
+    """
+    if len(payload) > 8:
+        raise ValueError("at most 8 nibble bytes fit one fold")
+    value = int.from_bytes(payload, "big") & 0x0F0F0F0F0F0F0F0F
+    for shift, mask in _NIBBLE_STEPS:
+        value = (value | (value >> shift)) & mask
+    return value
+
+
+def signed16(value: int) -> int:
+    return value - 0x10000 if value & 0x8000 else value
+
+
+def _lookup(table):
+    def decode(payload):
+        return table.get(payload[-1], f"{payload[-1]:02x}")
+    return decode
+
+
+def _pan_tilt(payload):
+    both = pack_nibbles(payload)
+    return {"pan": signed16(both >> 16), "tilt": signed16(both & 0xFFFF)}
+
+
+@dataclass(frozen=True)
+class Inquiry:
+    name: str
+    packet: bytes
+    reply_length: int
+    decoder: Callable
+
+    def for_address(self, address: int) -> bytes:
+        """Return the packet addressed to camera ``address`` (1-7)."""
+        return bytes((0x80 | (address & 0x07),)) + self.packet[1:]
+
+
+INQUIRIES = {}
+
+
+def register(inquiry: Inquiry) -> Inquiry:
+    INQUIRIES[inquiry.name] = inquiry
+    return inquiry
+
+
+for _inquiry in (
+    Inquiry("power", b"\x81\x09\x04\x00\xff", 4, _lookup(POWER_STATES)),
+    Inquiry("wb_mode", b"\x81\x09\x04\x35\xff", 4, _lookup(WB_MODES)),
+    Inquiry("ae_mode", b"\x81\x09\x04\x39\xff", 4, _lookup(AE_MODES)),
+    Inquiry("focus_mode", b"\x81\x09\x04\x38\xff", 4, _lookup(FOCUS_MODES)),
+    Inquiry("zoom_position", b"\x81\x09\x04\x47\xff", 7, pack_nibbles),
+    Inquiry("focus_position", b"\x81\x09\x04\x48\xff", 7, pack_nibbles),
+    Inquiry("shutter", b"\x81\x09\x04\x4a\xff", 7, pack_nibbles),
+    Inquiry("iris", b"\x81\x09\x04\x4b\xff", 7, pack_nibbles),
+    Inquiry("gain", b"\x81\x09\x04\x4c\xff", 7, pack_nibbles),
+    Inquiry("preset", b"\x81\x09\x04\x3f\xff", 4, lambda payload: payload[-1]),
+    Inquiry("pan_tilt_position", b"\x81\x09\x06\x12\xff", 11, _pan_tilt),
+):
+    register(_inquiry)
+
+
+def decode(name, frame):
+    """Decode a complete reply frame for inquiry ``name``; None when unusable."""
+    inquiry = INQUIRIES[name]
+    if (
+        frame is None
+        or len(frame) != inquiry.reply_length
+        or frame[0] & 0xF0 != 0x90
+        or frame[1] != 0x50
+        or frame[-1] != 0xFF
+    ):
+        return None
+    return inquiry.decoder(memoryview(frame)[2:-1])
+
+
+def frame_spans(buffer, start=0):
+    """Return ``([(begin, end), ...], consumed)`` for complete frames in ``buffer``.
+
+    Only offsets are computed, so callers can decode through a memoryview
+    and drop the consumed prefix once.
+    """
+    spans = []
+    find = buffer.find
+    end = find(b"\xff", start)
+    while end != -1:
+        spans.append((start, end + 1))
+        start = end + 1
+        end = find(b"\xff", start)
+    return spans, start
+
+
+def iter_frames(buffer):
+    """Yield each complete frame in ``buffer`` as a memoryview without copying."""
+    view = memoryview(buffer)
+    spans, _ = frame_spans(buffer)
+    for begin, end in spans:
+        yield view[begin:end]
+
+
+def is_ack(frame) -> bool:
+    """ACK and completion frames (``9y 4z FF`` / ``9y 5z FF``) carry no value."""
+    return len(frame) == 3 and frame[1] & 0xF0 in (0x40, 0x50)
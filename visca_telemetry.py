@@ -0,0 +1,306 @@
+"""Shared VISCA telemetry for every configured camera.
+
+One asyncio loop on a background thread polls all cameras concurrently.
+TCP cameras keep one connection open and receive each round's inquiries
+back to back; UDP cameras get one inquiry in flight at a time, matched by
+sequence number on Sony VISCA-over-IP (port 52381) and by source otherwise.
+Readers use :meth:`TelemetryService.get` and :meth:`TelemetryService.snapshot`
+instead of polling cameras themselves.
+"""
+import asyncio
+import logging
+import struct
+import threading
+import time
+
+from visca_inquiry import INQUIRIES, decode, frame_spans, is_ack
+
+VISCA_OVER_IP_PORT = 52381
+VISCA_IP_COMMAND = 0x0110
+VISCA_IP_REPLY = 0x0111
+DEFAULT_INQUIRIES = ("power", "wb_mode", "ae_mode", "focus_mode", "zoom_position", "pan_tilt_position")
+MIN_INTERVAL = 1.0
+MAX_INTERVAL = 10.0
+FOCUS_INTERVAL = 2.0
+REPLY_TIMEOUT = 0.3
+
+
+def camera_key(camera) -> str:
+    host, proto, port = camera[:3]
+    return f"{host}:{str(proto).lower()}:{int(port)}"
+
+
+class _TcpLink:
+    """One persistent TCP connection; inquiries are written back to back."""
+
+    def __init__(self, host, port, timeout):
+        self.host, self.port, self.timeout = host, port, timeout
+        self.reader = self.writer = None
+        self.buffer = bytearray()
+
+    async def exchange(self, names):
+        """Send every inquiry in one write and decode the replies in order."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+            self.buffer = bytearray()
+        self.writer.write(b"".join(INQUIRIES[name].packet for name in names))
+        await self.writer.drain()
+        values = []
+        while len(values) < len(names):
+            chunk = await asyncio.wait_for(self.reader.read(512), self.timeout)
+            if not chunk:
+                raise ConnectionResetError("camera closed telemetry connection")
+            self.buffer += chunk
+            spans, consumed = frame_spans(self.buffer)
+            with memoryview(self.buffer) as view:
+                for begin, end in spans:
+                    frame = view[begin:end]
+                    if not is_ack(frame) and len(values) < len(names):
+                        values.append(decode(names[len(values)], frame))
+                    frame.release()
+            del self.buffer[:consumed]
+        return values
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class _UdpLink(asyncio.DatagramProtocol):
+    """Single-socket UDP link with one inquiry in flight."""
+
+    def __init__(self, host, port, timeout):
+        self.host, self.port, self.timeout = host, port, timeout
+        self.framed = int(port) == VISCA_OVER_IP_PORT
+        self.transport = None
+        self.sequence = 0
+        self._waiting = None
+
+    def datagram_received(self, data, address):
+        waiting = self._waiting
+        if waiting is None or waiting.done():
+            return
+        if self.framed:
+            if len(data) < 8:
+                return
+            kind, length, sequence = struct.unpack_from(">HHI", data)
+            if kind != VISCA_IP_REPLY or sequence != self.sequence:
+                return
+            data = data[8:8 + length]
+        if data and not is_ack(data):
+            waiting.set_result(bytes(data))
+
+    async def exchange(self, names):
+        """Send inquiries one at a time; a missing reply decodes to None."""
+        loop = asyncio.get_running_loop()
+        if self.transport is None:
+            self.transport, _ = await loop.create_datagram_endpoint(
+                lambda: self, remote_addr=(self.host, self.port)
+            )
+        replies = []
+        for name in names:
+            packet = INQUIRIES[name].packet
+            self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+            self._waiting = loop.create_future()
+            if self.framed:
+                packet = struct.pack(">HHI", VISCA_IP_COMMAND, len(packet), self.sequence) + packet
+            self.transport.sendto(packet)
+            try:
+                replies.append(await asyncio.wait_for(self._waiting, self.timeout))
+            except asyncio.TimeoutError:
+                replies.append(None)
+        if not any(replies):
+            raise TimeoutError("no telemetry reply")
+        return [decode(name, reply) for name, reply in zip(names, replies)]
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+        self.transport = None
+
+
+def open_link(camera, timeout=REPLY_TIMEOUT):
+    host, proto, port = camera[:3]
+    link = _UdpLink if str(proto).lower() == "udp" else _TcpLink
+    return link(host, int(port), timeout)
+
+
+class TelemetryService:
+    """Poll all cameras concurrently and keep the latest values in one cache.
+
+    Each camera's interval drops back to ``min_interval`` whenever its
+    values change and doubles toward ``max_interval`` while they stay the
+    same; the camera passed to :meth:`focus` is never polled slower than
+    ``focus_interval``.  ``on_change(camera, values)`` runs on the telemetry
+    thread.
+    """
+
+    def __init__(self, inquiries=DEFAULT_INQUIRIES, min_interval=MIN_INTERVAL,
+                 max_interval=MAX_INTERVAL, focus_interval=FOCUS_INTERVAL,
+                 timeout=REPLY_TIMEOUT, on_change=None, clock=time.time):
+        self.inquiries = tuple(inquiries)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.focus_interval = focus_interval
+        self.timeout = timeout
+        self.on_change = on_change
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._focus = None
+        self._paused = False
+        self._loop = None
+        self._thread = None
+        self._tasks = {}
+        self._wake = {}
+        self._ready = threading.Event()
+
+    def start(self, cameras):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+            self._thread.start()
+            self._ready.wait(2)
+        self.set_cameras(cameras)
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def set_cameras(self, cameras):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._reconcile, [tuple(c[:3]) for c in cameras])
+
+    def _reconcile(self, cameras):
+        wanted = {camera_key(camera): camera for camera in cameras}
+        for key in list(self._tasks):
+            if key not in wanted:
+                self._tasks.pop(key).cancel()
+                self._wake.pop(key, None)
+                with self._lock:
+                    self._cache.pop(key, None)
+        for key, camera in wanted.items():
+            if key not in self._tasks:
+                self._wake[key] = asyncio.Event()
+                self._tasks[key] = self._loop.create_task(self._camera_loop(camera))
+
+    def focus(self, camera):
+        """Poll ``camera`` promptly and keep it on the faster focus interval."""
+        key = camera_key(camera) if camera else None
+        with self._lock:
+            self._focus = key
+        if self._loop is not None and key is not None:
+            self._loop.call_soon_threadsafe(self._poke, key)
+
+    def pause(self):
+        """Stop polling until :meth:`resume`; cached values are kept."""
+        with self._lock:
+            self._paused = True
+
+    def resume(self):
+        """Restart polling and refresh every camera promptly."""
+        with self._lock:
+            self._paused = False
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._poke_all)
+
+    def _poke(self, key):
+        event = self._wake.get(key)
+        if event is not None:
+            event.set()
+
+    def _poke_all(self):
+        for event in self._wake.values():
+            event.set()
+
+    def get(self, camera) -> dict:
+        with self._lock:
+            entry = self._cache.get(camera_key(camera))
+            return dict(entry["values"]) if entry else {}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {key: {**entry, "values": dict(entry["values"])} for key, entry in self._cache.items()}
+
+    async def poll_once(self, link):
+        decoded = await link.exchange(self.inquiries)
+        return {name: value for name, value in zip(self.inquiries, decoded) if value is not None}
+
+    async def _camera_loop(self, camera):
+        key = camera_key(camera)
+        link = open_link(camera, self.timeout)
+        interval = self.min_interval
+        previous = None
+        try:
+            while True:
+                with self._lock:
+                    paused = self._paused
+                if paused:
+                    wake = self._wake[key]
+                    await wake.wait()
+                    wake.clear()
+                    continue
+                started = time.perf_counter()
+                error = None
+                try:
+                    values = await self.poll_once(link)
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                        asyncio.LimitOverrunError) as exc:
+                    link.close()
+                    values, error = None, str(exc) or type(exc).__name__
+                rtt_ms = round((time.perf_counter() - started) * 1000, 1)
+                changed = values is not None and values != previous
+                if error:
+                    interval = self.max_interval
+                elif changed:
+                    interval = self.min_interval
+                else:
+                    interval = min(interval * 2, self.max_interval)
+                with self._lock:
+                    focused = self._focus == key
+                    entry = self._cache.setdefault(key, {"values": {}, "updated_at": None})
+                    if values is not None:
+                        entry["values"] = values
+                        entry["updated_at"] = self.clock()
+                    entry.update(error=error, interval=interval, rtt_ms=rtt_ms)
+                if changed:
+                    previous = values
+                    if self.on_change is not None:
+                        try:
+                            self.on_change(camera, dict(values))
+                        except Exception:
+                            logging.exception("telemetry listener failed")
+                wait = min(interval, self.focus_interval) if focused else interval
+                wake = self._wake[key]
+                try:
+                    await asyncio.wait_for(wake.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
+        finally:
+            link.close()
+
+    async def _shutdown(self):
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self):
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(2)
+        except Exception:
+            logging.info("telemetry tasks did not stop cleanly")
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=2)
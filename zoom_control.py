@@ -1,26 +1,32 @@
 """Protocol-aware zoom command scheduling.
 
 Both VISCA-over-TCP and UDP cameras receive one start packet per direction
-change; stop packets are repeated briefly to tolerate packet loss.
+change; stop packets are repeated briefly to tolerate packet loss.  The
+rules live in :mod:`axis_scheduler`; this module keeps the original zoom API.
 """
 
-from dataclasses import dataclass
+from axis_scheduler import AXES, AxisScheduler
 
 
-@dataclass
-class ZoomCommandState:
+class ZoomCommandState(AxisScheduler):
     """State carried between input-loop iterations."""
 
-    last_direction: int = 0
-    last_speed: int = -1
-    stop_retries_remaining: int = 0
+    __slots__ = ()
 
-    def reset(self) -> None:
-        """Forget command history, such as after switching cameras."""
+    def __init__(self):
+        super().__init__(AXES["zoom"])
 
-        self.last_direction = 0
-        self.last_speed = -1
-        self.stop_retries_remaining = 0
+    @property
+    def last_direction(self) -> int:
+        return self.direction
+
+    @property
+    def last_speed(self) -> int:
+        return self.speed
+
+    @property
+    def stop_retries_remaining(self) -> int:
+        return self.stop_remaining
 
 
 def next_zoom_command(
@@ -37,21 +43,4 @@ def next_zoom_command(
     """
 
     direction = 1 if requested_direction > 0 else -1 if requested_direction < 0 else 0
-    command = None
-
-    speed_changed = requested_speed is not None and requested_speed != state.last_speed
-    if direction != state.last_direction or (direction != 0 and speed_changed):
-        command = direction
-        state.last_direction = direction
-        if requested_speed is not None:
-            state.last_speed = requested_speed
-        if direction == 0:
-            state.stop_retries_remaining = max(0, stop_packets - 1)
-        else:
-            state.stop_retries_remaining = 0
-    elif direction == 0 and state.stop_retries_remaining > 0:
-        command = 0
-        state.stop_retries_remaining -= 1
-    if requested_speed is not None and direction == 0:
-        state.last_speed = requested_speed
-    return command
+    return state.next(direction, speed=requested_speed, stop_packets=stop_packets)